@@ -1,16 +1,93 @@
-import boto3
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
 from app.config.settings import settings
 
+T = TypeVar("T")
+
+# botocore defaults are a 60 s connect and read timeout, a pool of 10
+# connections and "legacy" retries (10 attempts for DynamoDB), so one stalled
+# or throttled call can hold a request for a long time. Both profiles fail
+# fast and make "standard" retries (jittered backoff, retry quota):
+#   lambda    -> one request per instance under a hard function timeout:
+#                short timeouts and few attempts, no keep-alive probes (they
+#                can't run while the instance is frozen; botocore retries a
+#                dropped connection).
+#   container -> long-running workers: more room per call and TCP keep-alive,
+#                so idle pooled connections are not silently dropped by NAT
+#                and load balancers.
+# "adaptive" retries (a client-side rate limiter) send fewer calls to a
+# throttled table but, per benchmarks/bench_dynamodb_client.py, about halve
+# throughput while it throttles; set DYNAMODB_RETRY_MODE=adaptive to prefer that.
+CLIENT_PROFILES: Dict[str, Dict[str, Any]] = {
+    "lambda": {
+        "connect_timeout": 1.0,
+        "read_timeout": 3.0,
+        "retry_mode": "standard",
+        "max_attempts": 3,
+        "tcp_keepalive": False,
+    },
+    "container": {
+        "connect_timeout": 2.0,
+        "read_timeout": 5.0,
+        "retry_mode": "standard",
+        "max_attempts": 5,
+        "tcp_keepalive": True,
+    },
+}
+
+
+def client_options(profile: str) -> Dict[str, Any]:
+    """The profile's values, with each DYNAMODB_* setting that is set taking precedence."""
+    options = dict(CLIENT_PROFILES[profile])
+    for name in options:
+        value = getattr(settings, f"dynamodb_{name}")
+        if value is not None:
+            options[name] = value
+    options["max_pool_connections"] = settings.dynamodb_max_concurrency
+    return options
+
+
+def client_config(options: Dict[str, Any]):
+    from botocore.config import Config
+
+    return Config(
+        connect_timeout=options["connect_timeout"],
+        read_timeout=options["read_timeout"],
+        retries={"mode": options["retry_mode"], "total_max_attempts": options["max_attempts"]},
+        tcp_keepalive=options["tcp_keepalive"],
+        max_pool_connections=options["max_pool_connections"],
+    )
+
 
 class DynamoDBClient:
     """Singleton DynamoDB client.
 
     local  -> explicit endpoint_url + dummy credentials (Docker local DynamoDB)
     cloud  -> default boto3 credential chain (Lambda IAM role / AWS CLI profile)
+    memory -> in-process stand-in with simulated latency (app/config/memory_dynamodb.py)
+
+    boto3 has no asyncio transport, so async callers go through `run()`, which
+    executes the blocking call on a bounded thread pool. The pool is sized to
+    match botocore's HTTP connection pool so every in-flight call owns a
+    keep-alive connection instead of queuing for one. Timeouts, retries and
+    TCP keep-alive come from the client profile (CLIENT_PROFILES).
+
+    boto3 is imported and the resource built on first use, not at import time,
+    so Lambda cold starts and DynamoDB-free routes don't pay for it. First use
+    can come from several pool threads at once, so the resource and the pool
+    are built under a lock, and from a session of their own (boto3's default
+    session is not thread-safe).
     """
 
     _instance = None
     _resource = None
+    _executor = None
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -20,23 +97,57 @@ class DynamoDBClient:
     @property
     def resource(self):
         if self._resource is None:
-            if settings.is_cloud:
-                self._resource = boto3.resource(
-                    "dynamodb",
-                    region_name=settings.aws_default_region,
-                )
-            else:
-                self._resource = boto3.resource(
-                    "dynamodb",
-                    endpoint_url=settings.dynamodb_endpoint,
-                    region_name=settings.aws_default_region,
-                    aws_access_key_id=settings.aws_access_key_id,
-                    aws_secret_access_key=settings.aws_secret_access_key,
-                )
+            with self._init_lock:
+                if self._resource is None:
+                    self._resource = self._build_resource()
         return self._resource
 
+    @staticmethod
+    def _build_resource():
+        if settings.deploy_env == "memory":
+            from app.config.memory_dynamodb import MemoryDynamoDB
+
+            return MemoryDynamoDB(latency_ms=settings.memory_db_latency_ms)
+
+        import boto3
+
+        session = boto3.session.Session()
+        config = client_config(client_options(settings.dynamodb_profile))
+        if settings.is_cloud:
+            return session.resource(
+                "dynamodb",
+                region_name=settings.aws_default_region,
+                config=config,
+            )
+        return session.resource(
+            "dynamodb",
+            endpoint_url=settings.dynamodb_endpoint,
+            region_name=settings.aws_default_region,
+            aws_access_key_id=settings.aws_access_key_id,
+            aws_secret_access_key=settings.aws_secret_access_key,
+            config=config,
+        )
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._init_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=settings.dynamodb_max_concurrency,
+                        thread_name_prefix="dynamodb",
+                    )
+        return self._executor
+
     def get_table(self, table_name: str):
         return self.resource.Table(table_name)
 
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking DynamoDB call off the event loop and await its result."""
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self.executor, call)
+
 
 db_client = DynamoDBClient()
@@ -0,0 +1,61 @@
+"""
+Worker lifecycle (FastAPI lifespan). It runs in uvicorn and in each worker
+started by scripts/serve.py. It does not run on Lambda, where Mangum is
+created with lifespan="off".
+
+Startup:
+  - Join the cross-worker invalidation bus and subscribe the cached
+    services to it (app/utils/invalidation.py).
+  - Pre-warm: run the hot reads concurrently on the DynamoDB pool. This
+    opens pooled connections and fills the experience/project caches and
+    the search index before the first request (building and storing the
+    index if none is stored yet, so no search request ever scans
+    BlogPosts). Failures are logged and do not stop the worker.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from app.config.database import db_client
+from app.config.settings import settings
+from app.services.blog_service import blog_service
+from app.services.experience_service import experience_service
+from app.services.project_service import project_service
+from app.services.tag_service import tag_service
+from app.utils.invalidation import invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+CACHED_SERVICES = (experience_service, project_service)
+
+
+async def prewarm() -> None:
+    loaders = {
+        "experiences": experience_service.get_ordered,
+        "projects": project_service.get_ordered,
+        "blog": blog_service.get_published_posts,
+        "tags": tag_service.get_counts,
+        "search": blog_service.warm_search_index,
+    }
+    started = time.perf_counter()
+    results = await asyncio.gather(*(db_client.run(load) for load in loaders.values()), return_exceptions=True)
+    for name, result in zip(loaders, results):
+        if isinstance(result, Exception):
+            logger.warning("Pre-warm of %s failed: %r", name, result)
+    logger.info("Pre-warmed in %.0f ms", (time.perf_counter() - started) * 1000)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    for service in CACHED_SERVICES:
+        invalidation_bus.subscribe(service.table_name, functools.partial(service.invalidate_cache, broadcast=False))
+    invalidation_bus.start()
+    if settings.prewarm_enabled:
+        await prewarm()
+    try:
+        yield
+    finally:
+        invalidation_bus.stop()
@@ -0,0 +1,1237 @@
+"""
+In-memory stand-in for the boto3 DynamoDB resource (DEPLOY_ENV=memory).
+
+Covers the subset of the API this codebase uses, with DynamoDB semantics where
+they matter for correctness and performance:
+
+  resource  -> Table(), create_table(), tables.all(), batch_get_item(),
+               batch_write_item(), meta.client (low-level wire format for
+               batch_get_item / batch_write_item / transact_write_items /
+               describe_table)
+  Table     -> get_item, put_item, update_item, delete_item, scan, query,
+               load/reload, wait_until_exists, update (GSI creation),
+               global_secondary_indexes, key_schema, item_count
+
+Expressions (condition, filter, key condition, update, projection) are parsed
+from their string form; boto3 `Key`/`Attr` condition objects are rendered to
+strings with boto3's own builder first. Items are normalized through boto3's
+TypeSerializer on write, so floats are rejected and ints come back as Decimal,
+exactly as with the real resource. GSIs honour their projection, `Limit` is
+applied before `FilterExpression`, and query/scan pages by key with
+`LastEvaluatedKey`. Errors are raised as botocore `ClientError` with the real
+error codes.
+
+Each call sleeps for a simulated network round trip (median `latency_ms`,
+log-normal tail) outside the store lock, so concurrency behaves like a remote
+service. Data lives for the life of the process.
+"""
+
+import bisect
+import copy
+import functools
+import math
+import random
+import re
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from boto3.dynamodb.types import Binary, TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+_MISSING = object()
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _error(code: str, message: str, operation: str, **extra: Any) -> ClientError:
+    response = {
+        "Error": {"Code": code, "Message": message},
+        "ResponseMetadata": {"HTTPStatusCode": 400},
+        **extra,
+    }
+    return ClientError(response, operation)
+
+
+def _validation(message: str, operation: str) -> ClientError:
+    return _error("ValidationException", message, operation)
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip through the wire format: validates types (floats raise
+    TypeError, as in boto3), converts ints to Decimal and copies."""
+    return _deserializer.deserialize(_serializer.serialize(value))
+
+
+def _normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _normalize(v) for k, v in item.items()}
+
+
+def _to_wire(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def _from_wire(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+# ── Capacity accounting (ReturnConsumedCapacity) ────────────────
+
+def _value_size(value: Any) -> int:
+    """Approximate DynamoDB attribute size in bytes."""
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, Binary):
+        return len(value.value)
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, Decimal):
+        return len(value.as_tuple().digits) // 2 + 2
+    if isinstance(value, (set, list)):
+        return 3 + sum(_value_size(v) + 1 for v in value)
+    if isinstance(value, dict):
+        return 3 + sum(len(k.encode()) + _value_size(v) + 1 for k, v in value.items())
+    return 0
+
+
+def _item_size(item: Optional[Dict[str, Any]]) -> int:
+    return sum(len(k.encode()) + _value_size(v) for k, v in item.items()) if item else 0
+
+
+def _read_units(size: int, consistent: bool = False) -> float:
+    return math.ceil(max(size, 1) / 4096) * (1.0 if consistent else 0.5)
+
+
+def _write_units(size: int) -> float:
+    return float(math.ceil(max(size, 1) / 1024))
+
+
+def _capacity(params: Dict[str, Any], table_name: str, units: float) -> Dict[str, Any]:
+    if params.get("ReturnConsumedCapacity") in ("TOTAL", "INDEXES"):
+        return {"ConsumedCapacity": {"TableName": table_name, "CapacityUnits": units}}
+    return {}
+
+
+# ── Expression parsing ──────────────────────────────────────────
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:(?P<num>\d+)|(?P<name>#[A-Za-z0-9_]+)|(?P<value>:[A-Za-z0-9_]+)"
+    r"|(?P<ident>[A-Za-z_][A-Za-z0-9_]*)|(?P<op><>|<=|>=|[=<>(),.\[\]+\-]))"
+)
+_KEYWORDS = {"AND", "OR", "NOT", "BETWEEN", "IN", "SET", "REMOVE", "ADD", "DELETE"}
+_FUNCTIONS = {"attribute_exists", "attribute_not_exists", "attribute_type", "begins_with", "contains", "size"}
+_COMPARATORS = {"=", "<>", "<", "<=", ">", ">="}
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens, pos = [], 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        match = _TOKEN_RE.match(expression, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Invalid expression near: {expression[pos:]!r}")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "ident" and text.upper() in _KEYWORDS:
+            kind, text = "kw", text.upper()
+        tokens.append((kind, text))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser producing tuple ASTs.
+
+    condition := or ; or := and (OR and)* ; and := not (AND not)*
+    not := NOT not | '(' condition ')' | function | operand comparison
+    operand := path | :value | size(path)
+    """
+
+    def __init__(self, expression: str):
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, str]:
+        idx = self.pos + offset
+        return self.tokens[idx] if idx < len(self.tokens) else ("eof", "")
+
+    def take(self, text: Optional[str] = None) -> Tuple[str, str]:
+        token = self.peek()
+        if text is not None and token[1] != text:
+            raise ValueError(f"Expected {text!r}, got {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def at(self, text: str) -> bool:
+        return self.peek()[1] == text
+
+    def done(self) -> None:
+        if self.peek()[0] != "eof":
+            raise ValueError(f"Unexpected token {self.peek()[1]!r}")
+
+    # paths / operands
+    def path(self) -> tuple:
+        kind, text = self.take()
+        if kind not in ("name", "ident"):
+            raise ValueError(f"Expected attribute path, got {text!r}")
+        parts: List[Any] = [text]
+        while True:
+            if self.at("."):
+                self.take()
+                kind, text = self.take()
+                if kind not in ("name", "ident"):
+                    raise ValueError(f"Expected attribute name, got {text!r}")
+                parts.append(text)
+            elif self.at("["):
+                self.take()
+                kind, text = self.take()
+                if kind != "num":
+                    raise ValueError("List index must be a number")
+                parts.append(int(text))
+                self.take("]")
+            else:
+                return ("path", tuple(parts))
+
+    def operand(self) -> tuple:
+        kind, text = self.peek()
+        if kind == "value":
+            self.take()
+            return ("value", text)
+        if kind == "ident" and text == "size" and self.peek(1)[1] == "(":
+            self.take()
+            self.take("(")
+            path = self.path()
+            self.take(")")
+            return ("size", path)
+        return self.path()
+
+    # conditions
+    def condition(self) -> tuple:
+        node = self.conjunction()
+        while self.at("OR"):
+            self.take()
+            node = ("or", node, self.conjunction())
+        return node
+
+    def conjunction(self) -> tuple:
+        node = self.negation()
+        while self.at("AND"):
+            self.take()
+            node = ("and", node, self.negation())
+        return node
+
+    def negation(self) -> tuple:
+        if self.at("NOT"):
+            self.take()
+            return ("not", self.negation())
+        if self.at("("):
+            self.take()
+            node = self.condition()
+            self.take(")")
+            return node
+        kind, text = self.peek()
+        if kind == "ident" and text in _FUNCTIONS and text != "size" and self.peek(1)[1] == "(":
+            self.take()
+            self.take("(")
+            args = [self.operand()]
+            while self.at(","):
+                self.take()
+                args.append(self.operand())
+            self.take(")")
+            return ("func", text, tuple(args))
+        left = self.operand()
+        kind, text = self.peek()
+        if text in _COMPARATORS:
+            self.take()
+            return ("cmp", text, left, self.operand())
+        if text == "BETWEEN":
+            self.take()
+            low = self.operand()
+            self.take("AND")
+            return ("between", left, low, self.operand())
+        if text == "IN":
+            self.take()
+            self.take("(")
+            options = [self.operand()]
+            while self.at(","):
+                self.take()
+                options.append(self.operand())
+            self.take(")")
+            return ("in", left, tuple(options))
+        raise ValueError(f"Expected a comparison after operand, got {text!r}")
+
+    # update expressions
+    def update(self) -> List[tuple]:
+        actions: List[tuple] = []
+        seen = set()
+        while self.peek()[0] != "eof":
+            kind, clause = self.take()
+            if kind != "kw" or clause not in ("SET", "REMOVE", "ADD", "DELETE") or clause in seen:
+                raise ValueError(f"Invalid update clause {clause!r}")
+            seen.add(clause)
+            while True:
+                path = self.path()
+                if clause == "SET":
+                    self.take("=")
+                    actions.append(("set", path, self.set_value()))
+                elif clause == "REMOVE":
+                    actions.append(("remove", path))
+                else:
+                    actions.append((clause.lower(), path, self.operand()))
+                if not self.at(","):
+                    break
+                self.take()
+        return actions
+
+    def set_value(self) -> tuple:
+        node = self.set_term()
+        if self.at("+") or self.at("-"):
+            op = "plus" if self.take()[1] == "+" else "minus"
+            node = (op, node, self.set_term())
+        return node
+
+    def set_term(self) -> tuple:
+        kind, text = self.peek()
+        if kind == "ident" and text in ("if_not_exists", "list_append") and self.peek(1)[1] == "(":
+            self.take()
+            self.take("(")
+            first = self.path() if text == "if_not_exists" else self.set_value()
+            self.take(",")
+            second = self.set_value()
+            self.take(")")
+            return (text, first, second)
+        return self.operand()
+
+    def projection(self) -> List[tuple]:
+        paths = [self.path()]
+        while self.at(","):
+            self.take()
+            paths.append(self.path())
+        return paths
+
+
+@functools.lru_cache(maxsize=512)
+def _parse(expression: str, kind: str):
+    parser = _Parser(expression)
+    node = {"condition": parser.condition, "update": parser.update, "projection": parser.projection}[kind]()
+    parser.done()
+    return node
+
+
+# ── Expression evaluation ───────────────────────────────────────
+
+class _Context:
+    def __init__(self, names: Optional[Dict[str, str]], values: Optional[Dict[str, Any]]):
+        self.names = names or {}
+        self.values = {k: _normalize(v) for k, v in (values or {}).items()}
+
+    def name(self, part: Any) -> Any:
+        if isinstance(part, str) and part.startswith("#"):
+            if part not in self.names:
+                raise ValueError(f"Undefined attribute name placeholder {part}")
+            return self.names[part]
+        return part
+
+    def parts(self, path: tuple) -> List[Any]:
+        return [self.name(p) for p in path[1]]
+
+    def resolve(self, item: Dict[str, Any], path: tuple) -> Any:
+        current: Any = item
+        for part in self.parts(path):
+            if isinstance(part, int):
+                if not isinstance(current, list) or part >= len(current):
+                    return _MISSING
+            elif not isinstance(current, dict) or part not in current:
+                return _MISSING
+            current = current[part]
+        return current
+
+    def operand(self, item: Dict[str, Any], node: tuple) -> Any:
+        if node[0] == "value":
+            if node[1] not in self.values:
+                raise ValueError(f"Undefined attribute value placeholder {node[1]}")
+            return self.values[node[1]]
+        if node[0] == "size":
+            value = self.resolve(item, node[1])
+            if value is _MISSING or not hasattr(value, "__len__"):
+                return _MISSING
+            return Decimal(len(value.value if isinstance(value, Binary) else value))
+        return self.resolve(item, node)
+
+
+def _type_code(value: Any) -> str:
+    return next(iter(_serializer.serialize(value)))
+
+
+def _comparable(a: Any, b: Any) -> bool:
+    if isinstance(a, Decimal) and isinstance(b, Decimal):
+        return True
+    return type(a) is type(b) and isinstance(a, (str, bytes, Binary))
+
+
+def _compare(op: str, a: Any, b: Any) -> bool:
+    if a is _MISSING or b is _MISSING:
+        return op == "<>" and not (a is _MISSING and b is _MISSING)
+    if op == "=":
+        return a == b
+    if op == "<>":
+        return a != b
+    if not _comparable(a, b):
+        return False
+    if isinstance(a, Binary):
+        a, b = a.value, b.value
+    return {"<": a < b, "<=": a <= b, ">": a > b, ">=": a >= b}[op]
+
+
+def _evaluate(node: tuple, item: Dict[str, Any], ctx: _Context) -> bool:
+    kind = node[0]
+    if kind == "and":
+        return _evaluate(node[1], item, ctx) and _evaluate(node[2], item, ctx)
+    if kind == "or":
+        return _evaluate(node[1], item, ctx) or _evaluate(node[2], item, ctx)
+    if kind == "not":
+        return not _evaluate(node[1], item, ctx)
+    if kind == "cmp":
+        return _compare(node[1], ctx.operand(item, node[2]), ctx.operand(item, node[3]))
+    if kind == "between":
+        value = ctx.operand(item, node[1])
+        return _compare(">=", value, ctx.operand(item, node[2])) and _compare("<=", value, ctx.operand(item, node[3]))
+    if kind == "in":
+        value = ctx.operand(item, node[1])
+        return value is not _MISSING and any(value == ctx.operand(item, o) for o in node[2])
+    # functions
+    name, args = node[1], node[2]
+    value = ctx.operand(item, args[0])
+    if name == "attribute_exists":
+        return value is not _MISSING
+    if name == "attribute_not_exists":
+        return value is _MISSING
+    if value is _MISSING:
+        return False
+    arg = ctx.operand(item, args[1])
+    if name == "attribute_type":
+        return _type_code(value) == arg
+    if name == "begins_with":
+        if isinstance(value, str) and isinstance(arg, str):
+            return value.startswith(arg)
+        if isinstance(value, Binary) and isinstance(arg, Binary):
+            return value.value.startswith(arg.value)
+        return False
+    if name == "contains":
+        if isinstance(value, str):
+            return isinstance(arg, str) and arg in value
+        if isinstance(value, (set, list)):
+            return arg in value
+        return False
+    raise ValueError(f"Unsupported function {name}")
+
+
+def _condition(expression: Any, names, values, operation: str, is_key: bool = False):
+    """Return (ast, ctx). Accepts a string or a boto3 condition object."""
+    if not isinstance(expression, str):
+        from boto3.dynamodb.conditions import ConditionExpressionBuilder
+
+        built = ConditionExpressionBuilder().build_expression(expression, is_key_condition=is_key)
+        expression = built.condition_expression
+        names = {**(names or {}), **built.attribute_name_placeholders}
+        values = {**(values or {}), **built.attribute_value_placeholders}
+    try:
+        return _parse(expression, "condition"), _Context(names, values)
+    except ValueError as e:
+        raise _validation(f"Invalid expression: {e}", operation)
+
+
+def _set_path(item: Dict[str, Any], parts: List[Any], value: Any) -> None:
+    parent = item
+    for part in parts[:-1]:
+        parent = parent[part] if isinstance(parent, (dict, list)) else None
+        if parent is None:
+            raise KeyError(part)
+    last = parts[-1]
+    if isinstance(last, int):
+        if not isinstance(parent, list):
+            raise KeyError(last)
+        if last >= len(parent):
+            parent.append(value)
+        else:
+            parent[last] = value
+    else:
+        if not isinstance(parent, dict):
+            raise KeyError(last)
+        parent[last] = value
+
+
+def _remove_path(item: Dict[str, Any], parts: List[Any]) -> None:
+    parent: Any = item
+    for part in parts[:-1]:
+        try:
+            parent = parent[part]
+        except (KeyError, IndexError, TypeError):
+            return
+    last = parts[-1]
+    if isinstance(parent, dict):
+        parent.pop(last, None)
+    elif isinstance(parent, list) and isinstance(last, int) and last < len(parent):
+        del parent[last]
+
+
+def _set_value(node: tuple, item: Dict[str, Any], ctx: _Context) -> Any:
+    kind = node[0]
+    if kind in ("plus", "minus"):
+        a, b = _set_value(node[1], item, ctx), _set_value(node[2], item, ctx)
+        if not (isinstance(a, Decimal) and isinstance(b, Decimal)):
+            raise ValueError("Arithmetic operands must be numbers")
+        return a + b if kind == "plus" else a - b
+    if kind == "if_not_exists":
+        existing = ctx.resolve(item, node[1])
+        return existing if existing is not _MISSING else _set_value(node[2], item, ctx)
+    if kind == "list_append":
+        a, b = _set_value(node[1], item, ctx), _set_value(node[2], item, ctx)
+        if not (isinstance(a, list) and isinstance(b, list)):
+            raise ValueError("list_append operands must be lists")
+        return a + b
+    value = ctx.operand(item, node)
+    if value is _MISSING:
+        raise ValueError("The provided expression refers to an attribute that does not exist in the item")
+    return value
+
+
+def _apply_update(old: Dict[str, Any], actions: List[tuple], ctx: _Context, key_attrs: Iterable[str]) -> Tuple[Dict[str, Any], set]:
+    """Evaluate every action against the old item, then apply. Returns the
+    new item and the set of top-level attributes touched."""
+    new = copy.deepcopy(old)
+    pending = []
+    touched = set()
+    for action in actions:
+        parts = ctx.parts(action[1])
+        if parts[0] in key_attrs:
+            raise ValueError(f"Cannot update attribute {parts[0]}. This attribute is part of the key")
+        touched.add(parts[0])
+        if action[0] == "set":
+            pending.append(("set", parts, _set_value(action[2], old, ctx)))
+        elif action[0] == "remove":
+            pending.append(("remove", parts, None))
+        else:
+            if len(parts) != 1:
+                raise ValueError(f"{action[0].upper()} only supports top-level attributes")
+            operand = ctx.operand(old, action[2])
+            current = old.get(parts[0], _MISSING)
+            if action[0] == "add":
+                if isinstance(operand, Decimal) and (current is _MISSING or isinstance(current, Decimal)):
+                    value = operand + (current if current is not _MISSING else 0)
+                elif isinstance(operand, set) and (current is _MISSING or isinstance(current, set)):
+                    value = operand | (current if current is not _MISSING else set())
+                else:
+                    raise ValueError("ADD requires a number or set operand matching the attribute type")
+                pending.append(("set", parts, value))
+            else:
+                if not isinstance(operand, set) or (current is not _MISSING and not isinstance(current, set)):
+                    raise ValueError("DELETE requires a set operand")
+                if current is _MISSING:
+                    continue
+                remaining = current - operand
+                pending.append(("set", parts, remaining) if remaining else ("remove", parts, None))
+    for op, parts, value in pending:
+        if op == "remove":
+            _remove_path(new, parts)
+            continue
+        try:
+            _set_path(new, parts, value)
+        except KeyError:
+            raise ValueError("The document path provided in the update expression is invalid for update")
+    return new, touched
+
+
+def _project(item: Dict[str, Any], expression: Optional[str], names, operation: str) -> Dict[str, Any]:
+    if not expression:
+        return copy.deepcopy(item)
+    try:
+        paths = _parse(expression, "projection")
+    except ValueError as e:
+        raise _validation(f"Invalid ProjectionExpression: {e}", operation)
+    ctx = _Context(names, None)
+    out: Dict[str, Any] = {}
+    for path in paths:
+        parts = ctx.parts(path)
+        value = ctx.resolve(item, path)
+        if value is _MISSING:
+            continue
+        target = out
+        for part, nxt in zip(parts, parts[1:]):
+            if isinstance(target, list):
+                target.append([] if isinstance(nxt, int) else {})
+                target = target[-1]
+            else:
+                target = target.setdefault(part, [] if isinstance(nxt, int) else {})
+        if isinstance(target, list):
+            target.append(copy.deepcopy(value))
+        else:
+            target[parts[-1]] = copy.deepcopy(value)
+    return out
+
+
+def _top_level_names(expression: Optional[str], names) -> set:
+    if not expression:
+        return set()
+    ctx = _Context(names, None)
+    return {ctx.parts(p)[0] for p in _parse(expression, "projection")}
+
+
+# ── Storage ─────────────────────────────────────────────────────
+
+_RANGE_MAX = "\U0010ffff"
+
+
+class _Index:
+    """Partitioned, sorted view of a table: hash value -> sorted entries of
+    (range value, primary key). Items missing the index keys are absent
+    (sparse index)."""
+
+    def __init__(self, name: Optional[str], key_schema: List[Dict[str, str]], projection: Optional[Dict[str, Any]]):
+        self.name = name
+        self.key_schema = key_schema
+        self.hash_key = next(k["AttributeName"] for k in key_schema if k["KeyType"] == "HASH")
+        self.range_key = next((k["AttributeName"] for k in key_schema if k["KeyType"] == "RANGE"), None)
+        self.projection = projection or {"ProjectionType": "ALL"}
+        self.partitions: Dict[Any, List[Tuple[Any, tuple]]] = {}
+
+    def entry(self, item: Dict[str, Any], pk: tuple) -> Optional[Tuple[Any, tuple]]:
+        if self.hash_key not in item:
+            return None
+        if self.range_key is None:
+            return ("", pk)
+        if self.range_key not in item:
+            return None
+        return (item[self.range_key], pk)
+
+    def add(self, item: Dict[str, Any], pk: tuple) -> None:
+        entry = self.entry(item, pk)
+        if entry is not None:
+            bisect.insort(self.partitions.setdefault(item[self.hash_key], []), entry)
+
+    def remove(self, item: Dict[str, Any], pk: tuple) -> None:
+        entry = self.entry(item, pk)
+        if entry is None:
+            return
+        partition = self.partitions.get(item[self.hash_key], [])
+        idx = bisect.bisect_left(partition, entry)
+        if idx < len(partition) and partition[idx] == entry:
+            del partition[idx]
+            if not partition:
+                del self.partitions[item[self.hash_key]]
+
+    def attributes(self, table_keys: List[str]) -> Optional[set]:
+        """Top-level attributes stored in the index; None means all."""
+        kind = self.projection["ProjectionType"]
+        if kind == "ALL":
+            return None
+        keep = set(table_keys) | {self.hash_key} | ({self.range_key} if self.range_key else set())
+        if kind == "INCLUDE":
+            keep |= set(self.projection.get("NonKeyAttributes", []))
+        return keep
+
+    def projected(self, item: Dict[str, Any], table_keys: List[str]) -> Dict[str, Any]:
+        keep = self.attributes(table_keys)
+        return item if keep is None else {k: v for k, v in item.items() if k in keep}
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "IndexName": self.name,
+            "KeySchema": self.key_schema,
+            "Projection": self.projection,
+            "IndexStatus": "ACTIVE",
+            "ItemCount": sum(len(p) for p in self.partitions.values()),
+        }
+
+
+class _TableData:
+    def __init__(self, definition: Dict[str, Any]):
+        self.name = definition["TableName"]
+        self.key_schema = definition["KeySchema"]
+        self.attribute_definitions = list(definition.get("AttributeDefinitions", []))
+        self.key_attrs = [k["AttributeName"] for k in sorted(self.key_schema, key=lambda k: k["KeyType"] != "HASH")]
+        self.primary = _Index(None, self.key_schema, None)
+        self.indexes: Dict[str, _Index] = {}
+        self.items: Dict[tuple, Dict[str, Any]] = {}
+        self.order: List[tuple] = []  # scan order: primary keys, sorted
+        self.ttl_attribute: Optional[str] = None  # recorded only; items never expire here
+        for gsi in definition.get("GlobalSecondaryIndexes", []):
+            self.add_index(gsi)
+
+    def add_index(self, gsi: Dict[str, Any]) -> None:
+        index = _Index(gsi["IndexName"], gsi["KeySchema"], gsi.get("Projection"))
+        for pk, item in self.items.items():
+            index.add(item, pk)
+        self.indexes[index.name] = index
+
+    def pk(self, key: Dict[str, Any], operation: str) -> tuple:
+        if set(key) != set(self.key_attrs):
+            raise _validation("The provided key element does not match the schema", operation)
+        return tuple(_normalize(key[a]) for a in self.key_attrs)
+
+    def key_of(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {a: item[a] for a in self.key_attrs}
+
+    def write(self, pk: tuple, item: Optional[Dict[str, Any]]) -> None:
+        old = self.items.get(pk)
+        if old is not None:
+            for index in (self.primary, *self.indexes.values()):
+                index.remove(old, pk)
+        if item is None:
+            if old is not None:
+                del self.items[pk]
+                del self.order[bisect.bisect_left(self.order, pk)]
+            return
+        if old is None:
+            bisect.insort(self.order, pk)
+        self.items[pk] = item
+        for index in (self.primary, *self.indexes.values()):
+            index.add(item, pk)
+
+    def write_units(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> float:
+        """Base table write plus one write per GSI the item is (or was) in."""
+        units = _write_units(max(_item_size(old), _item_size(new)))
+        for index in self.indexes.values():
+            touched = [i for i in (old, new) if i is not None and index.entry(i, ()) is not None]
+            if touched:
+                units += _write_units(max(_item_size(index.projected(i, self.key_attrs)) for i in touched))
+        return units
+
+    def describe(self) -> Dict[str, Any]:
+        description = {
+            "TableName": self.name,
+            "TableStatus": "ACTIVE",
+            "KeySchema": self.key_schema,
+            "AttributeDefinitions": self.attribute_definitions,
+            "ItemCount": len(self.items),
+        }
+        if self.indexes:
+            description["GlobalSecondaryIndexes"] = [i.describe() for i in self.indexes.values()]
+        return description
+
+
+class _Store:
+    def __init__(self, latency_ms: float):
+        self.latency_ms = latency_ms
+        self.tables: Dict[str, _TableData] = {}
+        self.lock = threading.RLock()
+
+    def delay(self) -> None:
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms * random.lognormvariate(0, 0.3) / 1000)
+
+    def table(self, name: str, operation: str) -> _TableData:
+        table = self.tables.get(name)
+        if table is None:
+            raise _error("ResourceNotFoundException", f"Requested resource not found: Table: {name} not found", operation)
+        return table
+
+
+def _check_condition(table: _TableData, old: Optional[Dict[str, Any]], params: Dict[str, Any], operation: str) -> None:
+    expression = params.get("ConditionExpression")
+    if expression is None:
+        return
+    ast, ctx = _condition(expression, params.get("ExpressionAttributeNames"), params.get("ExpressionAttributeValues"), operation)
+    try:
+        passed = _evaluate(ast, old or {}, ctx)
+    except ValueError as e:
+        raise _validation(str(e), operation)
+    if not passed:
+        extra = {}
+        if old is not None and params.get("ReturnValuesOnConditionCheckFailure") == "ALL_OLD":
+            extra["Item"] = _to_wire(old)  # error bodies are not deserialized by boto3
+        extra.update(_capacity(params, table.name, _write_units(_item_size(old))))
+        raise _error("ConditionalCheckFailedException", "The conditional request failed", operation, **extra)
+
+
+# ── Single-item operations (shared by Table and transactions) ───
+
+def _prepare_put(table: _TableData, params: Dict[str, Any], operation: str):
+    item = _normalize_item(params["Item"])
+    missing = [a for a in table.key_attrs if a not in item]
+    if missing:
+        raise _validation(f"One or more parameter values were invalid: Missing the key {missing[0]} in the item", operation)
+    pk = table.pk(table.key_of(item), operation)
+    old = table.items.get(pk)
+    _check_condition(table, old, params, operation)
+    return pk, old, item
+
+
+def _prepare_update(table: _TableData, params: Dict[str, Any], operation: str):
+    pk = table.pk(params["Key"], operation)
+    old = table.items.get(pk)
+    _check_condition(table, old, params, operation)
+    base = old if old is not None else dict(zip(table.key_attrs, pk))
+    expression = params.get("UpdateExpression")
+    if not expression:
+        return pk, old, copy.deepcopy(base), set()
+    try:
+        actions = _parse(expression, "update")
+        ctx = _Context(params.get("ExpressionAttributeNames"), params.get("ExpressionAttributeValues"))
+        new, touched = _apply_update(base, actions, ctx, table.key_attrs)
+    except ValueError as e:
+        raise _validation(str(e), operation)
+    return pk, old, new, touched
+
+
+def _prepare_delete(table: _TableData, params: Dict[str, Any], operation: str):
+    pk = table.pk(params["Key"], operation)
+    old = table.items.get(pk)
+    _check_condition(table, old, params, operation)
+    return pk, old
+
+
+def _prepare_check(table: _TableData, params: Dict[str, Any], operation: str):
+    pk = table.pk(params["Key"], operation)
+    _check_condition(table, table.items.get(pk), params, operation)
+
+
+class MemoryTable:
+    """Mirror of `boto3.resource("dynamodb").Table(name)`."""
+
+    def __init__(self, store: _Store, name: str):
+        self._store = store
+        self.name = name
+        self.table_name = name
+
+    def _data(self, operation: str) -> _TableData:
+        return self._store.table(self.name, operation)
+
+    # metadata
+    def load(self) -> None:
+        with self._store.lock:
+            self._data("DescribeTable")
+
+    reload = load
+
+    def wait_until_exists(self) -> None:
+        self.load()
+
+    @property
+    def table_status(self) -> str:
+        self.load()
+        return "ACTIVE"
+
+    @property
+    def key_schema(self) -> List[Dict[str, str]]:
+        with self._store.lock:
+            return self._data("DescribeTable").key_schema
+
+    @property
+    def item_count(self) -> int:
+        with self._store.lock:
+            return len(self._data("DescribeTable").items)
+
+    @property
+    def global_secondary_indexes(self) -> Optional[List[Dict[str, Any]]]:
+        with self._store.lock:
+            return self._data("DescribeTable").describe().get("GlobalSecondaryIndexes")
+
+    def update(self, **params: Any) -> Dict[str, Any]:
+        with self._store.lock:
+            table = self._data("UpdateTable")
+            known = {a["AttributeName"] for a in table.attribute_definitions}
+            table.attribute_definitions += [a for a in params.get("AttributeDefinitions", []) if a["AttributeName"] not in known]
+            for change in params.get("GlobalSecondaryIndexUpdates", []):
+                if "Create" in change:
+                    table.add_index(change["Create"])
+                elif "Delete" in change:
+                    table.indexes.pop(change["Delete"]["IndexName"], None)
+            return {"TableDescription": table.describe()}
+
+    # items
+    def get_item(self, **params: Any) -> Dict[str, Any]:
+        self._store.delay()
+        with self._store.lock:
+            table = self._data("GetItem")
+            item = table.items.get(table.pk(params["Key"], "GetItem"))
+            capacity = _capacity(params, self.name, _read_units(_item_size(item), params.get("ConsistentRead", False)))
+            if item is None:
+                return capacity
+            projected = _project(item, params.get("ProjectionExpression"), params.get("ExpressionAttributeNames"), "GetItem")
+            return {"Item": projected, **capacity}
+
+    def put_item(self, **params: Any) -> Dict[str, Any]:
+        self._store.delay()
+        with self._store.lock:
+            table = self._data("PutItem")
+            pk, old, item = _prepare_put(table, params, "PutItem")
+            capacity = _capacity(params, self.name, table.write_units(old, item))
+            table.write(pk, item)
+        if params.get("ReturnValues") == "ALL_OLD" and old is not None:
+            return {"Attributes": copy.deepcopy(old), **capacity}
+        return capacity
+
+    def update_item(self, **params: Any) -> Dict[str, Any]:
+        self._store.delay()
+        with self._store.lock:
+            table = self._data("UpdateItem")
+            pk, old, new, touched = _prepare_update(table, params, "UpdateItem")
+            capacity = _capacity(params, self.name, table.write_units(old, new))
+            table.write(pk, new)
+        mode = params.get("ReturnValues", "NONE")
+        if mode == "ALL_NEW":
+            return {"Attributes": copy.deepcopy(new), **capacity}
+        if mode == "ALL_OLD" and old is not None:
+            return {"Attributes": copy.deepcopy(old), **capacity}
+        if mode in ("UPDATED_NEW", "UPDATED_OLD"):
+            source = new if mode == "UPDATED_NEW" else (old or {})
+            return {"Attributes": {k: copy.deepcopy(v) for k, v in source.items() if k in touched}, **capacity}
+        return capacity
+
+    def delete_item(self, **params: Any) -> Dict[str, Any]:
+        self._store.delay()
+        with self._store.lock:
+            table = self._data("DeleteItem")
+            pk, old = _prepare_delete(table, params, "DeleteItem")
+            capacity = _capacity(params, self.name, table.write_units(old, None))
+            table.write(pk, None)
+        if params.get("ReturnValues") == "ALL_OLD" and old is not None:
+            return {"Attributes": copy.deepcopy(old), **capacity}
+        return capacity
+
+    # reads
+    def scan(self, **params: Any) -> Dict[str, Any]:
+        self._store.delay()
+        with self._store.lock:
+            table = self._data("Scan")
+            index = self._index(table, params.get("IndexName"), "Scan")
+            if index is None:
+                pks = table.order
+                start = 0
+                if params.get("ExclusiveStartKey"):
+                    start = bisect.bisect_right(pks, table.pk(params["ExclusiveStartKey"], "Scan"))
+                candidates = (table.items[pk] for pk in pks[start:])
+            else:
+                entries = sorted(
+                    (h, entry) for h, partition in index.partitions.items() for entry in partition
+                )
+                start = 0
+                if params.get("ExclusiveStartKey"):
+                    marker = self._index_marker(table, index, params["ExclusiveStartKey"])
+                    start = bisect.bisect_right(entries, (params["ExclusiveStartKey"][index.hash_key], marker))
+                candidates = (table.items[entry[1]] for _, entry in entries[start:])
+            return self._page(table, index, candidates, params, "Scan")
+
+    def query(self, **params: Any) -> Dict[str, Any]:
+        self._store.delay()
+        with self._store.lock:
+            table = self._data("Query")
+            index = self._index(table, params.get("IndexName"), "Query")
+            source = index or table.primary
+            expression = params.get("KeyConditionExpression")
+            if expression is None:
+                raise _validation("Either the KeyConditions or KeyConditionExpression parameter must be specified", "Query")
+            ast, ctx = _condition(expression, params.get("ExpressionAttributeNames"), params.get("ExpressionAttributeValues"), "Query", is_key=True)
+            hash_value, bounds = self._key_bounds(ast, ctx, source)
+            partition = source.partitions.get(hash_value, [])
+            lo, hi = 0, len(partition)
+            if bounds is not None:
+                low, high = bounds
+                if low is not None:
+                    lo = (bisect.bisect_left if low[1] else bisect.bisect_right)(partition, low[0], key=lambda e: e[0])
+                if high is not None:
+                    hi = (bisect.bisect_right if high[1] else bisect.bisect_left)(partition, high[0], key=lambda e: e[0])
+            forward = params.get("ScanIndexForward", True)
+            if params.get("ExclusiveStartKey"):
+                marker = self._index_marker(table, source, params["ExclusiveStartKey"])
+                if forward:
+                    lo = max(lo, bisect.bisect_right(partition, marker))
+                else:
+                    hi = min(hi, bisect.bisect_left(partition, marker))
+            window = partition[lo:hi]
+            if not forward:
+                window = reversed(window)
+            candidates = (table.items[pk] for _, pk in window)
+            candidates = (item for item in candidates if _evaluate(ast, item, ctx))
+            return self._page(table, index, candidates, params, "Query")
+
+    @staticmethod
+    def _index(table: _TableData, name: Optional[str], operation: str) -> Optional[_Index]:
+        if name is None:
+            return None
+        if name not in table.indexes:
+            raise _validation(f"The table does not have the specified index: {name}", operation)
+        return table.indexes[name]
+
+    @staticmethod
+    def _index_marker(table: _TableData, index: _Index, start_key: Dict[str, Any]) -> Tuple[Any, tuple]:
+        pk = tuple(_normalize(start_key[a]) for a in table.key_attrs)
+        sort_value = _normalize(start_key[index.range_key]) if index.range_key else ""
+        return (sort_value, pk)
+
+    @staticmethod
+    def _key_bounds(ast: tuple, ctx: _Context, index: _Index):
+        """Split a key condition into the partition value and range bounds
+        ((value, inclusive) | None for each side). The full condition is
+        still evaluated per item, so bounds only need to be conservative."""
+        conjuncts = []
+
+        def flatten(node):
+            if node[0] == "and":
+                flatten(node[1])
+                flatten(node[2])
+            else:
+                conjuncts.append(node)
+
+        flatten(ast)
+        hash_value = _MISSING
+        low = high = None
+        for node in conjuncts:
+            if node[0] == "cmp" and node[2][0] == "path":
+                attr = ctx.parts(node[2])[0]
+                value = ctx.operand({}, node[3])
+                if attr == index.hash_key and node[1] == "=":
+                    hash_value = value
+                elif attr == index.range_key:
+                    if node[1] in ("=", ">", ">="):
+                        low = (value, node[1] != ">")
+                    if node[1] in ("=", "<", "<="):
+                        high = (value, node[1] != "<")
+            elif node[0] == "between":
+                low = (ctx.operand({}, node[2]), True)
+                high = (ctx.operand({}, node[3]), True)
+            elif node[0] == "func" and node[1] == "begins_with":
+                prefix = ctx.operand({}, node[2][1])
+                if isinstance(prefix, str):
+                    low, high = (prefix, True), (prefix + _RANGE_MAX, True)
+        if hash_value is _MISSING:
+            raise _validation("Query condition missed key schema element: " + index.hash_key, "Query")
+        return hash_value, (low, high)
+
+    def _page(self, table: _TableData, index: Optional[_Index], candidates, params: Dict[str, Any], operation: str) -> Dict[str, Any]:
+        limit = params.get("Limit")
+        if limit is not None and limit < 1:
+            raise _validation("Limit must be greater than or equal to 1", operation)
+        filter_expr = params.get("FilterExpression")
+        names = params.get("ExpressionAttributeNames")
+        if filter_expr is not None:
+            filter_ast, filter_ctx = _condition(filter_expr, names, params.get("ExpressionAttributeValues"), operation)
+        projection = params.get("ProjectionExpression")
+        available = index.attributes(table.key_attrs) if index is not None else None
+        if available is not None and projection:
+            missing = _top_level_names(projection, names) - available
+            if missing:
+                raise _validation(f"One or more parameter values were invalid: projection includes attributes not projected into index: {sorted(missing)}", operation)
+        items, scanned, last, size = [], 0, None, 0
+        for item in candidates:
+            scanned += 1
+            visible = index.projected(item, table.key_attrs) if index is not None else item
+            size += _item_size(visible)
+            if filter_expr is None or _evaluate(filter_ast, visible, filter_ctx):
+                items.append(_project(visible, projection, names, operation))
+            if limit is not None and scanned >= limit:
+                last = item
+                break
+        response: Dict[str, Any] = {"Count": len(items), "ScannedCount": scanned}
+        response.update(_capacity(params, table.name, _read_units(size, params.get("ConsistentRead", False))))
+        if params.get("Select") != "COUNT":
+            response["Items"] = items
+        if last is not None:
+            key = table.key_of(last)
+            if index is not None:
+                key[index.hash_key] = last[index.hash_key]
+                if index.range_key:
+                    key[index.range_key] = last[index.range_key]
+            response["LastEvaluatedKey"] = copy.deepcopy(key)
+        return response
+
+
+class _TableCollection:
+    def __init__(self, resource: "MemoryDynamoDB"):
+        self._resource = resource
+
+    def all(self) -> List[MemoryTable]:
+        self._resource._store.delay()
+        with self._resource._store.lock:
+            names = sorted(self._resource._store.tables)
+        return [MemoryTable(self._resource._store, name) for name in names]
+
+
+class MemoryDynamoDBClient:
+    """Low-level client (`resource.meta.client`): wire-format attribute values."""
+
+    def __init__(self, resource: "MemoryDynamoDB"):
+        self._resource = resource
+
+    def describe_table(self, TableName: str) -> Dict[str, Any]:
+        self._resource._store.delay()
+        with self._resource._store.lock:
+            return {"Table": copy.deepcopy(self._resource._store.table(TableName, "DescribeTable").describe())}
+
+    def update_time_to_live(self, TableName: str, TimeToLiveSpecification: Dict[str, Any]) -> Dict[str, Any]:
+        self._resource._store.delay()
+        with self._resource._store.lock:
+            table = self._resource._store.table(TableName, "UpdateTimeToLive")
+            enabled = TimeToLiveSpecification["Enabled"]
+            table.ttl_attribute = TimeToLiveSpecification["AttributeName"] if enabled else None
+        return {"TimeToLiveSpecification": dict(TimeToLiveSpecification)}
+
+    def describe_time_to_live(self, TableName: str) -> Dict[str, Any]:
+        with self._resource._store.lock:
+            table = self._resource._store.table(TableName, "DescribeTimeToLive")
+            if table.ttl_attribute is None:
+                return {"TimeToLiveDescription": {"TimeToLiveStatus": "DISABLED"}}
+            return {"TimeToLiveDescription": {"TimeToLiveStatus": "ENABLED", "AttributeName": table.ttl_attribute}}
+
+    def batch_get_item(self, RequestItems: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        request = {
+            name: {**spec, "Keys": [_from_wire(k) for k in spec["Keys"]]}
+            for name, spec in RequestItems.items()
+        }
+        response = self._resource.batch_get_item(RequestItems=request, **params)
+        response["Responses"] = {n: [_to_wire(i) for i in items] for n, items in response["Responses"].items()}
+        return response
+
+    def batch_write_item(self, RequestItems: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        request = {name: [_decode_request(r) for r in reqs] for name, reqs in RequestItems.items()}
+        return self._resource.batch_write_item(RequestItems=request, **params)
+
+    def transact_write_items(self, TransactItems: List[Dict[str, Any]], **params: Any) -> Dict[str, Any]:
+        """All-or-nothing: every condition is checked before anything is written."""
+        if len(TransactItems) > 100:
+            raise _validation("Member must have length less than or equal to 100", "TransactWriteItems")
+        store = self._resource._store
+        store.delay()
+        with store.lock:
+            writes, reasons, failed = [], [], False
+            seen = set()
+            for entry in TransactItems:
+                (op, spec), = entry.items()
+                spec_params = _decode_params(spec)
+                table = store.table(spec_params["TableName"], "TransactWriteItems")
+                key = table.key_of(spec_params["Item"]) if op == "Put" else spec_params["Key"]
+                pk = table.pk(key, "TransactWriteItems")
+                if (table.name, pk) in seen:
+                    raise _validation("Transaction request cannot include multiple operations on one item", "TransactWriteItems")
+                seen.add((table.name, pk))
+                try:
+                    if op == "Put":
+                        pk, old, item = _prepare_put(table, spec_params, "TransactWriteItems")
+                        writes.append((table, pk, old, item))
+                    elif op == "Update":
+                        pk, old, new, _ = _prepare_update(table, spec_params, "TransactWriteItems")
+                        writes.append((table, pk, old, new))
+                    elif op == "Delete":
+                        pk, old = _prepare_delete(table, spec_params, "TransactWriteItems")
+                        writes.append((table, pk, old, None))
+                    elif op == "ConditionCheck":
+                        _prepare_check(table, spec_params, "TransactWriteItems")
+                    else:
+                        raise _validation(f"Unsupported transaction operation {op}", "TransactWriteItems")
+                    reasons.append({"Code": "None"})
+                except ClientError as e:
+                    if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                        raise
+                    failed = True
+                    reason = {"Code": "ConditionalCheckFailed", "Message": "The conditional request failed"}
+                    if "Item" in e.response:
+                        reason["Item"] = e.response["Item"]  # already wire format
+                    reasons.append(reason)
+            if failed:
+                codes = ", ".join(r["Code"] for r in reasons)
+                raise _error(
+                    "TransactionCanceledException",
+                    f"Transaction cancelled, please refer cancellation reasons for specific reasons [{codes}]",
+                    "TransactWriteItems",
+                    CancellationReasons=reasons,
+                )
+            # Transactional writes cost two write units per unit of item size.
+            units: Dict[str, float] = {}
+            for table, pk, old, item in writes:
+                units[table.name] = units.get(table.name, 0.0) + 2 * table.write_units(old, item)
+                table.write(pk, item)
+        return _batch_capacity(params, units)
+
+
+def _batch_capacity(params: Dict[str, Any], units: Dict[str, float]) -> Dict[str, Any]:
+    """Multi-table calls report ConsumedCapacity as a list, one entry per table."""
+    if params.get("ReturnConsumedCapacity") in ("TOTAL", "INDEXES"):
+        return {"ConsumedCapacity": [{"TableName": n, "CapacityUnits": u} for n, u in units.items()]}
+    return {}
+
+
+def _decode_params(spec: Dict[str, Any]) -> Dict[str, Any]:
+    params = dict(spec)
+    for field in ("Item", "Key", "ExpressionAttributeValues"):
+        if field in params:
+            params[field] = _from_wire(params[field])
+    return params
+
+
+def _decode_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    (op, spec), = request.items()
+    field = "Item" if op == "PutRequest" else "Key"
+    return {op: {field: _from_wire(spec[field])}}
+
+
+class _Meta:
+    def __init__(self, client: MemoryDynamoDBClient):
+        self.client = client
+
+
+class MemoryDynamoDB:
+    """Mirror of `boto3.resource("dynamodb")` backed by process memory."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self._store = _Store(latency_ms)
+        self.tables = _TableCollection(self)
+        self.meta = _Meta(MemoryDynamoDBClient(self))
+
+    @property
+    def latency_ms(self) -> float:
+        return self._store.latency_ms
+
+    @latency_ms.setter
+    def latency_ms(self, value: float) -> None:
+        self._store.latency_ms = value
+
+    def Table(self, name: str) -> MemoryTable:
+        return MemoryTable(self._store, name)
+
+    def create_table(self, **definition: Any) -> MemoryTable:
+        self._store.delay()
+        with self._store.lock:
+            name = definition["TableName"]
+            if name in self._store.tables:
+                raise _error("ResourceInUseException", f"Table already exists: {name}", "CreateTable")
+            self._store.tables[name] = _TableData(definition)
+        return MemoryTable(self._store, name)
+
+    def batch_get_item(self, RequestItems: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        if sum(len(spec["Keys"]) for spec in RequestItems.values()) > 100:
+            raise _validation("Too many items requested for the BatchGetItem call", "BatchGetItem")
+        self._store.delay()
+        responses: Dict[str, List[Dict[str, Any]]] = {}
+        units: Dict[str, float] = {}
+        with self._store.lock:
+            for name, spec in RequestItems.items():
+                table = self._store.table(name, "BatchGetItem")
+                found = responses.setdefault(name, [])
+                for key in spec["Keys"]:
+                    item = table.items.get(table.pk(key, "BatchGetItem"))
+                    units[name] = units.get(name, 0.0) + _read_units(_item_size(item), spec.get("ConsistentRead", False))
+                    if item is not None:
+                        found.append(_project(item, spec.get("ProjectionExpression"), spec.get("ExpressionAttributeNames"), "BatchGetItem"))
+        return {"Responses": responses, "UnprocessedKeys": {}, **_batch_capacity(params, units)}
+
+    def batch_write_item(self, RequestItems: Dict[str, Any], **params: Any) -> Dict[str, Any]:
+        if sum(len(reqs) for reqs in RequestItems.values()) > 25:
+            raise _validation("Too many items requested for the BatchWriteItem call", "BatchWriteItem")
+        self._store.delay()
+        with self._store.lock:
+            planned = []
+            for name, requests in RequestItems.items():
+                table = self._store.table(name, "BatchWriteItem")
+                for request in requests:
+                    if "PutRequest" in request:
+                        pk, _, item = _prepare_put(table, request["PutRequest"], "BatchWriteItem")
+                        planned.append((table, pk, item))
+                    else:
+                        planned.append((table, table.pk(request["DeleteRequest"]["Key"], "BatchWriteItem"), None))
+            units: Dict[str, float] = {}
+            for table, pk, item in planned:
+                units[table.name] = units.get(table.name, 0.0) + table.write_units(table.items.get(pk), item)
+                table.write(pk, item)
+        return {"UnprocessedItems": {}, **_batch_capacity(params, units)}
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
-from typing import List, Literal
+import os
+from typing import List, Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -7,7 +8,8 @@ class Settings(BaseSettings):
 
     # "local" = Docker Compose + local DynamoDB
     # "cloud" = AWS Lambda   + cloud DynamoDB (IAM role credentials)
-    deploy_env: Literal["local", "cloud"] = "local"
+    # "memory" = in-process DynamoDB stand-in (benchmarks; data is not persisted)
+    deploy_env: Literal["local", "cloud", "memory"] = "local"
 
     # DynamoDB — only used when deploy_env=local
     dynamodb_endpoint: str = "http://localhost:8000"
@@ -15,16 +17,84 @@ class Settings(BaseSettings):
     aws_access_key_id: str = "local"
     aws_secret_access_key: str = "local"
 
+    # Simulated round trip per call when deploy_env=memory (median, log-normal tail)
+    memory_db_latency_ms: float = 4.0
+
+    # Max DynamoDB calls in flight per process (thread pool + HTTP connection pool)
+    dynamodb_max_concurrency: int = 32
+
+    # botocore client tuning. The profile picks the defaults (CLIENT_PROFILES in
+    # app/config/database.py); "auto" is "lambda" on Lambda, else "container".
+    # Each setting left unset takes the profile's value.
+    dynamodb_client_profile: Literal["auto", "lambda", "container"] = "auto"
+    dynamodb_connect_timeout: Optional[float] = None  # seconds
+    dynamodb_read_timeout: Optional[float] = None  # seconds
+    dynamodb_retry_mode: Optional[Literal["legacy", "standard", "adaptive"]] = None
+    dynamodb_max_attempts: Optional[int] = None  # including the first call
+    dynamodb_tcp_keepalive: Optional[bool] = None
+
+    # In-process read cache for small, rarely-written tables (experiences, projects)
+    cache_ttl_seconds: int = 300
+    cache_max_entries: int = 256
+
     # Auth
     jwt_secret_key: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 1440  # 24 hours
+    verified_token_cache_size: int = 1024  # decoded JWTs kept until their exp
+    user_cache_ttl_seconds: int = 30  # /api/auth/me?fresh=true record cache; 0 disables
+
+    # Password hashing — bcrypt runs on its own bounded pool, off the event loop
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_queue_size: int = 16  # waiting calls beyond this get 503
 
     # Cookie (cloud deploy should set COOKIE_SECURE=true, COOKIE_SAMESITE=none)
     cookie_name: str = "access_token"
     cookie_secure: bool = False
     cookie_samesite: str = "lax"
 
+    # Blog search index: local copy for warm reuse, and how often to check for a newer version
+    search_index_cache_path: str = "/tmp/blog-search-index.bin"
+    search_index_refresh_seconds: float = 30.0
+
+    # Precomputed public GET responses (scripts/export_snapshot.py, POST /api/snapshot).
+    # Empty disables; entries older than the max age, or whose content was
+    # written since the export, fall back to live reads.
+    snapshot_dir: str = ""
+    snapshot_max_age_seconds: float = 300.0
+    snapshot_check_seconds: float = 1.0  # how often to look for a new version / stale markers
+    snapshot_export_concurrency: int = 8
+
+    # Response compression: brotli when the `brotli` package is installed, else gzip
+    compression_enabled: bool = True
+    compression_min_bytes: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5
+    compression_cache_entries: int = 512  # compressed bodies of ETag'd GETs, keyed by (ETag, encoding)
+
+    # Rate limiting: token buckets of `burst` requests refilling at `per_minute`
+    rate_limit_enabled: bool = True
+    rate_limit_backend: Literal["memory", "dynamodb"] = "memory"  # "memory" (per process) or "dynamodb" (RateLimits table, shared)
+    rate_limit_login_per_minute: float = 10.0  # login + register, per client IP
+    rate_limit_login_burst: int = 5
+    rate_limit_comment_per_minute: float = 6.0  # comment posts, per user
+    rate_limit_comment_burst: int = 3
+    rate_limit_comment_ip_per_minute: float = 30.0  # comment posts, per client IP
+    rate_limit_comment_ip_burst: int = 10
+    rate_limit_max_keys: int = 100_000  # buckets held per process
+    rate_limit_sweep_seconds: float = 60.0
+    rate_limit_proxy_hops: int = 0  # trusted proxies appending to X-Forwarded-For
+
+    # Worker processes (scripts/serve.py)
+    server_workers: int = 0  # 0: one per available CPU
+    prewarm_enabled: bool = True  # hot reads at worker startup
+    invalidation_socket_dir: str = ""  # shared by a host's workers; serve.py sets it
+
+    # Request instrumentation: Server-Timing header + admin /api/metrics
+    metrics_enabled: bool = True
+    server_timing_enabled: bool = True
+
     admin_emails: str = ""
     cors_origins: str = "http://localhost:3000"
 
@@ -32,6 +102,12 @@ class Settings(BaseSettings):
     def is_cloud(self) -> bool:
         return self.deploy_env == "cloud"
 
+    @property
+    def dynamodb_profile(self) -> str:
+        if self.dynamodb_client_profile != "auto":
+            return self.dynamodb_client_profile
+        return "lambda" if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") else "container"
+
     @property
     def admin_email_list(self) -> List[str]:
         return [e.strip() for e in self.admin_emails.split(",") if e.strip()]
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 
 from app.config.settings import settings
 from app.models.user import UserCreate, UserLogin, TokenResponse, UserResponse
 from app.services.auth_service import auth_service
 from app.middleware.auth import require_auth
+from app.utils.password_hasher import HasherBusyError
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
@@ -23,21 +24,25 @@ def _set_token_cookie(response: Response, token: str):
 @router.post("/register", response_model=TokenResponse)
 async def register(user_data: UserCreate, response: Response):
     try:
-        result = auth_service.register(user_data)
+        result = await auth_service.register(user_data)
         _set_token_cookie(response, result.access_token)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except HasherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(credentials: UserLogin, response: Response):
     try:
-        result = auth_service.login(credentials.email, credentials.password)
+        result = await auth_service.login(credentials.email, credentials.password)
         _set_token_cookie(response, result.access_token)
         return result
     except ValueError as e:
         raise HTTPException(status_code=401, detail=str(e))
+    except HasherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
 
 
 @router.post("/logout")
@@ -53,8 +58,18 @@ async def logout(response: Response):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user(payload=Depends(require_auth)):
-    user = auth_service._get_user_by_email(payload["email"])
+async def get_current_user(
+    fresh: bool = Query(False, description="Read the stored user record instead of the token claims"),
+    payload=Depends(require_auth),
+):
+    """Answered from the verified token by default (no DynamoDB read).
+    `?fresh=true` reads the user record through a short-TTL cache."""
+    if not fresh:
+        user_resp = auth_service.user_from_claims(payload)
+        if user_resp is not None:
+            return user_resp
+
+    user = await auth_service.aio.get_user(payload["sub"])
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
     return UserResponse(
@@ -1,62 +1,161 @@
-from typing import Optional
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 
-from app.models.blog import BlogPostCreate, BlogPostUpdate, BlogPostResponse, BlogPostListResponse
+from app.models.blog import (
+    BLOG_SUMMARY_FIELDS, BlogPostCreate, BlogPostUpdate, BlogPostResponse, BlogPostListResponse, BlogPostSummary,
+    BlogPostBulkCreate, BlogPostBulkCreateResponse, BlogPostBulkResponse, BlogSearchHit, BlogSearchResponse,
+    TagListResponse,
+)
+from app.models.bulk import MAX_BULK_ITEMS, BulkDeleteResponse
+from app.services.base_service import ItemNotFoundError
 from app.services.blog_service import blog_service
+from app.services.tag_service import tag_service
+from app.services.search_service import SearchIndexUnavailableError
+from app.utils.cursor import InvalidCursorError
 from app.middleware.auth import require_admin
+from app.utils.http_cache import CACHE_PUBLIC_FEED, CACHE_PUBLIC_ITEM, cacheable_response, not_modified, version_etag
+from app.utils.serialization import FastJSONResponse, conform
 
 router = APIRouter(prefix="/api/blog", tags=["Blog"])
 
+# Tables the public blog responses are rendered from (ETag validators).
+BLOG_TABLES = (blog_service.table_name, tag_service.TABLE_NAME)
+
 
 @router.get("", response_model=BlogPostListResponse)
 async def list_posts(
+    request: Request,
     limit: int = Query(25, ge=1, le=100),
     cursor: Optional[str] = None,
+    tag: Optional[str] = Query(None, min_length=1, max_length=100),
 ):
-    """Public — list published blog posts (paginated)."""
-    posts, next_cursor = blog_service.get_published_posts(limit=limit, cursor=cursor)
-    return BlogPostListResponse(posts=posts, count=len(posts), next_cursor=next_cursor)
+    """Public — list published blog posts, optionally only those with `tag` (paginated). ETag / If-None-Match aware."""
+    etag = await version_etag(request, BLOG_TABLES)
+    cached = not_modified(request, etag, cache_control=CACHE_PUBLIC_FEED)
+    if cached is not None:
+        return cached
+    if tag:
+        posts, next_cursor = await blog_service.aio.get_posts_by_tag(tag, limit=limit, cursor=cursor)
+    else:
+        posts, next_cursor = await blog_service.aio.get_published_posts(limit=limit, cursor=cursor)
+    return cacheable_response(
+        request,
+        {"posts": conform(BlogPostSummary, posts), "count": len(posts), "next_cursor": next_cursor},
+        cache_control=CACHE_PUBLIC_FEED,
+        etag=etag,
+    )
 
 
 @router.get("/all", response_model=BlogPostListResponse)
 async def list_all_posts(
     limit: int = Query(25, ge=1, le=100),
     cursor: Optional[str] = None,
+    status: Optional[Literal["published", "draft"]] = None,
     admin=Depends(require_admin),
 ):
-    """Admin only — list all posts including drafts (paginated)."""
-    posts, next_cursor = blog_service.get_all_posts(limit=limit, cursor=cursor)
-    return BlogPostListResponse(posts=posts, count=len(posts), next_cursor=next_cursor)
+    """Admin only — list all posts including drafts, newest first, optionally only one `status` (paginated)."""
+    try:
+        posts, next_cursor = await blog_service.aio.get_all_posts(limit=limit, cursor=cursor, status=status)
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    return FastJSONResponse({"posts": conform(BlogPostSummary, posts), "count": len(posts), "next_cursor": next_cursor})
+
+
+@router.get("/tags", response_model=TagListResponse)
+async def list_tags(request: Request):
+    """Public — tags of published posts with post counts, most used first. ETag / If-None-Match aware."""
+    etag = await version_etag(request, BLOG_TABLES)
+    cached = not_modified(request, etag, cache_control=CACHE_PUBLIC_FEED)
+    if cached is not None:
+        return cached
+    tags = await blog_service.aio.get_tag_counts()
+    return cacheable_response(request, {"tags": tags, "count": len(tags)}, cache_control=CACHE_PUBLIC_FEED, etag=etag)
+
+
+@router.get("/search", response_model=BlogSearchResponse)
+async def search_posts(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Public — full-text search over published posts, best match first. ETag / If-None-Match aware
+    (body digest: results follow this instance's copy of the index, not the table versions)."""
+    try:
+        hits = await blog_service.aio.search_posts(q, limit=limit)
+    except SearchIndexUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    return cacheable_response(
+        request,
+        {"query": q, "results": conform(BlogSearchHit, hits), "count": len(hits)},
+        cache_control=CACHE_PUBLIC_FEED,
+    )
+
+
+@router.get("/bulk", response_model=BlogPostBulkResponse)
+async def get_posts_bulk(
+    ids: List[str] = Query(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    admin=Depends(require_admin),
+):
+    """Admin only — post summaries (drafts included) by id (`?ids=a&ids=b`), in request order; one BatchGetItem."""
+    ids = list(dict.fromkeys(ids))
+    posts = await blog_service.aio.get_many(ids, projection=BLOG_SUMMARY_FIELDS)
+    found = [post for post in posts if post is not None]
+    return FastJSONResponse({
+        "posts": conform(BlogPostSummary, found),
+        "count": len(found),
+        "missing": [i for i, post in zip(ids, posts) if post is None],
+    })
+
+
+@router.post("/bulk", response_model=BlogPostBulkCreateResponse, status_code=201)
+async def create_posts_bulk(data: BlogPostBulkCreate, admin=Depends(require_admin)):
+    posts = await blog_service.aio.create_posts(
+        data.posts, author_email=admin["email"], author_name=admin.get("display_name", admin["email"])
+    )
+    return {"posts": posts, "count": len(posts)}
+
+
+@router.delete("/bulk", response_model=BulkDeleteResponse)
+async def delete_posts_bulk(
+    ids: List[str] = Query(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    admin=Depends(require_admin),
+):
+    ids = list(dict.fromkeys(ids))
+    deleted = {post["post_id"] for post in await blog_service.aio.delete_many(ids)}
+    return {"deleted": [i for i in ids if i in deleted], "missing": [i for i in ids if i not in deleted]}
 
 
 @router.get("/{post_id}", response_model=BlogPostResponse)
-async def get_post(post_id: str):
-    """Public — get a single published blog post."""
-    post = blog_service.get_by_id(post_id)
+async def get_post(post_id: str, request: Request):
+    """Public — get a single published blog post. ETag / If-None-Match aware."""
+    etag = await version_etag(request, BLOG_TABLES)
+    cached = not_modified(request, etag, cache_control=CACHE_PUBLIC_ITEM)
+    if cached is not None:
+        return cached
+    post = await blog_service.aio.get_by_id(post_id)
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found.")
-    return post
+    return cacheable_response(request, conform(BlogPostResponse, [post])[0], cache_control=CACHE_PUBLIC_ITEM, etag=etag)
 
 
 @router.post("", response_model=BlogPostResponse, status_code=201)
 async def create_post(data: BlogPostCreate, admin=Depends(require_admin)):
-    post = blog_service.create_post(data, author_email=admin["email"], author_name=admin.get("display_name", admin["email"]))
+    post = await blog_service.aio.create_post(data, author_email=admin["email"], author_name=admin.get("display_name", admin["email"]))
     return post
 
 
 @router.put("/{post_id}", response_model=BlogPostResponse)
 async def update_post(post_id: str, data: BlogPostUpdate, admin=Depends(require_admin)):
-    existing = blog_service.get_by_id(post_id)
-    if not existing:
+    try:
+        return await blog_service.aio.update_post(post_id, data)
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Blog post not found.")
-    updated = blog_service.update_post(post_id, data)
-    return updated
 
 
 @router.delete("/{post_id}", status_code=204)
 async def delete_post(post_id: str, admin=Depends(require_admin)):
-    existing = blog_service.get_by_id(post_id)
-    if not existing:
+    try:
+        await blog_service.aio.delete(post_id)
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Blog post not found.")
-    blog_service.delete(post_id)
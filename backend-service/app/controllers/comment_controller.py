@@ -3,9 +3,10 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
 
 from app.models.comment import CommentCreate, CommentResponse, CommentListResponse
+from app.services.base_service import ItemNotFoundError
 from app.services.comment_service import comment_service
-from app.services.blog_service import blog_service
 from app.middleware.auth import require_auth
+from app.utils.serialization import FastJSONResponse, conform
 
 router = APIRouter(prefix="/api/blog/{post_id}/comments", tags=["Comments"])
 
@@ -17,38 +18,40 @@ async def list_comments(
     cursor: Optional[str] = None,
 ):
     """Public — list comments for a blog post (paginated via GSI query)."""
-    comments, next_cursor = comment_service.get_by_post(
+    comments, next_cursor = await comment_service.aio.get_by_post(
         post_id, limit=limit, cursor=cursor
     )
-    return CommentListResponse(comments=comments, count=len(comments), next_cursor=next_cursor)
+    return FastJSONResponse(
+        {"comments": conform(CommentResponse, comments), "count": len(comments), "next_cursor": next_cursor}
+    )
 
 
 @router.post("", response_model=CommentResponse, status_code=201)
 async def create_comment(post_id: str, data: CommentCreate, user=Depends(require_auth)):
     """Requires login — any authenticated user can comment."""
-    post = blog_service.get_by_id(post_id)
-    if not post:
+    try:
+        return await comment_service.aio.create_comment(
+            post_id=post_id,
+            data=data,
+            user_id=user["sub"],
+            user_email=user["email"],
+            display_name=user.get("display_name", user["email"]),
+        )
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Blog post not found.")
-    comment = comment_service.create_comment(
-        post_id=post_id,
-        data=data,
-        user_id=user["sub"],
-        user_email=user["email"],
-        display_name=user.get("display_name", user["email"]),
-    )
-    return comment
 
 
 @router.delete("/{comment_id}", status_code=204)
 async def delete_comment(post_id: str, comment_id: str, user=Depends(require_auth)):
     """Delete a comment — owner or admin only."""
     try:
-        deleted = comment_service.delete_comment(
+        await comment_service.aio.delete_comment(
             comment_id=comment_id,
             user_id=user["sub"],
             is_admin=user.get("role") == "admin",
+            post_id=post_id,
         )
-        if not deleted:
-            raise HTTPException(status_code=404, detail="Comment not found.")
-    except PermissionError as e:
-        raise HTTPException(status_code=403, detail=str(e))
+    except ItemNotFoundError:
+        raise HTTPException(status_code=404, detail="Comment not found.")
+    except PermissionError:
+        raise HTTPException(status_code=403, detail="You can only delete your own comments.")
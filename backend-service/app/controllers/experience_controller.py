@@ -1,22 +1,67 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List
 
-from app.models.experience import ExperienceCreate, ExperienceUpdate, ExperienceResponse, ExperienceListResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+
+from app.models.bulk import MAX_BULK_ITEMS, BulkDeleteResponse
+from app.models.experience import (
+    ExperienceCreate, ExperienceUpdate, ExperienceResponse, ExperienceListResponse, ExperienceBulkCreate, ExperienceBulkResponse,
+)
+from app.services.base_service import ItemNotFoundError
 from app.services.experience_service import experience_service
 from app.middleware.auth import require_admin
+from app.utils.http_cache import CACHE_PUBLIC_LIST, cacheable_response, not_modified, version_etag
+from app.utils.serialization import conform
 
 router = APIRouter(prefix="/api/experiences", tags=["Experiences"])
 
 
 @router.get("", response_model=ExperienceListResponse)
-async def list_experiences():
-    """Public endpoint — returns all experiences ordered."""
-    items = experience_service.get_ordered()
-    return ExperienceListResponse(experiences=items, count=len(items))
+async def list_experiences(request: Request):
+    """Public endpoint — returns all experiences ordered. ETag / If-None-Match aware."""
+    etag = await version_etag(request, [experience_service.table_name])
+    cached = not_modified(request, etag, cache_control=CACHE_PUBLIC_LIST)
+    if cached is not None:
+        return cached
+    items = await experience_service.aio.get_ordered()
+    return cacheable_response(
+        request,
+        {"experiences": conform(ExperienceResponse, items), "count": len(items)},
+        cache_control=CACHE_PUBLIC_LIST,
+        etag=etag,
+    )
+
+
+@router.get("/bulk", response_model=ExperienceBulkResponse)
+async def get_experiences_bulk(
+    ids: List[str] = Query(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    admin=Depends(require_admin),
+):
+    """Admin only — experiences by id (`?ids=a&ids=b`), in request order; one BatchGetItem."""
+    ids = list(dict.fromkeys(ids))
+    items = await experience_service.aio.get_many(ids)
+    found = [item for item in items if item is not None]
+    return {"experiences": found, "count": len(found), "missing": [i for i, item in zip(ids, items) if item is None]}
+
+
+@router.post("/bulk", response_model=ExperienceListResponse, status_code=201)
+async def create_experiences_bulk(data: ExperienceBulkCreate, admin=Depends(require_admin)):
+    items = await experience_service.aio.create_experiences(data.experiences)
+    return {"experiences": items, "count": len(items)}
+
+
+@router.delete("/bulk", response_model=BulkDeleteResponse)
+async def delete_experiences_bulk(
+    ids: List[str] = Query(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    admin=Depends(require_admin),
+):
+    ids = list(dict.fromkeys(ids))
+    deleted = {item["experience_id"] for item in await experience_service.aio.delete_many(ids)}
+    return {"deleted": [i for i in ids if i in deleted], "missing": [i for i in ids if i not in deleted]}
 
 
 @router.get("/{experience_id}", response_model=ExperienceResponse)
 async def get_experience(experience_id: str):
-    item = experience_service.get_by_id(experience_id)
+    item = await experience_service.aio.get_by_id(experience_id)
     if not item:
         raise HTTPException(status_code=404, detail="Experience not found.")
     return item
@@ -24,20 +69,20 @@ async def get_experience(experience_id: str):
 
 @router.post("", response_model=ExperienceResponse, status_code=201)
 async def create_experience(data: ExperienceCreate, admin=Depends(require_admin)):
-    return experience_service.create_experience(data)
+    return await experience_service.aio.create_experience(data)
 
 
 @router.put("/{experience_id}", response_model=ExperienceResponse)
 async def update_experience(experience_id: str, data: ExperienceUpdate, admin=Depends(require_admin)):
-    existing = experience_service.get_by_id(experience_id)
-    if not existing:
+    try:
+        return await experience_service.aio.update_experience(experience_id, data)
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Experience not found.")
-    return experience_service.update_experience(experience_id, data)
 
 
 @router.delete("/{experience_id}", status_code=204)
 async def delete_experience(experience_id: str, admin=Depends(require_admin)):
-    existing = experience_service.get_by_id(experience_id)
-    if not existing:
+    try:
+        await experience_service.aio.delete(experience_id)
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Experience not found.")
-    experience_service.delete(experience_id)
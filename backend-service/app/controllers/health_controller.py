@@ -1,4 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.middleware.auth import require_admin
+from app.middleware.compression import compressed_bodies
+from app.services.experience_service import experience_service
+from app.services.project_service import project_service
+from app.utils.metrics import registry
 
 router = APIRouter(tags=["Health"])
 
@@ -6,3 +12,27 @@ router = APIRouter(tags=["Health"])
 @router.get("/api/health")
 async def health_check():
     return {"status": "healthy", "service": "PersonalSite API"}
+
+
+@router.get("/api/health/cache")
+async def cache_stats(admin=Depends(require_admin)):
+    """Hit/miss counters of the in-process read caches on this container."""
+    stats = {
+        service.table_name: service.cache.stats()
+        for service in (experience_service, project_service)
+        if service.cache is not None
+    }
+    stats["compressed_bodies"] = compressed_bodies.stats()
+    return stats
+
+
+@router.get("/api/metrics")
+async def metrics(admin=Depends(require_admin)):
+    """Per-route request counts, latency histograms and DynamoDB usage
+    (calls, time, consumed capacity) aggregated on this process."""
+    return registry.snapshot()
+
+
+@router.delete("/api/metrics", status_code=204)
+async def reset_metrics(admin=Depends(require_admin)):
+    registry.reset()
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from app.models.blog import BlogPostSummary
+from app.models.experience import ExperienceResponse
+from app.models.home import HomeResponse
+from app.models.project import ProjectResponse
+from app.models.user import UserResponse
+from app.services.auth_service import auth_service
+from app.services.blog_service import blog_service
+from app.services.experience_service import experience_service
+from app.services.project_service import project_service
+from app.middleware.auth import optional_auth
+from app.utils.http_cache import CACHE_PRIVATE, CACHE_PUBLIC_FEED, cacheable_response, not_modified, version_etag
+from app.utils.serialization import conform
+
+router = APIRouter(prefix="/api/home", tags=["Home"])
+
+VARY = "Authorization, Cookie"
+
+
+async def _current_user(payload: Optional[Dict[str, Any]]) -> Optional[UserResponse]:
+    """As `GET /api/auth/me`: from the token claims, reading the user record
+    only for tokens that predate the `created_at` claim."""
+    if payload is None:
+        return None
+    user_resp = auth_service.user_from_claims(payload)
+    if user_resp is not None:
+        return user_resp
+    user = await auth_service.aio.get_user(payload["sub"])
+    if not user:
+        return None
+    return UserResponse(
+        user_id=user["user_id"],
+        email=user["email"],
+        display_name=user["display_name"],
+        role=user["role"],
+        created_at=user["created_at"],
+    )
+
+
+@router.get("", response_model=HomeResponse)
+async def get_home(
+    request: Request,
+    posts: int = Query(3, ge=1, le=25, description="Number of latest published posts"),
+    payload=Depends(optional_auth),
+):
+    """Public — experiences, projects, the latest published posts and the
+    current user (null when anonymous) in one response. The reads run
+    concurrently, so latency follows the slowest one rather than their sum.
+    ETag / If-None-Match aware; private when a user is signed in."""
+    # A signed-in response also depends on the token's claims (and, for old
+    # tokens, on the user record, which is never updated after register).
+    variant = json.dumps(payload, sort_keys=True, default=str) if payload else ""
+    cache_control = CACHE_PRIVATE if payload else CACHE_PUBLIC_FEED
+    tables = (experience_service.table_name, project_service.table_name, blog_service.table_name)
+    etag = await version_etag(request, tables, variant)
+    cached = not_modified(request, etag, cache_control=cache_control, vary=VARY)
+    if cached is not None:
+        return cached
+    experiences, projects, (latest, _), user = await asyncio.gather(
+        experience_service.aio.get_ordered(),
+        project_service.aio.get_ordered(),
+        blog_service.aio.get_published_posts(limit=posts),
+        _current_user(payload),
+    )
+    return cacheable_response(
+        request,
+        {
+            "experiences": conform(ExperienceResponse, experiences),
+            "projects": conform(ProjectResponse, projects),
+            "posts": conform(BlogPostSummary, latest),
+            "user": user.model_dump() if user else None,
+        },
+        cache_control=cache_control,
+        vary=VARY,
+        etag=etag,
+    )
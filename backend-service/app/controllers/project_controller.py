@@ -1,22 +1,67 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List
 
-from app.models.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+
+from app.models.bulk import MAX_BULK_ITEMS, BulkDeleteResponse
+from app.models.project import (
+    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse, ProjectBulkCreate, ProjectBulkResponse,
+)
+from app.services.base_service import ItemNotFoundError
 from app.services.project_service import project_service
 from app.middleware.auth import require_admin
+from app.utils.http_cache import CACHE_PUBLIC_LIST, cacheable_response, not_modified, version_etag
+from app.utils.serialization import conform
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
 
 
 @router.get("", response_model=ProjectListResponse)
-async def list_projects():
-    """Public endpoint — returns all projects ordered."""
-    items = project_service.get_ordered()
-    return ProjectListResponse(projects=items, count=len(items))
+async def list_projects(request: Request):
+    """Public endpoint — returns all projects ordered. ETag / If-None-Match aware."""
+    etag = await version_etag(request, [project_service.table_name])
+    cached = not_modified(request, etag, cache_control=CACHE_PUBLIC_LIST)
+    if cached is not None:
+        return cached
+    items = await project_service.aio.get_ordered()
+    return cacheable_response(
+        request,
+        {"projects": conform(ProjectResponse, items), "count": len(items)},
+        cache_control=CACHE_PUBLIC_LIST,
+        etag=etag,
+    )
+
+
+@router.get("/bulk", response_model=ProjectBulkResponse)
+async def get_projects_bulk(
+    ids: List[str] = Query(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    admin=Depends(require_admin),
+):
+    """Admin only — projects by id (`?ids=a&ids=b`), in request order; one BatchGetItem."""
+    ids = list(dict.fromkeys(ids))
+    items = await project_service.aio.get_many(ids)
+    found = [item for item in items if item is not None]
+    return {"projects": found, "count": len(found), "missing": [i for i, item in zip(ids, items) if item is None]}
+
+
+@router.post("/bulk", response_model=ProjectListResponse, status_code=201)
+async def create_projects_bulk(data: ProjectBulkCreate, admin=Depends(require_admin)):
+    items = await project_service.aio.create_projects(data.projects)
+    return {"projects": items, "count": len(items)}
+
+
+@router.delete("/bulk", response_model=BulkDeleteResponse)
+async def delete_projects_bulk(
+    ids: List[str] = Query(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    admin=Depends(require_admin),
+):
+    ids = list(dict.fromkeys(ids))
+    deleted = {item["project_id"] for item in await project_service.aio.delete_many(ids)}
+    return {"deleted": [i for i in ids if i in deleted], "missing": [i for i in ids if i not in deleted]}
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(project_id: str):
-    item = project_service.get_by_id(project_id)
+    item = await project_service.aio.get_by_id(project_id)
     if not item:
         raise HTTPException(status_code=404, detail="Project not found.")
     return item
@@ -24,20 +69,20 @@ async def get_project(project_id: str):
 
 @router.post("", response_model=ProjectResponse, status_code=201)
 async def create_project(data: ProjectCreate, admin=Depends(require_admin)):
-    return project_service.create_project(data)
+    return await project_service.aio.create_project(data)
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
 async def update_project(project_id: str, data: ProjectUpdate, admin=Depends(require_admin)):
-    existing = project_service.get_by_id(project_id)
-    if not existing:
+    try:
+        return await project_service.aio.update_project(project_id, data)
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Project not found.")
-    return project_service.update_project(project_id, data)
 
 
 @router.delete("/{project_id}", status_code=204)
 async def delete_project(project_id: str, admin=Depends(require_admin)):
-    existing = project_service.get_by_id(project_id)
-    if not existing:
+    try:
+        await project_service.aio.delete(project_id)
+    except ItemNotFoundError:
         raise HTTPException(status_code=404, detail="Project not found.")
-    project_service.delete(project_id)
@@ -0,0 +1,31 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.config.settings import settings
+from app.middleware.auth import require_admin
+from app.utils.snapshot import export, snapshot_store
+
+router = APIRouter(prefix="/api/snapshot", tags=["Snapshot"])
+
+_export_lock = asyncio.Lock()
+
+
+@router.get("")
+async def snapshot_status(admin=Depends(require_admin)):
+    """Admin only — version, age and stale groups of the snapshot this process serves."""
+    return snapshot_store.status()
+
+
+@router.post("")
+async def export_snapshot(request: Request, admin=Depends(require_admin)):
+    """Admin only — re-render every public GET response into a new snapshot
+    version and start serving it."""
+    if not snapshot_store.enabled:
+        raise HTTPException(status_code=503, detail="Snapshots are disabled (SNAPSHOT_DIR is not set).")
+    if _export_lock.locked():
+        raise HTTPException(status_code=409, detail="An export is already running.")
+    async with _export_lock:
+        summary = await export(request.app, settings.snapshot_dir, concurrency=settings.snapshot_export_concurrency)
+    snapshot_store.reload()
+    return summary
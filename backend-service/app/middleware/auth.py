@@ -1,7 +1,16 @@
+import hashlib
+import time
+from typing import Any, Dict
+
 from fastapi import Depends, HTTPException, Request, status
 
 from app.config.settings import settings
 from app.services.auth_service import auth_service
+from app.utils.cache import TTLCache
+
+# sha256(token) -> decoded payload, each entry expiring at the token's `exp`.
+# Payloads are shared between requests and must not be mutated.
+verified_tokens = TTLCache(max_entries=settings.verified_token_cache_size, ttl_seconds=0)
 
 
 def _extract_token(request: Request) -> str:
@@ -17,11 +26,28 @@ def _extract_token(request: Request) -> str:
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated.")
 
 
+def verify_token_cached(token: str) -> Dict[str, Any]:
+    """`auth_service.verify_token` behind an LRU of already-verified tokens.
+    Raises ValueError for invalid or expired tokens (never cached)."""
+    key = hashlib.sha256(token.encode()).digest()
+    payload = verified_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    payload = auth_service.verify_token(token)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = exp - time.time()
+        if ttl > 0:
+            verified_tokens.set(key, payload, ttl=ttl)
+    return payload
+
+
 async def require_auth(request: Request):
     """Validates JWT for any logged-in user."""
     token = _extract_token(request)
     try:
-        return auth_service.verify_token(token)
+        return verify_token_cached(token)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
 
@@ -30,7 +56,7 @@ async def require_admin(request: Request):
     """Validates JWT and ensures the user has admin role."""
     token = _extract_token(request)
     try:
-        payload = auth_service.verify_token(token)
+        payload = verify_token_cached(token)
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token.")
 
@@ -44,6 +70,6 @@ async def optional_auth(request: Request):
     """Optionally validates JWT — returns payload or None."""
     try:
         token = _extract_token(request)
-        return auth_service.verify_token(token)
+        return verify_token_cached(token)
     except (HTTPException, ValueError):
         return None
@@ -0,0 +1,128 @@
+import gzip
+from typing import Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.config.settings import settings
+from app.utils.cache import TTLCache
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+# Keys are content-addressed (strong ETag + encoding), so entries never go
+# stale; the TTL only lets rarely requested bodies age out.
+CACHE_TTL_SECONDS = 3600.0
+
+# Compressed bodies of ETag'd GET responses, keyed by (ETag, encoding).
+compressed_bodies = TTLCache(max_entries=settings.compression_cache_entries, ttl_seconds=CACHE_TTL_SECONDS)
+
+
+def _brotli():
+    """The optional `brotli` module, or None when it is not installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def choose_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """The coding in `available` (server preference order) with the highest
+    q-value in Accept-Encoding; None when the client accepts none of them."""
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+    best, best_weight = None, 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware: brotli (when installed) or gzip compression of
+    JSON/text responses of at least `COMPRESSION_MIN_BYTES`, negotiated
+    from Accept-Encoding.
+
+    A strong ETag (`cacheable_response`) names one body of one URL (its
+    content versions, or a digest of the body), so compressed bodies are
+    cached by (ETag, encoding) and a hot payload is compressed once. Compressed responses get a weak ETag (same
+    value, so If-None-Match still matches) and `Vary: Accept-Encoding`.
+    Streaming bodies and bodies that are already encoded pass through.
+    """
+
+    def __init__(self, app, cache: TTLCache = compressed_bodies):
+        self.app = app
+        self.cache = cache
+        self.encodings: Tuple[str, ...] = ("br", "gzip") if _brotli() else ("gzip",)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        start = None
+
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message  # held until the body shows whether to compress
+                return
+            if message["type"] == "http.response.body" and start is not None:
+                held, start = start, None
+                if message.get("more_body"):
+                    await send(held)
+                    await send(message)
+                    return
+                body = self._encode(scope, held, message.get("body", b""), encoding)
+                await send(held)
+                await send({"type": "http.response.body", "body": body})
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    def _encode(self, scope, start, body: bytes, encoding: Optional[str]) -> bytes:
+        """Compress `body` if eligible, updating the headers of `start`."""
+        headers = MutableHeaders(scope=start)
+        if (
+            start["status"] in (204, 304)
+            or "content-encoding" in headers
+            or len(body) < settings.compression_min_bytes
+            or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        ):
+            return body
+        headers.add_vary_header("Accept-Encoding")
+        if encoding is None:
+            return body
+
+        etag = headers.get("etag")
+        cacheable = scope["method"] == "GET" and etag is not None and not etag.startswith("W/")
+        compressed = self.cache.get((etag, encoding)) if cacheable else None
+        if compressed is None:
+            compressed = self._compress(body, encoding)
+            if cacheable:
+                self.cache.set((etag, encoding), compressed)
+        if len(compressed) >= len(body):
+            return body
+
+        headers["content-encoding"] = encoding
+        headers["content-length"] = str(len(compressed))
+        if etag is not None and not etag.startswith("W/"):
+            headers["etag"] = "W/" + etag
+        return compressed
+
+    @staticmethod
+    def _compress(body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return _brotli().compress(body, quality=settings.compression_brotli_quality)
+        return gzip.compress(body, compresslevel=settings.compression_gzip_level, mtime=0)
@@ -0,0 +1,60 @@
+import time
+from typing import Any, Callable, Dict
+
+from starlette.datastructures import MutableHeaders
+
+from app.config.settings import settings
+from app.utils.metrics import end_request, registry, start_request
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: per-request DynamoDB accounting (see
+    app/utils/metrics.py), a `Server-Timing` response header and per-route
+    aggregates for `/api/metrics`.
+
+    Routes are keyed by their template (`GET /api/blog/{post_id}`), resolved
+    from the endpoint Starlette's router leaves in the scope.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._templates: Dict[Callable, str] = {}
+
+    def _route(self, scope: Dict[str, Any]) -> str:
+        if "snapshot" in scope:
+            return f"{scope['method']} {scope['snapshot']} (snapshot)"
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return f"{scope['method']} <unmatched>"
+        template = self._templates.get(endpoint)
+        if template is None:
+            template = next(
+                (r.path for r in scope["app"].routes if getattr(r, "endpoint", None) is endpoint),
+                scope["path"],
+            )
+            self._templates[endpoint] = template
+        return f"{scope['method']} {template}"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request()
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if settings.server_timing_enabled:
+                    total_ms = (time.perf_counter() - start) * 1000
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(total_ms))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_request(token)
+            registry.observe(self._route(scope), status, (time.perf_counter() - start) * 1000, stats)
@@ -0,0 +1,96 @@
+import math
+import re
+from typing import List, Optional, Tuple
+
+import orjson
+from starlette.requests import HTTPConnection
+
+from app.config.settings import settings
+from app.middleware.auth import verify_token_cached
+from app.utils.rate_limit import RateLimitBackend, Rule, build_backend
+
+LOGIN = Rule("login", settings.rate_limit_login_per_minute, settings.rate_limit_login_burst)
+COMMENT_IP = Rule("comment-ip", settings.rate_limit_comment_ip_per_minute, settings.rate_limit_comment_ip_burst)
+COMMENT_USER = Rule("comment-user", settings.rate_limit_comment_per_minute, settings.rate_limit_comment_burst)
+
+# (method, path pattern, per-IP rule, per-user rule)
+LIMITED_ROUTES: List[Tuple[str, "re.Pattern[str]", Optional[Rule], Optional[Rule]]] = [
+    ("POST", re.compile(r"/api/auth/(login|register)"), LOGIN, None),
+    ("POST", re.compile(r"/api/blog/[^/]+/comments"), COMMENT_IP, COMMENT_USER),
+]
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware: token buckets per client IP and per signed-in
+    user on the login, register and comment-create routes. Over-limit
+    requests get `429` with `Retry-After` before the body is read, so they
+    never reach AuthService (bcrypt) or CommentService (DynamoDB writes).
+
+    The user of a request is the `sub` of its verified JWT (cached verify);
+    an invalid token gets no user bucket and is rejected by the route.
+    """
+
+    def __init__(self, app, backend: Optional[RateLimitBackend] = None):
+        self.app = app
+        self.backend = backend or build_backend(settings.rate_limit_backend)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for method, pattern, ip_rule, user_rule in LIMITED_ROUTES:
+                if scope["method"] == method and pattern.fullmatch(scope["path"]):
+                    retry_after = await self._acquire(HTTPConnection(scope), ip_rule, user_rule)
+                    if retry_after > 0:
+                        await self._reject(send, retry_after)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+    async def _acquire(self, conn: HTTPConnection, ip_rule: Optional[Rule], user_rule: Optional[Rule]) -> float:
+        if ip_rule is not None:
+            retry_after = await self.backend.acquire(ip_rule, client_ip(conn))
+            if retry_after > 0:
+                return retry_after
+        if user_rule is not None:
+            user_id = _user_id(conn)
+            if user_id is not None:
+                return await self.backend.acquire(user_rule, user_id)
+        return 0.0
+
+    @staticmethod
+    async def _reject(send, retry_after: float) -> None:
+        seconds = max(1, math.ceil(retry_after))
+        body = orjson.dumps({"detail": f"Too many requests. Retry in {seconds} s."})
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(seconds).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def client_ip(conn: HTTPConnection) -> str:
+    """The peer address, or with RATE_LIMIT_PROXY_HOPS = n the n-th
+    X-Forwarded-For entry from the right (the one our nearest trusted proxy saw)."""
+    hops = settings.rate_limit_proxy_hops
+    if hops > 0:
+        forwarded = [part.strip() for part in conn.headers.get("x-forwarded-for", "").split(",") if part.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return conn.client.host if conn.client else "unknown"
+
+
+def _user_id(conn: HTTPConnection) -> Optional[str]:
+    token = conn.cookies.get(settings.cookie_name)
+    if not token:
+        auth_header = conn.headers.get("authorization", "")
+        token = auth_header[7:] if auth_header.startswith("Bearer ") else None
+    if not token:
+        return None
+    try:
+        return verify_token_cached(token).get("sub")
+    except ValueError:
+        return None
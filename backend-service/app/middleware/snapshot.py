@@ -0,0 +1,83 @@
+import gzip
+
+from starlette.requests import HTTPConnection
+
+from app.config.settings import settings
+from app.middleware.compression import choose_encoding
+from app.utils.http_cache import etag_matches
+from app.utils.snapshot import BYPASS_SCOPE_KEY, SnapshotStore, snapshot_store, write_group
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class SnapshotMiddleware:
+    """Pure ASGI middleware: answers public GETs from the exported snapshot
+    (app/utils/snapshot.py) — no DynamoDB calls — while the entry is fresh,
+    and marks a content group stale as soon as a write to it succeeds.
+
+    Bodies are stored gzip-compressed and sent as-is to clients that accept
+    gzip. Entries rendered for anonymous callers (`/api/home`) are only
+    served to requests without credentials.
+    """
+
+    def __init__(self, app, store: SnapshotStore = snapshot_store):
+        self.app = app
+        self.store = store
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.store.enabled or scope.get(BYPASS_SCOPE_KEY):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method in ("GET", "HEAD"):
+            hit = self.store.lookup(scope["path"], scope["query_string"].decode("latin-1"))
+            conn = HTTPConnection(scope)
+            if hit and not (hit[1]["anonymous"] and self._has_credentials(conn)):
+                await self._serve(scope, conn, send, *hit)
+                return
+        elif method in WRITE_METHODS:
+            group = write_group(scope["path"])
+            if group is not None:
+                async def send_and_invalidate(message):
+                    # Before the response leaves, so a client's next read is live.
+                    if message["type"] == "http.response.start" and 200 <= message["status"] < 300:
+                        self.store.mark_stale(group)
+                    await send(message)
+
+                await self.app(scope, receive, send_and_invalidate)
+                return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _has_credentials(conn: HTTPConnection) -> bool:
+        return "authorization" in conn.headers or settings.cookie_name in conn.cookies
+
+    @staticmethod
+    async def _serve(scope, conn: HTTPConnection, send, snapshot, entry) -> None:
+        scope["snapshot"] = entry["route"]  # route label for MetricsMiddleware
+        stored = entry["headers"]
+        compressed = choose_encoding(conn.headers.get("accept-encoding", ""), ("gzip",)) == "gzip"
+        vary = ", ".join(filter(None, [stored.get("vary"), "Accept-Encoding"]))
+        headers = [(b"vary", vary.encode())]
+        if "cache-control" in stored:
+            headers.append((b"cache-control", stored["cache-control"].encode()))
+        etag = stored.get("etag")
+        if etag:
+            # Same ETag as the live response; weak for the gzip encoding of it.
+            headers.append((b"etag", ("W/" + etag if compressed else etag).encode()))
+
+        if etag and etag_matches(conn.headers.get("if-none-match"), etag):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        body = snapshot.body(entry)
+        if compressed:
+            headers.append((b"content-encoding", b"gzip"))
+        else:
+            body = gzip.decompress(body)
+        headers += [(b"content-type", stored["content-type"].encode()), (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
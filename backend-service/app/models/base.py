@@ -0,0 +1,15 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class ApiModel(BaseModel):
+    """Base of every request/response model.
+
+    `defer_build` skips compiling each model's own validator and serializer
+    at import time. FastAPI validates bodies and responses through the
+    adapters it builds per route, so most models never need their own; the
+    rest (e.g. `model_dump()` on a request body) compile on first use. This
+    keeps class definitions out of the Lambda cold-start import
+    (benchmarks/bench_import_time.py).
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,9 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 from datetime import datetime
 
+from app.models.base import ApiModel
+from app.models.bulk import MAX_BULK_ITEMS
+from app.models.comment import CommentPreview
 
-class BlogPostBase(BaseModel):
+
+class BlogPostBase(ApiModel):
     title: str = Field(..., min_length=1, max_length=200)
     summary: str = Field(..., max_length=500)
     content: str = Field(..., min_length=1)
@@ -15,7 +19,7 @@ class BlogPostCreate(BlogPostBase):
     pass
 
 
-class BlogPostUpdate(BaseModel):
+class BlogPostUpdate(ApiModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     summary: Optional[str] = Field(None, max_length=500)
     content: Optional[str] = None
@@ -31,9 +35,72 @@ class BlogPostResponse(BlogPostBase):
     is_published: bool
     created_at: str
     updated_at: str
+    comment_count: int = 0
+    last_comment_at: Optional[str] = None
+    last_comment: Optional[CommentPreview] = None
 
 
-class BlogPostListResponse(BaseModel):
-    posts: List[BlogPostResponse]
+class BlogPostSummary(ApiModel):
+    """List-page shape: everything but the markdown `content`."""
+    post_id: str
+    title: str
+    summary: str
+    tags: List[str] = Field(default_factory=list)
+    cover_image_url: Optional[str] = None
+    author_name: str
+    is_published: bool
+    created_at: str
+    updated_at: str
+    # Maintained by CommentService in the same transaction as the comment write
+    comment_count: int = 0
+    last_comment_at: Optional[str] = None
+    last_comment: Optional[CommentPreview] = None
+
+
+# Attributes read for list pages — also the projection of the BlogPosts list GSIs.
+BLOG_SUMMARY_FIELDS = list(BlogPostSummary.model_fields)
+# Change on every comment, so derived copies (PostTags, search index) leave
+# them out and read them from BlogPosts instead.
+COMMENT_STAT_FIELDS = ["comment_count", "last_comment_at", "last_comment"]
+BLOG_COPY_FIELDS = [f for f in BLOG_SUMMARY_FIELDS if f not in COMMENT_STAT_FIELDS]
+
+
+class BlogSearchHit(BlogPostSummary):
+    score: float
+
+
+class BlogSearchResponse(ApiModel):
+    query: str
+    results: List[BlogSearchHit]
+    count: int
+
+
+class BlogPostListResponse(ApiModel):
+    posts: List[BlogPostSummary]
     count: int
     next_cursor: Optional[str] = None
+
+
+class BlogPostBulkCreate(ApiModel):
+    posts: List[BlogPostCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BlogPostBulkCreateResponse(ApiModel):
+    posts: List[BlogPostResponse]
+    count: int
+
+
+class BlogPostBulkResponse(ApiModel):
+    posts: List[BlogPostSummary]
+    count: int
+    missing: List[str] = Field(default_factory=list, description="Requested ids that do not exist")
+
+
+class TagCount(ApiModel):
+    tag: str
+    count: int
+
+
+class TagListResponse(ApiModel):
+    tags: List[TagCount]
+    count: int
@@ -0,0 +1,11 @@
+from typing import List
+
+from app.models.base import ApiModel
+
+# Items per admin bulk request (`/bulk` on blog, experiences, projects)
+MAX_BULK_ITEMS = 100
+
+
+class BulkDeleteResponse(ApiModel):
+    deleted: List[str]
+    missing: List[str]
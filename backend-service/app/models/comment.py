@@ -1,12 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import List, Optional, Optional
 
+from app.models.base import ApiModel
 
-class CommentCreate(BaseModel):
+
+class CommentCreate(ApiModel):
     content: str = Field(..., min_length=1, max_length=2000)
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(ApiModel):
     comment_id: str
     post_id: str
     user_id: str
@@ -16,7 +18,15 @@ class CommentResponse(BaseModel):
     created_at: str
 
 
-class CommentListResponse(BaseModel):
+class CommentPreview(ApiModel):
+    """Latest comment, denormalized onto its blog post."""
+    comment_id: str
+    display_name: str
+    excerpt: str
+    created_at: str
+
+
+class CommentListResponse(ApiModel):
     comments: List[CommentResponse]
     count: int
     next_cursor: Optional[str] = None
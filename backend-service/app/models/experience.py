@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 
+from app.models.base import ApiModel
+from app.models.bulk import MAX_BULK_ITEMS
 
-class ExperienceBase(BaseModel):
+
+class ExperienceBase(ApiModel):
     company: str = Field(..., min_length=1, max_length=200)
     role: str = Field(..., min_length=1, max_length=200)
     location: str = Field(..., max_length=200)
@@ -17,7 +20,7 @@ class ExperienceCreate(ExperienceBase):
     pass
 
 
-class ExperienceUpdate(BaseModel):
+class ExperienceUpdate(ApiModel):
     company: Optional[str] = None
     role: Optional[str] = None
     location: Optional[str] = None
@@ -32,6 +35,14 @@ class ExperienceResponse(ExperienceBase):
     experience_id: str
 
 
-class ExperienceListResponse(BaseModel):
+class ExperienceListResponse(ApiModel):
     experiences: List[ExperienceResponse]
     count: int
+
+
+class ExperienceBulkCreate(ApiModel):
+    experiences: List[ExperienceCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class ExperienceBulkResponse(ExperienceListResponse):
+    missing: List[str] = Field(default_factory=list, description="Requested ids that do not exist")
@@ -0,0 +1,15 @@
+from typing import Optional, List
+
+from app.models.base import ApiModel
+from app.models.blog import BlogPostSummary
+from app.models.experience import ExperienceResponse
+from app.models.project import ProjectResponse
+from app.models.user import UserResponse
+
+
+class HomeResponse(ApiModel):
+    """Everything the homepage renders, in one response."""
+    experiences: List[ExperienceResponse]
+    projects: List[ProjectResponse]
+    posts: List[BlogPostSummary]
+    user: Optional[UserResponse] = None
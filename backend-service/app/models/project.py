@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List
 
+from app.models.base import ApiModel
+from app.models.bulk import MAX_BULK_ITEMS
 
-class ProjectBase(BaseModel):
+
+class ProjectBase(ApiModel):
     title: str = Field(..., min_length=1, max_length=200)
     tech_stack: str = Field(..., max_length=500)
     date_range: str = Field(..., description="e.g. Feb. 2025 – May 2025")
@@ -17,7 +20,7 @@ class ProjectCreate(ProjectBase):
     pass
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(ApiModel):
     title: Optional[str] = None
     tech_stack: Optional[str] = None
     date_range: Optional[str] = None
@@ -32,6 +35,14 @@ class ProjectResponse(ProjectBase):
     project_id: str
 
 
-class ProjectListResponse(BaseModel):
+class ProjectListResponse(ApiModel):
     projects: List[ProjectResponse]
     count: int
+
+
+class ProjectBulkCreate(ApiModel):
+    projects: List[ProjectCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class ProjectBulkResponse(ProjectListResponse):
+    missing: List[str] = Field(default_factory=list, description="Requested ids that do not exist")
@@ -1,9 +1,11 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import EmailStr, Field
 from typing import Optional
 from datetime import datetime
 
+from app.models.base import ApiModel
 
-class UserBase(BaseModel):
+
+class UserBase(ApiModel):
     email: EmailStr
     display_name: str = Field(..., min_length=1, max_length=100)
 
@@ -12,7 +14,7 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8)
 
 
-class UserLogin(BaseModel):
+class UserLogin(ApiModel):
     email: EmailStr
     password: str
 
@@ -30,7 +32,7 @@ class UserInDB(UserBase):
     created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(ApiModel):
     access_token: str
     token_type: str = "bearer"
     user: UserResponse
@@ -1,32 +1,77 @@
 import uuid
+import base64
+import binascii
+import calendar
+import functools
+import hashlib
+import hmac
+import json
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
-from jose import jwt, JWTError
-from passlib.context import CryptContext
-from boto3.dynamodb.conditions import Key
-
 from app.config.settings import settings
 from app.config.database import db_client
 from app.models.user import UserCreate, UserInDB, UserResponse, TokenResponse
+from app.services.base_service import AsyncServiceProxy
+from app.utils.cache import TTLCache
+from app.utils.metrics import MeteredTable
+from app.utils.password_hasher import PasswordHasher
+
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _int_claim(payload: Dict[str, Any], name: str) -> Optional[int]:
+    if name not in payload:
+        return None
+    try:
+        return int(payload[name])
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {name} claim.")
 
 
 class AuthService:
-    """Handles user registration, authentication, and JWT token management."""
+    """Handles user registration, authentication, and JWT token management.
+
+    Construction is free of I/O and heavy imports: jose, passlib and boto3 are
+    loaded on first use, so only auth routes pay for them on a cold start.
+    """
 
     TABLE_NAME = "Users"
 
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.table = db_client.get_table(self.TABLE_NAME)
+        self.hasher = PasswordHasher(
+            rounds=settings.bcrypt_rounds,
+            max_workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_queue_size,
+        )
+        self.user_cache = (
+            TTLCache(max_entries=settings.cache_max_entries, ttl_seconds=settings.user_cache_ttl_seconds)
+            if settings.user_cache_ttl_seconds > 0
+            else None
+        )
+
+    @property
+    def table(self):
+        return MeteredTable(db_client.get_table(self.TABLE_NAME))
+
+    @functools.cached_property
+    def aio(self) -> AsyncServiceProxy:
+        return AsyncServiceProxy(self)
 
-    def _hash_password(self, password: str) -> str:
-        return self.pwd_context.hash(password)
+    async def _hash_password(self, password: str) -> str:
+        return await self.hasher.hash(password)
 
-    def _verify_password(self, plain: str, hashed: str) -> bool:
-        return self.pwd_context.verify(plain, hashed)
+    async def _verify_password(self, plain: str, hashed: str) -> bool:
+        return await self.hasher.verify(plain, hashed)
 
     def _create_token(self, data: Dict[str, Any]) -> str:
+        from jose import jwt
+
         to_encode = data.copy()
         expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
         to_encode.update({"exp": expire})
@@ -34,6 +79,8 @@ class AuthService:
 
     def _get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """GSI query on gsi_email — O(1) instead of full-table scan."""
+        from boto3.dynamodb.conditions import Key
+
         response = self.table.query(
             IndexName="gsi_email",
             KeyConditionExpression=Key("email").eq(email),
@@ -42,8 +89,32 @@ class AuthService:
         items = response.get("Items", [])
         return items[0] if items else None
 
-    def register(self, user_data: UserCreate) -> TokenResponse:
-        existing = self._get_user_by_email(user_data.email)
+    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Point read on the primary key, behind the short-TTL user cache."""
+        def load():
+            return self.table.get_item(Key={"user_id": user_id}).get("Item")
+
+        if self.user_cache is None:
+            return load()
+        return self.user_cache.get_or_load(user_id, load)
+
+    @staticmethod
+    def user_from_claims(payload: Dict[str, Any]) -> Optional[UserResponse]:
+        """Build the profile from verified JWT claims; None for tokens issued
+        before `created_at` was added to them."""
+        try:
+            return UserResponse(
+                user_id=payload["sub"],
+                email=payload["email"],
+                display_name=payload["display_name"],
+                role=payload["role"],
+                created_at=payload["created_at"],
+            )
+        except KeyError:
+            return None
+
+    async def register(self, user_data: UserCreate) -> TokenResponse:
+        existing = await self.aio._get_user_by_email(user_data.email)
         if existing:
             raise ValueError("User with this email already exists.")
 
@@ -53,12 +124,18 @@ class AuthService:
             user_id=user_id,
             email=user_data.email,
             display_name=user_data.display_name,
-            hashed_password=self._hash_password(user_data.password),
+            hashed_password=await self._hash_password(user_data.password),
             role=role,
         )
-        self.table.put_item(Item=user_in_db.model_dump())
-
-        token = self._create_token({"sub": user_id, "email": user_data.email, "role": role, "display_name": user_data.display_name})
+        await db_client.run(self.table.put_item, Item=user_in_db.model_dump())
+
+        token = self._create_token({
+            "sub": user_id,
+            "email": user_data.email,
+            "role": role,
+            "display_name": user_data.display_name,
+            "created_at": user_in_db.created_at,
+        })
         user_resp = UserResponse(
             user_id=user_id,
             email=user_data.email,
@@ -68,12 +145,18 @@ class AuthService:
         )
         return TokenResponse(access_token=token, user=user_resp)
 
-    def login(self, email: str, password: str) -> TokenResponse:
-        user = self._get_user_by_email(email)
-        if not user or not self._verify_password(password, user["hashed_password"]):
+    async def login(self, email: str, password: str) -> TokenResponse:
+        user = await self.aio._get_user_by_email(email)
+        if not user or not await self._verify_password(password, user["hashed_password"]):
             raise ValueError("Invalid email or password.")
 
-        token = self._create_token({"sub": user["user_id"], "email": email, "role": user["role"], "display_name": user["display_name"]})
+        token = self._create_token({
+            "sub": user["user_id"],
+            "email": email,
+            "role": user["role"],
+            "display_name": user["display_name"],
+            "created_at": user["created_at"],
+        })
         user_resp = UserResponse(
             user_id=user["user_id"],
             email=user["email"],
@@ -84,11 +167,56 @@ class AuthService:
         return TokenResponse(access_token=token, user=user_resp)
 
     def verify_token(self, token: str) -> Dict[str, Any]:
+        digest = _HMAC_DIGESTS.get(settings.jwt_algorithm)
+        if digest is not None:
+            return self._verify_hmac_token(token, digest)
+
+        from jose import jwt, JWTError
+
         try:
             payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
             return payload
         except JWTError:
             raise ValueError("Invalid or expired token.")
 
+    def _verify_hmac_token(self, token: str, digest) -> Dict[str, Any]:
+        """Direct HS* verification without jose's generic JWS/JWK machinery. It
+        accepts no token that `jose.jwt.decode(token, key, algorithms=[alg])`
+        rejects: alg pinning, constant-time signature compare, numeric
+        exp/nbf/iat, string sub/jti, and no `aud` or `at_hash` (we pass neither
+        an audience nor an access token). tests/test_auth_token.py runs both
+        over the same tokens."""
+        try:
+            signing_input, _, signature = token.rpartition(".")
+            header_segment, _, payload_segment = signing_input.partition(".")
+            if not header_segment or not payload_segment or "." in payload_segment:
+                raise ValueError
+            header = json.loads(_b64url_decode(header_segment))
+            if not isinstance(header, dict) or header.get("alg") != settings.jwt_algorithm:
+                raise ValueError
+            expected = hmac.new(settings.jwt_secret_key.encode(), signing_input.encode(), digest).digest()
+            if not hmac.compare_digest(expected, _b64url_decode(signature)):
+                raise ValueError
+            payload = json.loads(_b64url_decode(payload_segment))
+            if not isinstance(payload, dict):
+                raise ValueError
+
+            now = calendar.timegm(datetime.utcnow().utctimetuple())
+            _int_claim(payload, "iat")
+            nbf = _int_claim(payload, "nbf")
+            if nbf is not None and nbf > now:
+                raise ValueError
+            exp = _int_claim(payload, "exp")
+            if exp is not None and exp < now:
+                raise ValueError
+            if "aud" in payload or "at_hash" in payload:
+                raise ValueError
+            for name in ("sub", "jti"):
+                if name in payload and not isinstance(payload[name], str):
+                    raise ValueError
+        except (ValueError, TypeError, UnicodeError, binascii.Error):
+            raise ValueError("Invalid or expired token.")
+        return payload
+
 
 auth_service = AuthService()
@@ -1,12 +1,22 @@
 import json
 import base64
+import functools
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from boto3.dynamodb.conditions import Key
 from app.config.database import db_client
+from app.utils.cache import TTLCache
+from app.utils.content_version import content_versions
+from app.utils.cursor import SignedCursor
+from app.utils.invalidation import invalidation_bus
+from app.utils.metrics import MeteredTable, metered
 
 DEFAULT_PAGE_SIZE = 25
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+MAX_BATCH_ATTEMPTS = 8
 
 
 def encode_cursor(key: Dict[str, Any]) -> str:
@@ -17,12 +27,112 @@ def decode_cursor(cursor: str) -> Dict[str, Any]:
     return json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
 
 
+def _apply_projection(params: Dict[str, Any], projection: Optional[Sequence[str]]) -> None:
+    """Add a ProjectionExpression (via #name placeholders, so reserved words
+    are safe) without clobbering caller-supplied ExpressionAttributeNames."""
+    if not projection:
+        return
+    names = dict(params.get("ExpressionAttributeNames", {}))
+    placeholders = []
+    for i, attr in enumerate(projection):
+        names[f"#proj{i}"] = attr
+        placeholders.append(f"#proj{i}")
+    params["ProjectionExpression"] = ", ".join(placeholders)
+    params["ExpressionAttributeNames"] = names
+
+
+def backoff(attempt: int, base: float = 0.05, cap: float = 1.0) -> None:
+    """Full-jitter exponential backoff before retrying unprocessed batch items."""
+    time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+
+def batch_get(
+    table_name: str, keys: Sequence[Dict[str, Any]], *, projection: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """BatchGetItem in chunks of 100 keys, retrying UnprocessedKeys with
+    jittered backoff. Items come back in no particular order; missing keys
+    are simply absent."""
+    items: List[Dict[str, Any]] = []
+    for start in range(0, len(keys), BATCH_GET_LIMIT):
+        spec: Dict[str, Any] = {"Keys": list(keys[start:start + BATCH_GET_LIMIT])}
+        _apply_projection(spec, projection)
+        pending = {table_name: spec}
+        for attempt in range(MAX_BATCH_ATTEMPTS):
+            response = metered("batch_get_item", db_client.resource.batch_get_item, RequestItems=pending)
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            pending = response.get("UnprocessedKeys")
+            if not pending:
+                break
+            backoff(attempt)
+        else:
+            raise RuntimeError(f"BatchGetItem on '{table_name}' kept returning unprocessed keys")
+    return items
+
+
+def batch_write(table_name: str, requests: Sequence[Dict[str, Any]]) -> None:
+    """BatchWriteItem in chunks of 25 (`{"PutRequest": ...}` /
+    `{"DeleteRequest": ...}` entries), retrying UnprocessedItems with
+    jittered backoff. Bumps the table's content version when done."""
+    for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+        pending = {table_name: list(requests[start:start + BATCH_WRITE_LIMIT])}
+        for attempt in range(MAX_BATCH_ATTEMPTS):
+            response = metered("batch_write_item", db_client.resource.batch_write_item, RequestItems=pending)
+            pending = response.get("UnprocessedItems")
+            if not pending:
+                break
+            backoff(attempt)
+        else:
+            raise RuntimeError(f"BatchWriteItem on '{table_name}' kept returning unprocessed items")
+    if requests:
+        content_versions.bump(table_name)
+
+
+class ItemNotFoundError(LookupError):
+    """A conditional write targeted an item that does not exist."""
+
+
+class ItemForbiddenError(PermissionError):
+    """A conditional write found the item, but an `expected` attribute did not match."""
+
+
+class AsyncServiceProxy:
+    """Awaitable view of a service.
+
+    `await service.aio.get_by_id(...)` runs the same method on the shared
+    DynamoDB thread pool, so async route handlers never block the event loop.
+    """
+
+    def __init__(self, service: Any):
+        self._service = service
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await db_client.run(attr, *args, **kwargs)
+
+        return call
+
+
 class BaseService(ABC):
     """
     Abstract base service providing standard CRUD operations on a DynamoDB table.
     Subclasses must define `table_name` and `key_field`.
+    Async callers use `service.aio.<method>(...)`.
+
+    Subclasses may set `cache` (any object with TTLCache's interface) to make
+    `get_by_id` and `cached()` reads read-through; every write through this
+    service clears it, in sibling worker processes too.
+
+    Every write also bumps the table's content version (ETag validators,
+    app/utils/content_version.py) after it succeeds.
     """
 
+    cache: Optional[TTLCache] = None
+
     @property
     @abstractmethod
     def table_name(self) -> str:
@@ -35,25 +145,123 @@ class BaseService(ABC):
 
     @property
     def table(self):
-        return db_client.get_table(self.table_name)
+        """Data-plane calls are timed and charged to the current request."""
+        return MeteredTable(db_client.get_table(self.table_name))
+
+    @functools.cached_property
+    def aio(self) -> AsyncServiceProxy:
+        return AsyncServiceProxy(self)
+
+    # ── Read-through cache ──────────────────────────────────────
+    def cached(self, key: Any, loader) -> Any:
+        """Return `loader()` through the service cache, if one is configured."""
+        if self.cache is None:
+            return loader()
+        return self.cache.get_or_load(key, loader)
+
+    def invalidate_cache(self, *, broadcast: bool = True) -> None:
+        """Clear the cache; `broadcast` also asks the other workers to."""
+        if self.cache is not None:
+            self.cache.clear()
+            if broadcast:
+                invalidation_bus.publish(self.table_name)
 
     # ── Point read (always O(1), always preferred) ──────────────
     def get_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        return self.cached(("id", item_id), lambda: self._get_item(item_id))
+
+    def _get_item(self, item_id: str) -> Optional[Dict[str, Any]]:
         response = self.table.get_item(Key={self.key_field: item_id})
         return response.get("Item")
 
+    def get_many(
+        self, ids: Sequence[str], *, projection: Optional[Sequence[str]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Items for `ids` in input order, None where missing. Cached items
+        are reused (without `projection`); the rest are read with BatchGetItem.
+        `projection` always includes the key field."""
+        found: Dict[str, Dict[str, Any]] = {}
+        pending = list(dict.fromkeys(ids))
+        if self.cache is not None and projection is None:
+            for item_id in pending:
+                item = self.cache.get(("id", item_id))
+                if item is not None:
+                    found[item_id] = item
+            pending = [item_id for item_id in pending if item_id not in found]
+        if projection is not None:
+            projection = list(dict.fromkeys([self.key_field, *projection]))
+        for item in batch_get(self.table_name, [{self.key_field: item_id} for item_id in pending], projection=projection):
+            found[item[self.key_field]] = item
+        return [found.get(item_id) for item_id in ids]
+
     # ── Writes ──────────────────────────────────────────────────
     def create(self, item: Dict[str, Any]) -> Dict[str, Any]:
         self.table.put_item(Item=item)
+        self.invalidate_cache()
+        content_versions.bump(self.table_name)
         return item
 
-    def update(self, item_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def create_many(self, items: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Unconditional puts with BatchWriteItem (25 per call)."""
+        batch_write(self.table_name, [{"PutRequest": {"Item": item}} for item in items])
+        self.invalidate_cache()
+        return list(items)
+
+    def delete_many(self, ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Delete the items of `ids` that exist and return them (input order).
+        One BatchGetItem to find them, then BatchWriteItem deletes; unlike
+        `delete()` this is not conditional, so an item created in between
+        is neither deleted nor reported."""
+        old = [item for item in self.get_many(list(dict.fromkeys(ids))) if item is not None]
+        batch_write(self.table_name, [{"DeleteRequest": {"Key": {self.key_field: item[self.key_field]}}} for item in old])
+        if old:
+            self.invalidate_cache()
+        return old
+
+    def _write_condition(
+        self, expected: Optional[Dict[str, Any]], expr_names: Dict[str, str], expr_values: Dict[str, Any]
+    ) -> str:
+        """`attribute_exists(<key>)` plus one equality per `expected` attribute
+        (e.g. an owner match). Fills the placeholder maps in place."""
+        expr_names["#pk"] = self.key_field
+        parts = ["attribute_exists(#pk)"]
+        for i, (key, value) in enumerate((expected or {}).items()):
+            expr_names[f"#cond{i}"] = key
+            expr_values[f":cond{i}"] = value
+            parts.append(f"#cond{i} = :cond{i}")
+        return " AND ".join(parts)
+
+    def _raise_condition_failed(self, error: Exception, item_id: str):
+        """Translate ConditionalCheckFailedException into a typed error. The
+        old item comes back only if it exists (ReturnValuesOnConditionCheckFailure)."""
+        if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+            raise error
+        if error.response.get("Item"):
+            raise ItemForbiddenError(f"Not allowed to modify {self.key_field}={item_id}.") from None
+        raise ItemNotFoundError(f"{self.key_field}={item_id} not found.") from None
+
+    def update(
+        self,
+        item_id: str,
+        updates: Dict[str, Any],
+        *,
+        expected: Optional[Dict[str, Any]] = None,
+        return_values: str = "ALL_NEW",
+    ) -> Dict[str, Any]:
+        """Single round trip: the item must exist (and match `expected`), else
+        ItemNotFoundError / ItemForbiddenError. Returns the item after the
+        update, or before it with `return_values="ALL_OLD"`."""
         if not updates:
-            return self.get_by_id(item_id)
+            item = self.get_by_id(item_id)
+            if item is None:
+                raise ItemNotFoundError(f"{self.key_field}={item_id} not found.")
+            if any(item.get(k) != v for k, v in (expected or {}).items()):
+                raise ItemForbiddenError(f"Not allowed to modify {self.key_field}={item_id}.")
+            return item
 
         expr_parts = []
-        expr_names = {}
-        expr_values = {}
+        expr_names: Dict[str, str] = {}
+        expr_values: Dict[str, Any] = {}
 
         for i, (key, value) in enumerate(updates.items()):
             placeholder = f"#attr{i}"
@@ -62,33 +270,72 @@ class BaseService(ABC):
             expr_names[placeholder] = key
             expr_values[val_placeholder] = value
 
-        response = self.table.update_item(
-            Key={self.key_field: item_id},
-            UpdateExpression="SET " + ", ".join(expr_parts),
-            ExpressionAttributeNames=expr_names,
-            ExpressionAttributeValues=expr_values,
-            ReturnValues="ALL_NEW",
-        )
+        # botocore is imported lazily throughout the services to keep it out of cold start.
+        from botocore.exceptions import ClientError
+
+        condition = self._write_condition(expected, expr_names, expr_values)
+        try:
+            response = self.table.update_item(
+                Key={self.key_field: item_id},
+                UpdateExpression="SET " + ", ".join(expr_parts),
+                ConditionExpression=condition,
+                ExpressionAttributeNames=expr_names,
+                ExpressionAttributeValues=expr_values,
+                ReturnValues=return_values,
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+        except ClientError as e:
+            self._raise_condition_failed(e, item_id)
+        self.invalidate_cache()
+        content_versions.bump(self.table_name)
         return response.get("Attributes")
 
-    def delete(self, item_id: str) -> bool:
-        self.table.delete_item(Key={self.key_field: item_id})
+    def delete(self, item_id: str, *, expected: Optional[Dict[str, Any]] = None) -> bool:
+        """Single round trip: the item must exist (and match `expected`), else
+        ItemNotFoundError / ItemForbiddenError."""
+        self.pop(item_id, expected=expected)
         return True
 
+    def pop(self, item_id: str, *, expected: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """`delete()` that returns the deleted item."""
+        from botocore.exceptions import ClientError
+
+        expr_names: Dict[str, str] = {}
+        expr_values: Dict[str, Any] = {}
+        params: Dict[str, Any] = {
+            "Key": {self.key_field: item_id},
+            "ConditionExpression": self._write_condition(expected, expr_names, expr_values),
+            "ExpressionAttributeNames": expr_names,
+            "ReturnValues": "ALL_OLD",
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+        }
+        if expr_values:
+            params["ExpressionAttributeValues"] = expr_values
+        try:
+            response = self.table.delete_item(**params)
+        except ClientError as e:
+            self._raise_condition_failed(e, item_id)
+        self.invalidate_cache()
+        content_versions.bump(self.table_name)
+        return response["Attributes"]
+
     # ── Paginated scan ──────────────────────────────────────────
     def scan_page(
         self,
         *,
         limit: int = DEFAULT_PAGE_SIZE,
         cursor: Optional[str] = None,
+        projection: Optional[Sequence[str]] = None,
         **scan_kwargs,
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """Single-page scan with Limit + ExclusiveStartKey.
+        `projection` limits the returned attributes.
         Extra kwargs (FilterExpression, ExpressionAttributeValues, …) are
         forwarded directly to table.scan().
         Returns (items, next_cursor | None).
         """
         params: Dict[str, Any] = {"Limit": limit, **scan_kwargs}
+        _apply_projection(params, projection)
         if cursor:
             params["ExclusiveStartKey"] = decode_cursor(cursor)
 
@@ -122,9 +369,15 @@ class BaseService(ABC):
         limit: int = DEFAULT_PAGE_SIZE,
         cursor: Optional[str] = None,
         scan_forward: bool = True,
+        projection: Optional[Sequence[str]] = None,
+        codec: Optional[SignedCursor] = None,
         **query_kwargs,
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """Query a Global Secondary Index with pagination.
+        `projection` limits the returned attributes; keep it within the
+        index's projected attributes to avoid fetches from the base table.
+        `codec` replaces the plain base64 cursors with signed ones (decoding
+        raises InvalidCursorError).
         Returns (items, next_cursor | None).
         """
         params: Dict[str, Any] = {
@@ -134,10 +387,12 @@ class BaseService(ABC):
             "ScanIndexForward": scan_forward,
             **query_kwargs,
         }
+        _apply_projection(params, projection)
+        encode, decode = (codec.encode, codec.decode) if codec else (encode_cursor, decode_cursor)
         if cursor:
-            params["ExclusiveStartKey"] = decode_cursor(cursor)
+            params["ExclusiveStartKey"] = decode(cursor)
 
         response = self.table.query(**params)
         items = response.get("Items", [])
         last_key = response.get("LastEvaluatedKey")
-        return items, encode_cursor(last_key) if last_key else None
+        return items, encode(last_key) if last_key else None
@@ -1,9 +1,37 @@
+import logging
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
 from app.services.base_service import BaseService
-from app.models.blog import BlogPostCreate, BlogPostUpdate
+from app.services.search_service import search_service
+from app.services.tag_service import tag_service
+from app.models.blog import BLOG_COPY_FIELDS, BLOG_SUMMARY_FIELDS, COMMENT_STAT_FIELDS, BlogPostCreate, BlogPostUpdate
+from app.utils.cursor import SignedCursor
+
+logger = logging.getLogger(__name__)
+
+
+STATUS_PUBLISHED = "published"
+STATUS_DRAFT = "draft"
+# Constant partition key of gsi_all_created (every post, newest first).
+ENTITY_POST = "post"
+# post_status + created_at. DynamoDB cannot change a projection in place, so
+# a projection change ships as a new index name (seed_db.py creates it before
+# this code serves; the old one is dropped with --migrate-indexes).
+STATUS_INDEX = "gsi_status_created"
+
+
+def post_status(is_published: bool) -> str:
+    """Partition key of STATUS_INDEX, derived from `is_published`."""
+    return STATUS_PUBLISHED if is_published else STATUS_DRAFT
+
+
+def search_document(post: Dict[str, Any]) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """(doc_id, indexed fields, stored summary) for the search index."""
+    fields = {field: post.get(field) for field in ("title", "summary", "content", "tags")}
+    summary = {field: post[field] for field in BLOG_COPY_FIELDS if field in post}
+    return post["post_id"], fields, summary
 
 
 class BlogService(BaseService):
@@ -18,45 +46,159 @@ class BlogService(BaseService):
         return "post_id"
 
     def create_post(self, data: BlogPostCreate, author_email: str, author_name: str) -> Dict[str, Any]:
+        post = self.create(self._new_post(data, author_email, author_name))
+        self._sync_indexes(None, post)
+        return post
+
+    def create_posts(self, posts: List[BlogPostCreate], author_email: str, author_name: str) -> List[Dict[str, Any]]:
+        """Bulk `create_post`: one BatchWriteItem per 25 posts, then the
+        search/tag index updates post by post."""
+        created = self.create_many([self._new_post(data, author_email, author_name) for data in posts])
+        for post in created:
+            self._sync_indexes(None, post)
+        return created
+
+    @staticmethod
+    def _new_post(data: BlogPostCreate, author_email: str, author_name: str) -> Dict[str, Any]:
         now = datetime.utcnow().isoformat()
-        item = {
+        return {
             "post_id": str(uuid.uuid4()),
             "author_email": author_email,
             "author_name": author_name,
             "is_published": True,
+            "post_status": STATUS_PUBLISHED,
+            "entity_type": ENTITY_POST,
             "created_at": now,
             "updated_at": now,
+            "comment_count": 0,
             **data.model_dump(),
         }
-        return self.create(item)
 
-    def update_post(self, post_id: str, data: BlogPostUpdate) -> Optional[Dict[str, Any]]:
+    def update_post(self, post_id: str, data: BlogPostUpdate) -> Dict[str, Any]:
         updates = {k: v for k, v in data.model_dump().items() if v is not None}
+        if "is_published" in updates:
+            updates["post_status"] = post_status(updates["is_published"])
         updates["updated_at"] = datetime.utcnow().isoformat()
-        return self.update(post_id, updates)
+        old = self.update(post_id, updates, return_values="ALL_OLD")
+        post = {**old, **updates}
+        self._sync_indexes(old, post)
+        return post
+
+    def pop(self, item_id: str, *, expected: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        old = super().pop(item_id, expected=expected)
+        self._sync_indexes(old, None)
+        return old
+
+    def delete_many(self, ids: List[str]) -> List[Dict[str, Any]]:
+        deleted = super().delete_many(ids)
+        for old in deleted:
+            self._sync_indexes(old, None)
+        return deleted
 
     def get_published_posts(
         self, *, limit: int = 25, cursor: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        """Paginated scan filtered to published posts only.
-        DynamoDB Limit applies before the filter, so a page may return
-        fewer than `limit` items — callers should check next_cursor."""
-        items, next_cursor = self.scan_page(
+        """Newest-first query on STATUS_INDEX — reads only published
+        rows, so every page is full and ordering holds across pages."""
+        from boto3.dynamodb.conditions import Key
+
+        return self.query_index(
+            index_name=STATUS_INDEX,
+            key_condition=Key("post_status").eq(STATUS_PUBLISHED),
             limit=limit,
             cursor=cursor,
-            FilterExpression="is_published = :pub",
-            ExpressionAttributeValues={":pub": True},
+            scan_forward=False,
+            projection=BLOG_SUMMARY_FIELDS,
         )
-        items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return items, next_cursor
 
     def get_all_posts(
-        self, *, limit: int = 25, cursor: Optional[str] = None
+        self, *, limit: int = 25, cursor: Optional[str] = None, status: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        """Paginated scan of all posts (admin only)."""
-        items, next_cursor = self.scan_page(limit=limit, cursor=cursor)
-        items.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-        return items, next_cursor
+        """Newest-first posts including drafts (admin only). Every post is in
+        gsi_all_created; with `status`, the key condition on
+        STATUS_INDEX reads only that status. Ordering holds across
+        pages, and rows inserted meanwhile never shift later pages. Cursors
+        are signed and only valid for the same `status`."""
+        from boto3.dynamodb.conditions import Key
+
+        if status:
+            index_name, hash_key, hash_value = STATUS_INDEX, "post_status", status
+        else:
+            index_name, hash_key, hash_value = "gsi_all_created", "entity_type", ENTITY_POST
+        return self.query_index(
+            index_name=index_name,
+            key_condition=Key(hash_key).eq(hash_value),
+            limit=limit,
+            cursor=cursor,
+            scan_forward=False,
+            projection=BLOG_SUMMARY_FIELDS,
+            codec=SignedCursor(f"blog:{index_name}:{hash_value}", ["created_at", "post_id"], {hash_key: hash_value}),
+        )
+
+    # ── Tags ────────────────────────────────────────────────────
+    def get_posts_by_tag(
+        self, tag: str, *, limit: int = 25, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Newest-first published posts with `tag`, from the PostTags adjacency list."""
+        posts, next_cursor = tag_service.get_posts(tag, limit=limit, cursor=cursor)
+        return self._with_comment_stats(posts), next_cursor
+
+    def get_tag_counts(self) -> List[Dict[str, Any]]:
+        return tag_service.get_counts()
+
+    def rebuild_tag_index(self) -> int:
+        """Rewrite PostTags from BlogPosts. Returns the number of entries."""
+        return tag_service.rebuild(self._published_posts())
+
+    # ── Search ──────────────────────────────────────────────────
+    def search_posts(self, query: str, *, limit: int = 10) -> List[Dict[str, Any]]:
+        """BM25-ranked published posts (summary fields + `score`), served
+        from the search index without reading BlogPosts."""
+        hits = search_service.search(query, limit=limit)
+        return self._with_comment_stats([{**post, "score": round(score, 4)} for score, post in hits])
+
+    def rebuild_search_index(self) -> int:
+        """Re-index every published post. Returns the number indexed."""
+        return search_service.rebuild(self._search_documents)
+
+    def warm_search_index(self) -> int:
+        """Load the stored search index, building it first if none is stored."""
+        return search_service.warm(self._search_documents)
+
+    def _with_comment_stats(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill COMMENT_STAT_FIELDS into derived copies of posts with one
+        BatchGetItem (pages are at most 100 posts)."""
+        if not posts:
+            return posts
+        stats = self.get_many([post["post_id"] for post in posts], projection=COMMENT_STAT_FIELDS)
+        return [{**post, **(stat or {})} for post, stat in zip(posts, stats)]
+
+    def _search_documents(self):
+        return [search_document(post) for post in self._published_posts()]
+
+    def _published_posts(self) -> List[Dict[str, Any]]:
+        """Full scan, for index rebuilds only."""
+        from boto3.dynamodb.conditions import Attr
+
+        return self.scan_all(page_size=200, FilterExpression=Attr("post_status").eq(STATUS_PUBLISHED))
+
+    def _sync_indexes(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        """Keep the search index and PostTags in step with a write (`old` is
+        None for a create, `new` None for a delete). The post write has
+        already succeeded, so failures are logged, not raised; seed_db.py
+        --reindex repairs both."""
+        post_id = (new or old)["post_id"]
+        try:
+            if new and new.get("is_published"):
+                search_service.upsert(*search_document(new))
+            elif old and old.get("is_published"):
+                search_service.remove(post_id)
+        except Exception:
+            logger.exception("Search index: failed to update post %s", post_id)
+        try:
+            tag_service.sync_post(old, new)
+        except Exception:
+            logger.exception("Tag index: failed to update post %s", post_id)
 
 
 blog_service = BlogService()
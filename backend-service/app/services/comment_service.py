@@ -1,14 +1,35 @@
+import logging
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
-from boto3.dynamodb.conditions import Key
-
-from app.services.base_service import BaseService
+from app.config.database import db_client
+from app.services.base_service import BaseService, ItemForbiddenError, ItemNotFoundError
+from app.utils.content_version import content_versions
 from app.models.comment import CommentCreate
+from app.utils.metrics import MeteredTable, metered
+
+logger = logging.getLogger(__name__)
+
+POSTS_TABLE = "BlogPosts"
+EXCERPT_CHARS = 140
+
+
+def comment_preview(comment: Dict[str, Any]) -> Dict[str, Any]:
+    content = comment["content"]
+    return {
+        "comment_id": comment["comment_id"],
+        "display_name": comment["display_name"],
+        "excerpt": content if len(content) <= EXCERPT_CHARS else content[:EXCERPT_CHARS - 1].rstrip() + "…",
+        "created_at": comment["created_at"],
+    }
 
 
 class CommentService(BaseService):
+    """Comments, plus the counters they maintain on their post: every
+    create/delete also updates `comment_count`, `last_comment_at` and
+    `last_comment` on the BlogPosts item in the same transaction, so list
+    pages show them without one query per post."""
 
     @property
     def table_name(self) -> str:
@@ -30,12 +51,41 @@ class CommentService(BaseService):
             "content": data.content,
             "created_at": datetime.utcnow().isoformat(),
         }
-        return self.create(item)
+        from boto3.dynamodb.types import TypeSerializer
+        from botocore.exceptions import ClientError
+
+        serialize = TypeSerializer().serialize
+        try:
+            self._transact([
+                {"Put": {
+                    "TableName": self.table_name,
+                    "Item": {k: serialize(v) for k, v in item.items()},
+                }},
+                {"Update": {
+                    "TableName": POSTS_TABLE,
+                    "Key": {"post_id": {"S": post_id}},
+                    "UpdateExpression": "ADD comment_count :one SET last_comment_at = :at, last_comment = :preview",
+                    "ConditionExpression": "attribute_exists(post_id)",
+                    "ExpressionAttributeValues": {
+                        ":one": {"N": "1"},
+                        ":at": {"S": item["created_at"]},
+                        ":preview": serialize(comment_preview(item)),
+                    },
+                }},
+            ])
+        except ClientError as e:
+            if self._cancellation_codes(e)[1:2] == ["ConditionalCheckFailed"]:
+                raise ItemNotFoundError(f"post_id={post_id} not found.") from None
+            raise
+        self.invalidate_cache()
+        return item
 
     def get_by_post(
         self, post_id: str, *, limit: int = 50, cursor: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """Query GSI gsi_post_id — O(comments-for-post), not O(all-comments)."""
+        from boto3.dynamodb.conditions import Key
+
         return self.query_index(
             index_name="gsi_post_id",
             key_condition=Key("post_id").eq(post_id),
@@ -44,14 +94,95 @@ class CommentService(BaseService):
             scan_forward=True,
         )
 
-    def delete_comment(self, comment_id: str, user_id: str, is_admin: bool) -> bool:
-        comment = self.get_by_id(comment_id)
-        if not comment:
-            return False
-        if not is_admin and comment["user_id"] != user_id:
-            raise PermissionError("You can only delete your own comments.")
-        self.delete(comment_id)
+    def delete_comment(self, comment_id: str, user_id: str, is_admin: bool, post_id: str) -> bool:
+        """One transaction: the comment must belong to `post_id` (and, for
+        non-admins, to `user_id`); the post's `comment_count` drops by one.
+        Raises ItemNotFoundError / ItemForbiddenError."""
+        from boto3.dynamodb.types import TypeSerializer
+        from botocore.exceptions import ClientError
+
+        serialize = TypeSerializer().serialize
+        expected = {"post_id": post_id} if is_admin else {"post_id": post_id, "user_id": user_id}
+        names: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        condition = self._write_condition(expected, names, values)
+        delete = {"Delete": {
+            "TableName": self.table_name,
+            "Key": {self.key_field: {"S": comment_id}},
+            "ConditionExpression": condition,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": {k: serialize(v) for k, v in values.items()},
+            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+        }}
+        try:
+            self._transact([
+                delete,
+                {"Update": {
+                    "TableName": POSTS_TABLE,
+                    "Key": {"post_id": {"S": post_id}},
+                    "UpdateExpression": "ADD comment_count :minus",
+                    "ConditionExpression": "attribute_exists(post_id)",
+                    "ExpressionAttributeValues": {":minus": {"N": "-1"}},
+                }},
+            ])
+        except ClientError as e:
+            codes = self._cancellation_codes(e)
+            if codes[:1] == ["ConditionalCheckFailed"]:
+                old = e.response["CancellationReasons"][0].get("Item")
+                if old is None or old.get("post_id", {}).get("S") != post_id:
+                    raise ItemNotFoundError(f"comment_id={comment_id} not found.") from None
+                raise ItemForbiddenError(f"Not allowed to modify comment_id={comment_id}.") from None
+            if codes[1:2] != ["ConditionalCheckFailed"]:
+                raise
+            # The post itself is gone: delete the orphaned comment on its own.
+            self.delete(comment_id, expected=expected)
+            return True
+        self.invalidate_cache()
+        self._replace_preview(post_id, comment_id)
         return True
 
+    def _replace_preview(self, post_id: str, deleted_id: str) -> None:
+        """If the deleted comment is the post's `last_comment`, point it at
+        the newest remaining one (or remove it). Conditional on the preview
+        still naming the deleted comment, so it is a no-op otherwise."""
+        from boto3.dynamodb.conditions import Key
+        from botocore.exceptions import ClientError
+
+        # gsi_post_id is eventually consistent and may still list the deleted comment.
+        newer, _ = self.query_index(
+            index_name="gsi_post_id", key_condition=Key("post_id").eq(post_id), limit=2, scan_forward=False
+        )
+        latest = next((c for c in newer if c["comment_id"] != deleted_id), None)
+        params: Dict[str, Any] = {
+            "Key": {"post_id": post_id},
+            "ConditionExpression": "last_comment.comment_id = :deleted",
+            "ExpressionAttributeValues": {":deleted": deleted_id},
+        }
+        if latest:
+            params["UpdateExpression"] = "SET last_comment = :preview, last_comment_at = :at"
+            params["ExpressionAttributeValues"].update({":preview": comment_preview(latest), ":at": latest["created_at"]})
+        else:
+            params["UpdateExpression"] = "REMOVE last_comment, last_comment_at"
+        try:
+            MeteredTable(db_client.get_table(POSTS_TABLE)).update_item(**params)
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                logger.exception("Failed to refresh last_comment on post %s", post_id)
+            return
+        content_versions.bump(POSTS_TABLE)
+
+    @staticmethod
+    def _transact(actions: List[Dict[str, Any]]) -> None:
+        client = db_client.resource.meta.client
+        metered("transact_write_items", client.transact_write_items, TransactItems=actions)
+        content_versions.bump(*sorted({spec["TableName"] for action in actions for spec in action.values()}))
+
+    @staticmethod
+    def _cancellation_codes(error: Exception) -> List[str]:
+        """Per-action reason codes of a TransactionCanceledException, else []."""
+        if error.response["Error"]["Code"] != "TransactionCanceledException":
+            return []
+        return [reason.get("Code") for reason in error.response.get("CancellationReasons", [])]
+
 
 comment_service = CommentService()
@@ -1,12 +1,20 @@
+import functools
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 
+from app.config.settings import settings
 from app.services.base_service import BaseService
+from app.utils.cache import TTLCache
+from app.utils.content_version import content_versions
 from app.models.experience import ExperienceCreate, ExperienceUpdate
 
 
 class ExperienceService(BaseService):
 
+    def __init__(self):
+        self.cache = TTLCache(max_entries=settings.cache_max_entries, ttl_seconds=settings.cache_ttl_seconds)
+        content_versions.subscribe(self.table_name, functools.partial(self.invalidate_cache, broadcast=False))
+
     @property
     def table_name(self) -> str:
         return "Experiences"
@@ -19,12 +27,19 @@ class ExperienceService(BaseService):
         item = {"experience_id": str(uuid.uuid4()), **data.model_dump()}
         return self.create(item)
 
-    def update_experience(self, exp_id: str, data: ExperienceUpdate) -> Optional[Dict[str, Any]]:
+    def create_experiences(self, items: List[ExperienceCreate]) -> List[Dict[str, Any]]:
+        return self.create_many([{"experience_id": str(uuid.uuid4()), **data.model_dump()} for data in items])
+
+    def update_experience(self, exp_id: str, data: ExperienceUpdate) -> Dict[str, Any]:
         updates = {k: v for k, v in data.model_dump().items() if v is not None}
         return self.update(exp_id, updates)
 
     def get_ordered(self) -> List[Dict[str, Any]]:
-        """Small-table full scan (experiences are bounded < 50 rows)."""
+        """Small-table full scan (experiences are bounded < 50 rows), cached until
+        the next write or TTL expiry."""
+        return self.cached("ordered", self._scan_ordered)
+
+    def _scan_ordered(self) -> List[Dict[str, Any]]:
         items = self.scan_all()
         return sorted(items, key=lambda x: int(x.get("order", 0)))
 
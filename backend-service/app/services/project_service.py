@@ -1,12 +1,20 @@
+import functools
 import uuid
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 
+from app.config.settings import settings
 from app.services.base_service import BaseService
+from app.utils.cache import TTLCache
+from app.utils.content_version import content_versions
 from app.models.project import ProjectCreate, ProjectUpdate
 
 
 class ProjectService(BaseService):
 
+    def __init__(self):
+        self.cache = TTLCache(max_entries=settings.cache_max_entries, ttl_seconds=settings.cache_ttl_seconds)
+        content_versions.subscribe(self.table_name, functools.partial(self.invalidate_cache, broadcast=False))
+
     @property
     def table_name(self) -> str:
         return "Projects"
@@ -19,12 +27,19 @@ class ProjectService(BaseService):
         item = {"project_id": str(uuid.uuid4()), **data.model_dump()}
         return self.create(item)
 
-    def update_project(self, proj_id: str, data: ProjectUpdate) -> Optional[Dict[str, Any]]:
+    def create_projects(self, items: List[ProjectCreate]) -> List[Dict[str, Any]]:
+        return self.create_many([{"project_id": str(uuid.uuid4()), **data.model_dump()} for data in items])
+
+    def update_project(self, proj_id: str, data: ProjectUpdate) -> Dict[str, Any]:
         updates = {k: v for k, v in data.model_dump().items() if v is not None}
         return self.update(proj_id, updates)
 
     def get_ordered(self) -> List[Dict[str, Any]]:
-        """Small-table full scan (projects are bounded < 50 rows)."""
+        """Small-table full scan (projects are bounded < 50 rows), cached until
+        the next write or TTL expiry."""
+        return self.cached("ordered", self._scan_ordered)
+
+    def _scan_ordered(self) -> List[Dict[str, Any]]:
         items = self.scan_all()
         return sorted(items, key=lambda x: int(x.get("order", 0)))
 
@@ -0,0 +1,431 @@
+"""
+Persistence and freshness for the blog search index (app/utils/search_index.py).
+
+The index lives in the SearchIndex table (key: index_name + part) as a
+snapshot plus a log of changes made since:
+
+  part = "manifest"              {version, snapshot_id, parts, seq, docs, bytes, updated_at}
+  part = "op#000000000042"       {data: <compressed change>}     one per post write
+  part = "v0000000007#0003"      {data: <compressed snapshot chunk>}, CHUNK_BYTES each
+
+A post write appends one small op item at the next sequence number. It is a
+transaction: the slot must be free and the manifest still at the version the
+writer has loaded, so concurrent writers (other Lambdas, other workers) get
+a total order and nobody appends to a snapshot that was just replaced.
+
+Every COMPACT_AFTER ops the writer folds them into a new snapshot: it puts
+the chunks of version N+1, moves the manifest from N to N+1 with a
+conditional put (recording the last op it includes as `seq`), then deletes
+the old chunks and the folded ops.
+
+Readers keep the index in memory and, at most every
+`search_index_refresh_seconds`, read the manifest and any newer ops (two
+small calls). A snapshot is downloaded only when its version changes, and
+the last one is also written to `search_index_cache_path`, so warm Lambda
+invocations, sibling workers and restarted processes can skip that download.
+
+Locking: `_lock` guards the in-memory index and is held only for in-memory
+work (searching, applying ops, swapping in a loaded index). DynamoDB reads
+and writes run under `_io_lock`, which orders this process's loaders and
+writers, so searches never wait on I/O. A search that finds the index due
+for a refresh refreshes it unless another thread already is, and otherwise
+serves the current copy. Building from BlogPosts (a full scan) is never done
+on the request path: worker pre-warm (`warm`) and seed_db.py do it.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from app.config.database import db_client
+from app.config.settings import settings
+from app.services.base_service import AsyncServiceProxy, batch_write
+from app.utils.metrics import MeteredTable, metered
+from app.utils.search_index import SearchIndex
+from app.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = 350 * 1024  # DynamoDB items max out at 400 KB
+COMPACT_AFTER = 100       # ops appended before they are folded into a snapshot
+MAX_ATTEMPTS = 8
+MANIFEST = "manifest"
+_OP_PREFIX = "op#"
+_FILE_MAGIC = b"BSI1"
+
+Document = Tuple[str, Dict[str, Any], Dict[str, Any]]  # (doc_id, fields, payload)
+
+
+class IndexConflictError(RuntimeError):
+    """Another writer got there first (op slot taken or manifest moved)."""
+
+
+class SearchIndexUnavailableError(RuntimeError):
+    """No index is stored yet — callers should answer 503."""
+
+
+class _StaleManifest(Exception):
+    """The chunks named by a manifest were deleted by a newer snapshot."""
+
+
+def _op_part(seq: int) -> str:
+    return f"{_OP_PREFIX}{seq:012d}"
+
+
+def _chunk_prefix(version: int) -> str:
+    return f"v{version:010d}#"
+
+
+def _apply_op(index: SearchIndex, op: Dict[str, Any]) -> None:
+    if op["op"] == "add":
+        index.add_terms(op["id"], op["tf"], op["post"])
+    else:
+        index.remove(op["id"])
+
+
+class SearchService:
+
+    TABLE_NAME = "SearchIndex"
+
+    def __init__(
+        self,
+        index_name: str,
+        *,
+        cache_path: str,
+        refresh_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.index_name = index_name
+        self.cache_path = cache_path
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._lock = threading.Lock()      # in-memory state only
+        self._io_lock = threading.RLock()  # DynamoDB loads and writes
+        self._index: Optional[SearchIndex] = None
+        self._version = 0    # snapshot version loaded
+        self._parts = 0      # chunks in that snapshot
+        self._base_seq = 0   # last op folded into that snapshot
+        self._seq = 0        # last op applied to self._index
+        self._checked_at = float("-inf")
+
+    @property
+    def table(self):
+        return MeteredTable(db_client.get_table(self.TABLE_NAME))
+
+    @functools.cached_property
+    def aio(self) -> AsyncServiceProxy:
+        return AsyncServiceProxy(self)
+
+    # ── Reads ───────────────────────────────────────────────────
+    def search(self, query: str, *, limit: int) -> List[Tuple[float, Dict[str, Any]]]:
+        if self._index is None:
+            with self._io_lock:
+                if self._index is None and self._sync() is None:
+                    raise SearchIndexUnavailableError("The search index has not been built yet.")
+        elif self._clock() - self._checked_at >= self.refresh_seconds and self._io_lock.acquire(blocking=False):
+            try:
+                self._sync()
+            finally:
+                self._io_lock.release()
+        with self._lock:
+            if self._index is None:
+                raise SearchIndexUnavailableError("The search index has not been built yet.")
+            return self._index.search(query, limit)
+
+    def warm(self, source: Callable[[], Iterable[Document]]) -> int:
+        """Load the stored index, or build and store one from `source()`
+        when there is none. Returns the number of documents."""
+        with self._io_lock:
+            index = self._sync()
+            if index is not None:
+                return len(index)
+        return self.rebuild(source)
+
+    def get_manifest(self) -> Optional[Dict[str, Any]]:
+        response = self.table.get_item(
+            Key={"index_name": self.index_name, "part": MANIFEST}, ConsistentRead=True
+        )
+        return response.get("Item")
+
+    # ── Writes ──────────────────────────────────────────────────
+    def upsert(self, doc_id: str, fields: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        self._append({"op": "add", "id": doc_id, "tf": SearchIndex.analyze(fields), "post": payload})
+
+    def remove(self, doc_id: str) -> None:
+        self._append({"op": "remove", "id": doc_id})
+
+    def rebuild(self, source: Callable[[], Iterable[Document]]) -> int:
+        """Replace the stored index with one built from `source()`. Returns
+        the number of documents indexed. The scan and the build hold no
+        lock; only publishing the result does."""
+        for _ in range(MAX_ATTEMPTS):
+            manifest = self.get_manifest()
+            # Ops appended from here on may be missing from `source()`;
+            # they stay in the log and are re-applied on top.
+            seq = max(int(manifest["seq"]) if manifest else 0, self._last_op_seq())
+            index = SearchIndex.build(source())
+            with self._io_lock:
+                try:
+                    self._save_snapshot(index, seq, manifest)
+                except IndexConflictError:
+                    continue
+                self._catch_up()
+                return len(index)
+        raise IndexConflictError("Search index kept changing during rebuild.")
+
+    def _append(self, op: Dict[str, Any]) -> None:
+        """Log `op` at the next sequence number and apply it locally. Until
+        an index has been stored, writes are no-ops: the first build reads
+        BlogPosts, which already includes them."""
+        with self._io_lock:
+            for _ in range(MAX_ATTEMPTS):
+                if self._index is None and self._sync() is None:
+                    return
+                seq = self._seq + 1
+                try:
+                    self._put_op(seq, op)
+                except IndexConflictError:
+                    if self._sync() is None:
+                        return
+                    continue
+                with self._lock:
+                    _apply_op(self._index, op)
+                    self._seq = seq
+                if seq - self._base_seq >= COMPACT_AFTER:
+                    self._compact()
+                return
+            raise IndexConflictError("Search index append kept conflicting.")
+
+    def _put_op(self, seq: int, op: Dict[str, Any]) -> None:
+        from botocore.exceptions import ClientError
+
+        client = db_client.resource.meta.client
+        try:
+            metered(
+                "transact_write_items",
+                client.transact_write_items,
+                TransactItems=[
+                    {"Put": {
+                        "TableName": self.TABLE_NAME,
+                        "Item": {
+                            "index_name": {"S": self.index_name},
+                            "part": {"S": _op_part(seq)},
+                            "data": {"B": zlib.compress(dumps(op))},
+                        },
+                        "ConditionExpression": "attribute_not_exists(#p)",
+                        "ExpressionAttributeNames": {"#p": "part"},
+                    }},
+                    {"ConditionCheck": {
+                        "TableName": self.TABLE_NAME,
+                        "Key": {"index_name": {"S": self.index_name}, "part": {"S": MANIFEST}},
+                        "ConditionExpression": "#v = :v",
+                        "ExpressionAttributeNames": {"#v": "version"},
+                        "ExpressionAttributeValues": {":v": {"N": str(self._version)}},
+                    }},
+                ],
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            raise IndexConflictError(f"Search index op {seq} was not appended.") from None
+
+    def _compact(self) -> None:
+        """Fold the log into a new snapshot. Losing the race is fine: the
+        winner's snapshot covers the same ops."""
+        try:
+            self._save_snapshot(self._index, self._seq, {"version": self._version, "parts": self._parts})
+        except IndexConflictError:
+            self._checked_at = float("-inf")
+        except Exception:
+            # The ops are durable; the next write retries the compaction.
+            logger.exception("Search index compaction failed")
+
+    # ── Storage (callers hold _io_lock) ─────────────────────────
+    def _sync(self) -> Optional[SearchIndex]:
+        """Bring the in-memory index up to the stored state; None when no
+        usable index is stored. A new snapshot is loaded and caught up
+        before it is swapped in."""
+        for _ in range(MAX_ATTEMPTS):
+            manifest = self.get_manifest()
+            try:
+                if manifest is None:
+                    self._install(None, 0, 0, 0, 0)
+                elif self._index is None or int(manifest["version"]) != self._version:
+                    index = self._load(manifest)
+                    base_seq = seq = int(manifest["seq"])
+                    if index is not None:
+                        for seq, op in self._read_ops(base_seq):
+                            _apply_op(index, op)
+                    self._install(index, int(manifest["version"]), int(manifest["parts"]), base_seq, seq)
+                else:
+                    self._catch_up()
+            except _StaleManifest:
+                continue
+            self._checked_at = self._clock()
+            return self._index
+        raise IndexConflictError("Search index kept changing while loading.")
+
+    def _install(self, index: Optional[SearchIndex], version: int, parts: int, base_seq: int, seq: int) -> None:
+        with self._lock:
+            self._index, self._version, self._parts = index, version, parts
+            self._base_seq, self._seq = base_seq, seq
+
+    def _load(self, manifest: Dict[str, Any]) -> Optional[SearchIndex]:
+        """The manifest's snapshot, from the local file when it matches.
+        None if it is in an incompatible format; _StaleManifest if a newer
+        snapshot already replaced it."""
+        blob = self._read_cache_file(manifest["snapshot_id"])
+        if blob is None:
+            blob = self._read_chunks(int(manifest["version"]), int(manifest["parts"]))
+            if blob is None:
+                raise _StaleManifest
+            self._write_cache_file(manifest["snapshot_id"], blob)
+        return SearchIndex.loads(blob)
+
+    def _query_parts(self, key_condition, **params: Any) -> Iterable[Dict[str, Any]]:
+        params.update(KeyConditionExpression=key_condition, ConsistentRead=True)
+        while True:
+            response = self.table.query(**params)
+            yield from response.get("Items", [])
+            if "LastEvaluatedKey" not in response:
+                return
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _catch_up(self) -> None:
+        """Apply logged ops newer than the local index."""
+        ops = self._read_ops(self._seq)
+        if ops:
+            with self._lock:
+                for seq, op in ops:
+                    _apply_op(self._index, op)
+                    self._seq = seq
+
+    def _read_ops(self, after: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """(seq, op) of the logged ops after `after`, in order."""
+        from boto3.dynamodb.conditions import Key
+
+        condition = Key("index_name").eq(self.index_name) & Key("part").between(
+            _op_part(after + 1), _OP_PREFIX + "~"
+        )
+        return [
+            (int(item["part"][len(_OP_PREFIX):]), orjson.loads(zlib.decompress(bytes(item["data"]))))
+            for item in self._query_parts(condition)
+        ]
+
+    def _last_op_seq(self) -> int:
+        from boto3.dynamodb.conditions import Key
+
+        response = self.table.query(
+            KeyConditionExpression=Key("index_name").eq(self.index_name) & Key("part").begins_with(_OP_PREFIX),
+            ScanIndexForward=False,
+            Limit=1,
+            ConsistentRead=True,
+        )
+        items = response.get("Items", [])
+        return int(items[0]["part"][len(_OP_PREFIX):]) if items else 0
+
+    def _read_chunks(self, version: int, parts: int) -> Optional[bytes]:
+        """None if the chunks are gone (a newer snapshot replaced them)."""
+        from boto3.dynamodb.conditions import Key
+
+        condition = Key("index_name").eq(self.index_name) & Key("part").begins_with(_chunk_prefix(version))
+        chunks = [bytes(item["data"]) for item in self._query_parts(condition)]
+        return b"".join(chunks) if len(chunks) == parts else None
+
+    def _save_snapshot(self, index: SearchIndex, seq: int, manifest: Optional[Dict[str, Any]]) -> None:
+        """Publish `index` (covering ops up to `seq`) as the version after
+        `manifest`'s. IndexConflictError if the manifest has moved since."""
+        from boto3.dynamodb.conditions import Key
+        from botocore.exceptions import ClientError
+
+        old_version = int(manifest["version"]) if manifest else 0
+        old_parts = int(manifest["parts"]) if manifest else 0
+        version = old_version + 1
+        snapshot_id = uuid.uuid4().hex
+        blob = index.dumps()
+        chunks = [blob[i:i + CHUNK_BYTES] for i in range(0, len(blob), CHUNK_BYTES)] or [b""]
+        prefix = _chunk_prefix(version)
+        for i, chunk in enumerate(chunks):
+            self.table.put_item(Item={"index_name": self.index_name, "part": f"{prefix}{i:04d}", "data": chunk})
+        try:
+            self.table.put_item(
+                Item={
+                    "index_name": self.index_name,
+                    "part": MANIFEST,
+                    "version": version,
+                    "snapshot_id": snapshot_id,
+                    "parts": len(chunks),
+                    "seq": seq,
+                    "docs": len(index),
+                    "bytes": len(blob),
+                    "updated_at": datetime.utcnow().isoformat(),
+                },
+                ConditionExpression="attribute_not_exists(#v) OR #v = :v",
+                ExpressionAttributeNames={"#v": "version"},
+                ExpressionAttributeValues={":v": old_version},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            self._delete_parts([f"{prefix}{i:04d}" for i in range(len(chunks))])
+            raise IndexConflictError(f"Search index moved past v{old_version}.") from None
+
+        self._install(index, version, len(chunks), seq, seq)
+        self._checked_at = self._clock()
+        self._write_cache_file(snapshot_id, blob)
+
+        old_prefix = _chunk_prefix(old_version)
+        folded = Key("index_name").eq(self.index_name) & Key("part").between(_OP_PREFIX, _op_part(seq))
+        self._delete_parts(
+            [f"{old_prefix}{i:04d}" for i in range(old_parts)]
+            + [item["part"] for item in self._query_parts(folded, ProjectionExpression="part")]
+        )
+
+    def _delete_parts(self, parts: List[str]) -> None:
+        batch_write(
+            self.TABLE_NAME,
+            [{"DeleteRequest": {"Key": {"index_name": self.index_name, "part": part}}} for part in parts],
+        )
+
+    # ── Local cache file ────────────────────────────────────────
+    # The file is keyed by the manifest's random snapshot_id rather than its
+    # version: a recreated table (DynamoDB Local runs -inMemory) restarts
+    # versions at 1.
+    def _read_cache_file(self, snapshot_id: str) -> Optional[bytes]:
+        if not self.cache_path:
+            return None
+        header = _FILE_MAGIC + snapshot_id.encode()
+        try:
+            with open(self.cache_path, "rb") as f:
+                if f.read(len(header)) != header:
+                    return None
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_cache_file(self, snapshot_id: str, blob: bytes) -> None:
+        """Atomic replace, so concurrent workers never read a torn file."""
+        if not self.cache_path:
+            return
+        tmp = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_FILE_MAGIC + snapshot_id.encode() + blob)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            logger.warning("Could not write search index cache file %s", self.cache_path, exc_info=True)
+
+
+search_service = SearchService(
+    "blog",
+    cache_path=settings.search_index_cache_path,
+    refresh_seconds=settings.search_index_refresh_seconds,
+)
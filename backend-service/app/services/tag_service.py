@@ -0,0 +1,158 @@
+"""
+Tag → post adjacency list for published blog posts (PostTags table).
+
+  tag = "RAG", created_post = "2024-03-01T10:00:00#<post_id>"   {<BLOG_COPY_FIELDS>}
+  tag = "#counts", created_post = "#counts"                      {"n#RAG": 12, "n#AWS": 7, ...}
+
+One entry per (tag, published post), sorted by `created_at`, with the
+list-page fields copied in, so `/api/blog?tag=` is a single query. The
+counts item is the precomputed aggregate behind `/api/blog/tags`: every
+tag is a top-level number attribute, adjusted with `ADD` in the same
+transaction that writes the entries.
+"""
+
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config.database import db_client
+from app.models.blog import BLOG_COPY_FIELDS
+from app.services.base_service import AsyncServiceProxy, DEFAULT_PAGE_SIZE, batch_write, decode_cursor, encode_cursor
+from app.utils.content_version import content_versions
+from app.utils.metrics import MeteredTable, metered
+
+COUNTS_KEY = {"tag": "#counts", "created_post": "#counts"}
+COUNT_PREFIX = "n#"
+MAX_TRANSACT_ITEMS = 100
+
+
+def post_tags(post: Optional[Dict[str, Any]]) -> Set[str]:
+    """Tags a post is listed under: none unless it is published."""
+    if not post or not post.get("is_published"):
+        return set()
+    tags = {tag.strip() for tag in post.get("tags") or []}
+    return tags - {"", COUNTS_KEY["tag"]}
+
+
+def sort_key(post: Dict[str, Any]) -> str:
+    return f"{post['created_at']}#{post['post_id']}"
+
+
+class TagService:
+
+    TABLE_NAME = "PostTags"
+
+    @property
+    def table(self):
+        return MeteredTable(db_client.get_table(self.TABLE_NAME))
+
+    @functools.cached_property
+    def aio(self) -> AsyncServiceProxy:
+        return AsyncServiceProxy(self)
+
+    # ── Reads ───────────────────────────────────────────────────
+    def get_posts(
+        self, tag: str, *, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Published posts carrying `tag`, newest first (paginated)."""
+        from boto3.dynamodb.conditions import Key
+
+        params: Dict[str, Any] = {
+            "KeyConditionExpression": Key("tag").eq(tag.strip()),
+            "ScanIndexForward": False,
+            "Limit": limit,
+        }
+        if cursor:
+            params["ExclusiveStartKey"] = decode_cursor(cursor)
+        response = self.table.query(**params)
+        items = [{field: item[field] for field in BLOG_COPY_FIELDS if field in item} for item in response.get("Items", [])]
+        last_key = response.get("LastEvaluatedKey")
+        return items, encode_cursor(last_key) if last_key else None
+
+    def get_counts(self) -> List[Dict[str, Any]]:
+        """Tags with at least one published post, most used first."""
+        item = self.table.get_item(Key=COUNTS_KEY).get("Item") or {}
+        counts = [
+            {"tag": name[len(COUNT_PREFIX):], "count": int(value)}
+            for name, value in item.items()
+            if name.startswith(COUNT_PREFIX) and value > 0
+        ]
+        counts.sort(key=lambda c: (-c["count"], c["tag"]))
+        return counts
+
+    # ── Writes ──────────────────────────────────────────────────
+    def sync_post(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        """Bring the entries and counts from `old` (None for a new post) to
+        `new` (None for a deleted post) in one transaction."""
+        from boto3.dynamodb.types import TypeSerializer
+
+        serializer = TypeSerializer()
+        old_tags, new_tags = post_tags(old), post_tags(new)
+        if not old_tags and not new_tags:
+            return
+
+        def key(tag: str, post: Dict[str, Any]) -> Dict[str, Any]:
+            return {"tag": {"S": tag}, "created_post": {"S": sort_key(post)}}
+
+        actions: List[Dict[str, Any]] = []
+        for tag in sorted(old_tags - new_tags):
+            actions.append({"Delete": {"TableName": self.TABLE_NAME, "Key": key(tag, old)}})
+        summary = {field: new[field] for field in BLOG_COPY_FIELDS if field in new} if new_tags else {}
+        for tag in sorted(new_tags):
+            item = {name: serializer.serialize(value) for name, value in summary.items()}
+            actions.append({"Put": {"TableName": self.TABLE_NAME, "Item": {**item, **key(tag, new)}}})
+
+        deltas = [(tag, 1) for tag in sorted(new_tags - old_tags)] + [(tag, -1) for tag in sorted(old_tags - new_tags)]
+        if deltas:
+            names = {f"#n{i}": COUNT_PREFIX + tag for i, (tag, _) in enumerate(deltas)}
+            values = {f":d{i}": {"N": str(delta)} for i, (_, delta) in enumerate(deltas)}
+            actions.append({"Update": {
+                "TableName": self.TABLE_NAME,
+                "Key": {name: {"S": value} for name, value in COUNTS_KEY.items()},
+                "UpdateExpression": "ADD " + ", ".join(f"#n{i} :d{i}" for i in range(len(deltas))),
+                "ExpressionAttributeNames": names,
+                "ExpressionAttributeValues": values,
+            }})
+
+        client = db_client.resource.meta.client
+        # Posts with more tags than one transaction holds are written in
+        # several; the counts update goes last.
+        for start in range(0, len(actions), MAX_TRANSACT_ITEMS):
+            metered("transact_write_items", client.transact_write_items,
+                    TransactItems=actions[start:start + MAX_TRANSACT_ITEMS])
+        content_versions.bump(self.TABLE_NAME)
+
+    def rebuild(self, posts: Iterable[Dict[str, Any]]) -> int:
+        """Replace every entry and the counts with ones derived from
+        `posts`. Returns the number of entries written."""
+        entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        counts: Dict[str, int] = {}
+        for post in posts:
+            summary = {field: post[field] for field in BLOG_COPY_FIELDS if field in post}
+            for tag in post_tags(post):
+                entries[(tag, sort_key(post))] = {**summary, "tag": tag, "created_post": sort_key(post)}
+                counts[tag] = counts.get(tag, 0) + 1
+
+        stale = []
+        params: Dict[str, Any] = {"ProjectionExpression": "#t, created_post", "ExpressionAttributeNames": {"#t": "tag"}}
+        while True:
+            response = self.table.scan(**params)
+            stale.extend(
+                {"tag": item["tag"], "created_post": item["created_post"]}
+                for item in response.get("Items", [])
+                if item["tag"] != COUNTS_KEY["tag"] and (item["tag"], item["created_post"]) not in entries
+            )
+            if "LastEvaluatedKey" not in response:
+                break
+            params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        batch_write(
+            self.TABLE_NAME,
+            [{"DeleteRequest": {"Key": key}} for key in stale]
+            + [{"PutRequest": {"Item": item}} for item in entries.values()],
+        )
+        self.table.put_item(Item={**COUNTS_KEY, **{COUNT_PREFIX + tag: n for tag, n in counts.items()}})
+        content_versions.bump(self.TABLE_NAME)
+        return len(entries)
+
+
+tag_service = TagService()
@@ -0,0 +1,78 @@
+"""
+Per-table content versions, the validators behind the public ETags.
+
+One item in the ContentVersions table holds a counter per table:
+
+  scope = "tables"   {"BlogPosts": 412, "PostTags": 97, "Projects": 8, ...}
+
+Every write to a table (BaseService writes, `batch_write`, and the services
+that write around them) bumps that table's counter with `ADD` once the write
+has succeeded. A cacheable GET route reads the item first, with one
+consistent GetItem, and derives its ETag from the counters of the tables it
+renders from (app/utils/http_cache.py). A client that still holds that ETag
+gets 304 before any of the route's queries, model building or rendering.
+Reading the item also clears the in-process cache of every subscribed
+table whose counter moved since the last read. Without that, a cache
+filled before a write on another container would be rendered under the new
+version's ETag and revalidated until the next write.
+
+Bumping after the write is what keeps a 304 safe. A response rendered
+between the write and the bump carries the old counter, so the next request
+gets a fresh 200 instead of revalidating stale content. The single item
+takes every bump, which is fine for a site written by its admins; it would
+not be for write-heavy tables.
+"""
+
+import threading
+from typing import Callable, Dict, List
+
+from app.config.database import db_client
+from app.utils.metrics import MeteredTable
+
+TABLE_NAME = "ContentVersions"
+SCOPE_KEY = {"scope": "tables"}
+
+
+class ContentVersions:
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Callable[[], None]]] = {}
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, table: str, handler: Callable[[], None]) -> None:
+        """Run `handler` when `current()` finds that `table` was written
+        since the previous read (and on the first read)."""
+        self._handlers.setdefault(table, []).append(handler)
+
+    @property
+    def table(self):
+        return MeteredTable(db_client.get_table(TABLE_NAME))
+
+    def bump(self, *tables: str) -> None:
+        """Record a completed write to each of `tables`."""
+        if not tables:
+            return
+        names = {f"#t{i}": table for i, table in enumerate(tables)}
+        self.table.update_item(
+            Key=SCOPE_KEY,
+            UpdateExpression="ADD " + ", ".join(f"{name} :one" for name in names),
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues={":one": 1},
+        )
+
+    def current(self) -> Dict[str, int]:
+        """Counter of every table written so far; missing tables are at 0."""
+        item = self.table.get_item(Key=SCOPE_KEY, ConsistentRead=True).get("Item") or {}
+        versions = {name: int(value) for name, value in item.items() if name != "scope"}
+        with self._lock:
+            moved = [table for table in self._handlers if self._seen.get(table) != versions.get(table, 0)]
+            for table in moved:
+                self._seen[table] = versions.get(table, 0)
+        for table in moved:
+            for handler in self._handlers[table]:
+                handler()
+        return versions
+
+
+content_versions = ContentVersions()
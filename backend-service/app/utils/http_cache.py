@@ -0,0 +1,87 @@
+import hashlib
+from typing import Any, Dict, Optional, Sequence
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.config.database import db_client
+from app.utils.content_version import content_versions
+from app.utils.serialization import FastJSONResponse, dumps
+
+# Cache-Control policies for public GET routes. Browsers and a CDN may reuse a
+# response for max-age, then revalidate with If-None-Match. Routes derive the
+# ETag from the content versions of the tables they read (`version_etag`)
+# before reading anything else, so a 304 costs one GetItem.
+CACHE_PUBLIC_LIST = "public, max-age=60, stale-while-revalidate=300"
+CACHE_PUBLIC_FEED = "public, max-age=30, stale-while-revalidate=120"
+CACHE_PUBLIC_ITEM = "public, max-age=60, stale-while-revalidate=300"
+# Per-user responses: never stored by shared caches, always revalidated.
+CACHE_PRIVATE = "private, no-cache"
+# Part of every version ETag. Bump it when a release changes what a route
+# renders from the same data, so clients do not revalidate the old shape.
+RESPONSE_FORMAT = 1
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag: digest of the exact response bytes. For responses that
+    are not a function of table contents alone (search results, which each
+    instance's index catches up to on its own schedule)."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+async def version_etag(request: Request, tables: Sequence[str], variant: str = "") -> str:
+    """Strong ETag for this URL from the content versions of `tables`, read
+    before any other DynamoDB call of the route. `variant` covers anything
+    else the body depends on (e.g. the signed-in user). The URL is part of
+    the tag, so it is unique across routes as well as within one."""
+    versions = await db_client.run(content_versions.current)
+    parts = [str(RESPONSE_FORMAT), request.url.path, request.url.query, variant]
+    parts += [f"{table}={versions.get(table, 0)}" for table in sorted(tables)]
+    return '"' + hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _headers(etag: str, cache_control: str, vary: Optional[str]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if vary:
+        headers["Vary"] = vary
+    return headers
+
+
+def not_modified(
+    request: Request, etag: str, *, cache_control: str, vary: Optional[str] = None
+) -> Optional[Response]:
+    """304 when the client already holds `etag`, else None. Call it with the
+    `version_etag` before the route's reads."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=_headers(etag, cache_control, vary))
+    return None
+
+
+def cacheable_response(
+    request: Request,
+    content: Any,
+    *,
+    cache_control: str,
+    vary: Optional[str] = None,
+    etag: Optional[str] = None,
+) -> Response:
+    """Render `content` tagged with `etag` (the route's `version_etag`), or
+    with a digest of the body when none is given, and answer 304 when the
+    client already holds it. Pass `vary` when the content depends on request
+    headers (e.g. the caller's credentials)."""
+    body = dumps(content)
+    etag = etag or etag_for(body)
+    response = not_modified(request, etag, cache_control=cache_control, vary=vary)
+    if response is not None:
+        return response
+    return FastJSONResponse(body, headers=_headers(etag, cache_control, vary))
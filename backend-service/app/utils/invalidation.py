@@ -0,0 +1,119 @@
+"""
+Cross-worker cache invalidation over Unix datagram sockets.
+
+Each worker process (scripts/serve.py) holds its own service caches. A
+write clears the cache in the worker that handled it and publishes the
+cache's name; every other worker clears its copy. Each worker listens on
+its own socket in a directory shared by the workers of one host:
+
+  <INVALIDATION_SOCKET_DIR>/<pid>.sock
+
+Publishing sends one datagram to each sibling socket, with no broker in
+between. The first failed send unlinks a dead worker's socket. Delivery is
+best effort; a lost message is bounded by the cache TTL.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+from typing import Callable, Dict, Optional
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SOCKET_SUFFIX = ".sock"
+MAX_MESSAGE_BYTES = 256
+
+
+class InvalidationBus:
+    """Disabled (all methods no-ops) when `directory` is empty."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._handlers: Dict[str, Callable[[], None]] = {}
+        self._receiver: Optional[socket.socket] = None
+        self._path: Optional[str] = None
+        self._sender: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def subscribe(self, name: str, handler: Callable[[], None]) -> None:
+        """Run `handler` in this worker when another one publishes `name`."""
+        self._handlers[name] = handler
+
+    # ── Receiving (event loop) ──────────────────────────────────
+    def start(self) -> None:
+        """Bind this worker's socket and read it on the running event loop."""
+        if not self.enabled or self._receiver is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{os.getpid()}{SOCKET_SUFFIX}")
+        if os.path.exists(path):
+            os.unlink(path)
+        receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        receiver.bind(path)
+        receiver.setblocking(False)
+        asyncio.get_running_loop().add_reader(receiver.fileno(), self._receive)
+        self._receiver, self._path = receiver, path
+
+    def stop(self) -> None:
+        if self._receiver is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._receiver.fileno())
+        self._receiver.close()
+        self._receiver = None
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                message = self._receiver.recv(MAX_MESSAGE_BYTES)
+            except BlockingIOError:
+                return
+            handler = self._handlers.get(message.decode(errors="replace"))
+            if handler is not None:
+                handler()
+
+    # ── Publishing (any thread) ─────────────────────────────────
+    def publish(self, name: str) -> None:
+        """Ask every other worker to run its `name` handler."""
+        if not self.enabled:
+            return
+        try:
+            entries = [e.path for e in os.scandir(self.directory) if e.name.endswith(SOCKET_SUFFIX)]
+        except FileNotFoundError:
+            return
+        message = name.encode()
+        with self._send_lock:
+            if self._sender is None:
+                self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._sender.setblocking(False)
+            for path in entries:
+                if path == self._path:
+                    continue
+                try:
+                    self._sender.sendto(message, path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    self._unlink_stale(path)
+                except OSError:
+                    # Receiver queue full (BlockingIOError) or similar: drop.
+                    logger.warning("Invalidation of %r not delivered to %s", name, path, exc_info=True)
+
+    @staticmethod
+    def _unlink_stale(path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+invalidation_bus = InvalidationBus(settings.invalidation_socket_dir)
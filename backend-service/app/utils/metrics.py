@@ -0,0 +1,228 @@
+"""
+Request instrumentation: per-request DynamoDB accounting and process-wide
+per-route histograms.
+
+MetricsMiddleware opens a `RequestStats` for every HTTP request in a
+contextvar. Services reach DynamoDB through `MeteredTable` (their `table`
+property), which times each call, asks for `ReturnConsumedCapacity=TOTAL` and
+charges the result to the current request. `db_client.run()` copies the
+context into its worker threads, so pooled calls are charged too. Outside a
+request (scripts, startup) calls pass through untouched.
+"""
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Calls that return ConsumedCapacity, split by which capacity they consume.
+READ_OPERATIONS = frozenset({"get_item", "query", "scan", "batch_get_item", "transact_get_items"})
+WRITE_OPERATIONS = frozenset({"put_item", "update_item", "delete_item", "batch_write_item", "transact_write_items"})
+
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RequestStats:
+    """DynamoDB usage of one request. Calls may run concurrently on pool
+    threads, so updates take a lock."""
+
+    __slots__ = ("db_calls", "db_ms", "read_units", "write_units", "_lock")
+
+    def __init__(self):
+        self.db_calls = 0
+        self.db_ms = 0.0
+        self.read_units = 0.0
+        self.write_units = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, elapsed_ms: float, capacity_units: float) -> None:
+        with self._lock:
+            self.db_calls += 1
+            self.db_ms += elapsed_ms
+            if operation in WRITE_OPERATIONS:
+                self.write_units += capacity_units
+            else:
+                self.read_units += capacity_units
+
+    def server_timing(self, total_ms: float) -> str:
+        """`Server-Timing` value. `db` is summed call time, so it can exceed
+        wall time when calls overlap; `app` is what's left of `total`."""
+        return (
+            f'db;dur={self.db_ms:.1f};desc="{self.db_calls} calls, '
+            f'{self.read_units:g} RCU, {self.write_units:g} WCU", '
+            f"app;dur={max(total_ms - self.db_ms, 0.0):.1f}, total;dur={total_ms:.1f}"
+        )
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def start_request() -> Tuple[RequestStats, Any]:
+    stats = RequestStats()
+    return stats, _current.set(stats)
+
+
+def end_request(token: Any) -> None:
+    _current.reset(token)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def _capacity_units(consumed: Any) -> float:
+    """ConsumedCapacity is a dict for single-table calls, a list for batches."""
+    if not consumed:
+        return 0.0
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+    return float(sum(entry.get("CapacityUnits", 0) for entry in consumed))
+
+
+def metered(operation: str, func: Callable[..., Dict[str, Any]], **params: Any) -> Dict[str, Any]:
+    """Call `func(**params)` and charge it to the current request, if any."""
+    stats = _current.get()
+    if stats is None:
+        return func(**params)
+    if operation in READ_OPERATIONS or operation in WRITE_OPERATIONS:
+        params.setdefault("ReturnConsumedCapacity", "TOTAL")
+    start = time.perf_counter()
+    try:
+        response = func(**params)
+    except Exception as e:
+        # Failed conditional writes still consume (and report) capacity.
+        consumed = getattr(e, "response", {}).get("ConsumedCapacity")
+        stats.record(operation, (time.perf_counter() - start) * 1000, _capacity_units(consumed))
+        raise
+    stats.record(operation, (time.perf_counter() - start) * 1000, _capacity_units(response.get("ConsumedCapacity")))
+    return response
+
+
+class MeteredTable:
+    """Wraps a boto3 Table: data-plane calls go through `metered()`, every
+    other attribute is passed through."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: Any):
+        self._table = table
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._table, name)
+        if name in READ_OPERATIONS or name in WRITE_OPERATIONS:
+            return lambda **params: metered(name, attr, **params)
+        return attr
+
+
+# ── Aggregation ────────────────────────────────────────────────
+
+class Histogram:
+    """Fixed-bucket latency histogram (ms). Percentiles are bucket upper
+    bounds, i.e. accurate to the bucket resolution."""
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        n = sum(self.counts)
+        if n == 0:
+            return None
+        rank = pct / 100 * n
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        n = sum(self.counts)
+        cumulative, buckets = 0, {}
+        for bound, count in zip(LATENCY_BUCKETS_MS + (float("inf"),), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else f"{bound:g}"] = cumulative
+        return {
+            "buckets": buckets,
+            "mean_ms": round(self.total / n, 3) if n else None,
+            "max_ms": round(self.max, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class RouteMetrics:
+    __slots__ = ("requests", "statuses", "total", "db", "db_calls", "read_units", "write_units")
+
+    def __init__(self):
+        self.requests = 0
+        self.statuses: Dict[str, int] = {}
+        self.total = Histogram()
+        self.db = Histogram()
+        self.db_calls = 0
+        self.read_units = 0.0
+        self.write_units = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "db_calls": self.db_calls,
+            "db_calls_per_request": round(self.db_calls / self.requests, 3) if self.requests else 0,
+            "read_units": self.read_units,
+            "write_units": self.write_units,
+            "total": self.total.snapshot(),
+            "db": self.db.snapshot(),
+        }
+
+
+class MetricsRegistry:
+    """Per-route aggregates for this process (one container / Lambda instance)."""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._routes: Dict[str, RouteMetrics] = {}
+        self._since = clock()
+
+    def observe(self, route: str, status: int, total_ms: float, stats: RequestStats) -> None:
+        with self._lock:
+            metrics = self._routes.get(route)
+            if metrics is None:
+                metrics = self._routes[route] = RouteMetrics()
+            metrics.requests += 1
+            status_class = f"{status // 100}xx"
+            metrics.statuses[status_class] = metrics.statuses.get(status_class, 0) + 1
+            metrics.total.observe(total_ms)
+            metrics.db.observe(stats.db_ms)
+            metrics.db_calls += stats.db_calls
+            metrics.read_units += stats.read_units
+            metrics.write_units += stats.write_units
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            routes: List[Tuple[str, RouteMetrics]] = sorted(self._routes.items())
+            return {
+                "since": self._since,
+                "uptime_s": round(self._clock() - self._since, 1),
+                "bucket_bounds_ms": list(LATENCY_BUCKETS_MS),
+                "routes": {route: metrics.snapshot() for route, metrics in routes},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._since = self._clock()
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,57 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class HasherBusyError(RuntimeError):
+    """Raised when the hashing queue is full — callers should answer 503."""
+
+
+class PasswordHasher:
+    """bcrypt hashing/verification on a dedicated, size-limited thread pool.
+
+    bcrypt releases the GIL, so `max_workers` threads hash in parallel while
+    the event loop keeps serving other requests. At most `max_queue` calls may
+    wait behind the running ones; beyond that, calls fail fast with
+    `HasherBusyError` instead of piling up latency for everyone.
+    """
+
+    def __init__(self, rounds: int, max_workers: int, max_queue: int):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._in_flight = 0
+        self._executor = None
+        self._context = None
+
+    @property
+    def context(self):
+        if self._context is None:
+            from passlib.context import CryptContext
+
+            self._context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=self.rounds)
+        return self._context
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self.context.hash, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._submit(self.context.verify, plain, hashed)
+
+    async def _submit(self, func: Callable[..., Any], *args: Any) -> Any:
+        # Only touched from the event loop thread, so a plain counter is safe.
+        if self._in_flight >= self.max_workers + self.max_queue:
+            raise HasherBusyError("Too many concurrent authentication requests. Try again shortly.")
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+        finally:
+            self._in_flight -= 1
@@ -0,0 +1,171 @@
+"""
+Token-bucket rate limiting.
+
+Buckets are kept in GCRA form: one number per key, the "theoretical
+arrival time" (TAT) at which the bucket would be full again. A request
+adds one emission interval (60 / per_minute seconds) to it and is allowed
+while the TAT stays within `burst` intervals of now. That is exactly a
+token bucket of size `burst` refilling at `per_minute`, without storing a
+token count and a timestamp per key.
+
+Backends:
+  MemoryRateLimitBackend    — dict of key -> TAT in this process, swept of
+                              full buckets every RATE_LIMIT_SWEEP_SECONDS.
+  DynamoDBRateLimitBackend  — RateLimits table, one conditional UpdateItem
+                              per request, so limits hold across workers and
+                              Lambda instances. Rejections are remembered
+                              locally until they expire, so a rejected burst
+                              costs no DynamoDB calls.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, Optional
+
+from app.config.database import db_client
+from app.config.settings import settings
+from app.utils.metrics import MeteredTable
+
+
+class Rule:
+    """`burst` requests at once, refilling at `per_minute` per minute."""
+
+    def __init__(self, name: str, per_minute: float, burst: int):
+        self.name = name
+        self.interval = 60.0 / per_minute
+        self.window = burst * self.interval  # how far ahead of now the TAT may run
+
+    def advance(self, tat: Optional[float], now: float):
+        """(new TAT, 0.0) when allowed, (None, retry_after) when not."""
+        new_tat = max(tat or now, now) + self.interval
+        if new_tat - now > self.window:
+            return None, new_tat - self.window - now
+        return new_tat, 0.0
+
+
+class RateLimitBackend(ABC):
+    """Stores bucket state. `acquire` takes one token from the bucket
+    `rule.name:key` and returns 0.0, or the seconds until one is free."""
+
+    @abstractmethod
+    async def acquire(self, rule: Rule, key: str) -> float:
+        ...
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process buckets. At most `max_keys` are held; past that the least
+    recently used key is dropped (its client starts with a full bucket).
+    Every take moves its key to the end, so a busy client is never the one
+    evicted."""
+
+    def __init__(self, max_keys: int = 100_000, sweep_seconds: float = 60.0, clock=time.monotonic):
+        self.max_keys = max_keys
+        self.sweep_seconds = sweep_seconds
+        self.clock = clock
+        self._tats: OrderedDict[str, float] = OrderedDict()
+        self._next_sweep = clock() + sweep_seconds
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+    async def acquire(self, rule: Rule, key: str) -> float:
+        return self.take(rule, f"{rule.name}:{key}")
+
+    def take(self, rule: Rule, bucket: str) -> float:
+        now = self.clock()
+        if now >= self._next_sweep:
+            self.sweep(now)
+        new_tat, retry_after = rule.advance(self._tats.get(bucket), now)
+        if new_tat is not None:
+            self._tats[bucket] = new_tat
+        if bucket in self._tats:
+            self._tats.move_to_end(bucket)
+        if len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+        return retry_after
+
+    def sweep(self, now: float) -> None:
+        """Forget buckets that have refilled completely (TAT in the past)."""
+        self._tats = OrderedDict((bucket, tat) for bucket, tat in self._tats.items() if tat > now)
+        self._next_sweep = now + self.sweep_seconds
+
+
+class DynamoDBRateLimitBackend(RateLimitBackend):
+    """Buckets in the RateLimits table (`bucket` key, `tat`, and an
+    `expires_at` TTL attribute so idle buckets are deleted by DynamoDB)."""
+
+    TABLE_NAME = "RateLimits"
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._denied_until: Dict[str, float] = {}
+
+    @property
+    def table(self):
+        return MeteredTable(db_client.get_table(self.TABLE_NAME))
+
+    async def acquire(self, rule: Rule, key: str) -> float:
+        bucket = f"{rule.name}:{key}"
+        now = self.clock()
+        until = self._denied_until.get(bucket)
+        if until is not None:
+            if until > now:
+                return until - now
+            del self._denied_until[bucket]
+
+        retry_after = await db_client.run(self.take, rule, bucket)
+        if retry_after > 0:
+            if len(self._denied_until) >= settings.rate_limit_max_keys:
+                self._denied_until = {b: t for b, t in self._denied_until.items() if t > now}
+            self._denied_until[bucket] = now + retry_after
+        return retry_after
+
+    def take(self, rule: Rule, bucket: str) -> float:
+        """Optimistic read-modify-write of the TAT: the write is conditional
+        on the TAT it was computed from, and a failed condition returns the
+        current item, so each attempt is a single call."""
+        from botocore.exceptions import ClientError
+
+        tat = None
+        for _ in range(self.MAX_ATTEMPTS):
+            now = self.clock()
+            new_tat, retry_after = rule.advance(tat, now)
+            if new_tat is None:
+                return retry_after
+            if tat is None:
+                condition, values = "attribute_not_exists(tat) OR tat <= :now", {":now": _number(now)}
+            else:
+                condition, values = "tat = :old", {":old": _number(tat)}
+            try:
+                self.table.update_item(
+                    Key={"bucket": bucket},
+                    UpdateExpression="SET tat = :tat, expires_at = :exp",
+                    ConditionExpression=condition,
+                    ExpressionAttributeValues={
+                        **values,
+                        ":tat": _number(new_tat),
+                        ":exp": int(new_tat) + 1,
+                    },
+                    ReturnValuesOnConditionCheckFailure="ALL_OLD",
+                )
+                return 0.0
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                tat = float(e.response.get("Item", {}).get("tat", {}).get("N", now))
+        return rule.interval  # lost every race: treat as busy
+
+
+def _number(value: float) -> Decimal:
+    return Decimal(repr(round(value, 6)))
+
+
+def build_backend(name: str) -> RateLimitBackend:
+    if name == "memory":
+        return MemoryRateLimitBackend(max_keys=settings.rate_limit_max_keys, sweep_seconds=settings.rate_limit_sweep_seconds)
+    if name == "dynamodb":
+        return DynamoDBRateLimitBackend()
+    raise ValueError(f"Unknown rate limit backend {name!r} (expected 'memory' or 'dynamodb').")
@@ -0,0 +1,149 @@
+"""
+In-memory inverted index with BM25 ranking for blog posts.
+
+Fields are weighted by repeating their terms (title and tags count 3x,
+summary 2x, content 1x), a cheap approximation of BM25F. Each document
+carries a small `post` payload (the list-page summary), so search results
+never need to touch BlogPosts.
+
+`dumps()` / `loads()` round-trip the index as zlib-compressed JSON, the
+snapshot format SearchService persists to DynamoDB and the local cache file.
+Incremental changes travel as already-analyzed term frequencies
+(`analyze()` + `add_terms()`), so applying one never re-tokenizes content.
+"""
+
+import heapq
+import math
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from app.utils.serialization import dumps
+
+FIELD_WEIGHTS = {"title": 3, "tags": 3, "summary": 2, "content": 1}
+BM25_K1 = 1.2
+BM25_B = 0.75
+FORMAT_VERSION = 1
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have how i in is it its of on or "
+    "our so that the this to was we what when which with you your".split()
+)
+
+
+def _stem(token: str) -> str:
+    """Deliberately light: fold plurals so "pipelines" finds "pipeline"."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [_stem(t) for t in _WORD_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple, set)):
+        return " ".join(str(v) for v in value)
+    return str(value or "")
+
+
+class SearchIndex:
+    """Not thread-safe; SearchService serializes access."""
+
+    def __init__(self):
+        self.docs: Dict[str, Dict[str, Any]] = {}        # doc_id -> {"len": int, "post": {...}}
+        self.postings: Dict[str, Dict[str, int]] = {}    # term -> {doc_id: weighted tf}
+        self.total_len = 0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.docs
+
+    # ── Maintenance ─────────────────────────────────────────────
+    @staticmethod
+    def analyze(fields: Dict[str, Any]) -> Dict[str, int]:
+        """Field-weighted term frequencies of one document."""
+        freqs: Dict[str, int] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(_field_text(fields.get(field))):
+                freqs[term] = freqs.get(term, 0) + weight
+        return freqs
+
+    def add(self, doc_id: str, fields: Dict[str, Any], post: Dict[str, Any]) -> None:
+        """Index (or re-index) one document."""
+        self.add_terms(doc_id, self.analyze(fields), post)
+
+    def add_terms(self, doc_id: str, freqs: Dict[str, int], post: Dict[str, Any]) -> None:
+        """Index (or re-index) one document from `analyze()` output."""
+        self.remove(doc_id)
+        length = sum(freqs.values())
+        for term, tf in freqs.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        self.docs[doc_id] = {"len": length, "terms": list(freqs), "post": post}
+        self.total_len += length
+
+    def remove(self, doc_id: str) -> bool:
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return False
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.postings[term]
+        self.total_len -= doc["len"]
+        return True
+
+    # ── Query ───────────────────────────────────────────────────
+    def search(self, query: str, limit: int = 10) -> List[Tuple[float, Dict[str, Any]]]:
+        """Top `limit` documents by BM25 as (score, post) pairs, best first."""
+        n = len(self.docs)
+        if n == 0:
+            return []
+        avg_len = self.total_len / n
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for doc_id, tf in posting.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.docs[doc_id]["len"] / avg_len)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])
+        return [(score, self.docs[doc_id]["post"]) for doc_id, score in best]
+
+    # ── Serialization ───────────────────────────────────────────
+    def dumps(self) -> bytes:
+        """Postings are stored as-is, so loading is a JSON parse with no
+        re-tokenizing."""
+        return zlib.compress(dumps({"format": FORMAT_VERSION, "docs": self.docs, "postings": self.postings}), 6)
+
+    @classmethod
+    def loads(cls, blob: bytes) -> Optional["SearchIndex"]:
+        """None for blobs written by an incompatible format version."""
+        data = orjson.loads(zlib.decompress(blob))
+        if data.get("format") != FORMAT_VERSION:
+            return None
+        index = cls()
+        index.docs = data["docs"]
+        index.postings = data["postings"]
+        index.total_len = sum(doc["len"] for doc in index.docs.values())
+        return index
+
+    @classmethod
+    def build(cls, items: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any]]]) -> "SearchIndex":
+        index = cls()
+        for doc_id, fields, post in items:
+            index.add(doc_id, fields, post)
+        return index
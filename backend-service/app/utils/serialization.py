@@ -0,0 +1,61 @@
+import functools
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Type
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # boto3 returns every DynamoDB number as Decimal.
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default)
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by orjson, with DynamoDB Decimals handled.
+
+    Returning it from a route skips FastAPI's response_model re-validation;
+    keep `response_model` on the decorator so the OpenAPI schema is unchanged,
+    and shape items with `conform()` so the body still matches it.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_plan(model: Type[BaseModel]):
+    """(field name, has default, default value, default factory) per field."""
+    return [
+        (name, not f.is_required(), f.default, f.default_factory)
+        for name, f in model.model_fields.items()
+    ]
+
+
+def conform(model: Type[BaseModel], items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Cheap stand-in for validating DynamoDB items against `model`: keep only
+    the model's fields and fill missing optional ones with their defaults."""
+    plan = _field_plan(model)
+    shaped = []
+    for item in items:
+        out = {}
+        for name, has_default, default, factory in plan:
+            if name in item:
+                out[name] = item[name]
+            elif has_default:
+                out[name] = factory() if factory is not None else default
+        shaped.append(out)
+    return shaped
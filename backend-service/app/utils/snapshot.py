@@ -0,0 +1,366 @@
+"""
+Precomputed snapshot of the public GET responses.
+
+`export()` drives the app in-process over every public read route
+(experiences, projects, the anonymous homepage, blog list and tag pages
+followed cursor by cursor, every published post and its comment pages) and
+writes the exact response bodies, gzip-compressed, into one pack file with
+a JSON manifest:
+
+  <dir>/CURRENT                     "0000000007"
+  <dir>/snapshot-0000000007.json    {"format", "version", "started_at", "generated_at", "entries"}
+  <dir>/snapshot-0000000007.pack    gzip bodies back to back (memory-mapped when served)
+
+`SnapshotStore` serves entries from the mapped pack with no DynamoDB calls.
+An entry is stale, and the request falls through to a live read, when the
+snapshot is older than `max_age_seconds` or when a write touched one of the
+entry's groups after the export started. Writes are recorded per group in
+this process and as `stale-<group>` marker files, so other workers sharing
+the directory see them within `check_seconds`.
+"""
+
+import asyncio
+import gzip
+import mmap
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import orjson
+
+from app.config.settings import settings
+
+FORMAT_VERSION = 1
+GROUPS = ("experiences", "projects", "blog")
+KEPT_VERSIONS = 2
+# Set in the ASGI scope of export requests so they always read live data.
+BYPASS_SCOPE_KEY = "snapshot.bypass"
+STORED_HEADERS = ("content-type", "etag", "cache-control", "vary")
+
+
+def canonical_key(path: str, query: str) -> str:
+    """Lookup key: the path plus its query parameters in sorted order, so
+    parameter order and percent-escaping do not matter."""
+    pairs = sorted(parse_qsl(query, keep_blank_values=True))
+    return f"{path}?{urlencode(pairs)}" if pairs else path
+
+
+def write_group(path: str) -> Optional[str]:
+    """The content group a write to `path` changes, if any."""
+    for group in GROUPS:
+        if path == f"/api/{group}" or path.startswith(f"/api/{group}/"):
+            return group
+    return None
+
+
+# ── Export ──────────────────────────────────────────────────────
+async def _get(app, path: str, query: str) -> Tuple[int, Dict[str, str], bytes]:
+    """One in-process GET through the full middleware stack."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"snapshot")],
+        "client": ("127.0.0.1", 0),
+        "server": ("snapshot", 80),
+        BYPASS_SCOPE_KEY: True,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status, headers, chunks = 0, {}, []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers.update((k.decode().lower(), v.decode()) for k, v in message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, headers, b"".join(chunks)
+
+
+class _Crawler:
+
+    def __init__(self, app, concurrency: int):
+        self.app = app
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    async def fetch(
+        self, path: str, route: str, groups: Iterable[str], query: str = "", *, anonymous: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Render and record one response; its parsed JSON, or None if it was not a 200."""
+        async with self.semaphore:
+            status, headers, body = await _get(self.app, path, query)
+        if status != 200:
+            return None
+        self.entries[canonical_key(path, query)] = {
+            "route": route,
+            "groups": list(groups),
+            "anonymous": anonymous,
+            "headers": {name: headers[name] for name in STORED_HEADERS if name in headers},
+            "body": body,
+        }
+        return orjson.loads(body)
+
+    async def pages(self, path: str, route: str, groups: Iterable[str], items_key: str, **params: str) -> List[Dict[str, Any]]:
+        """Follow `next_cursor` from the first page to the last; all items."""
+        items: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            query = urlencode({**params, "cursor": cursor} if cursor else params)
+            page = await self.fetch(path, route, groups, query)
+            if page is None:
+                return items
+            items.extend(page[items_key])
+            cursor = page.get("next_cursor")
+            if not cursor:
+                return items
+
+
+async def export(app, directory: str, *, concurrency: int = 8) -> Dict[str, Any]:
+    """Render every public GET response of `app` into a new snapshot
+    version under `directory`. Returns a summary of what was written."""
+    started_at = time.time()
+    crawler = _Crawler(app, concurrency)
+    experiences, projects, posts, tags, _ = await asyncio.gather(
+        crawler.fetch("/api/experiences", "/api/experiences", ["experiences"]),
+        crawler.fetch("/api/projects", "/api/projects", ["projects"]),
+        crawler.pages("/api/blog", "/api/blog", ["blog"], "posts"),
+        crawler.fetch("/api/blog/tags", "/api/blog/tags", ["blog"]),
+        crawler.fetch("/api/home", "/api/home", GROUPS, anonymous=True),
+    )
+    jobs = [
+        crawler.fetch(f"/api/experiences/{e['experience_id']}", "/api/experiences/{experience_id}", ["experiences"])
+        for e in (experiences or {}).get("experiences", [])
+    ]
+    jobs += [
+        crawler.fetch(f"/api/projects/{p['project_id']}", "/api/projects/{project_id}", ["projects"])
+        for p in (projects or {}).get("projects", [])
+    ]
+    jobs += [crawler.pages("/api/blog", "/api/blog", ["blog"], "posts", tag=t["tag"]) for t in (tags or {}).get("tags", [])]
+    for post in posts:
+        jobs.append(crawler.fetch(f"/api/blog/{post['post_id']}", "/api/blog/{post_id}", ["blog"]))
+        jobs.append(crawler.pages(f"/api/blog/{post['post_id']}/comments", "/api/blog/{post_id}/comments", ["blog"], "comments"))
+    await asyncio.gather(*jobs)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, write_snapshot, directory, crawler.entries, started_at)
+
+
+def _versions(directory: str) -> List[int]:
+    versions = []
+    for name in os.listdir(directory):
+        if name.startswith("snapshot-") and name.endswith(".json"):
+            try:
+                versions.append(int(name[len("snapshot-"):-len(".json")]))
+            except ValueError:
+                pass
+    return sorted(versions)
+
+
+def _path(directory: str, version: int, suffix: str) -> str:
+    return os.path.join(directory, f"snapshot-{version:010d}{suffix}")
+
+
+def _replace(path: str, data: bytes) -> None:
+    """Write-then-rename, so readers never see a partial file."""
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_snapshot(directory: str, entries: Dict[str, Dict[str, Any]], started_at: float) -> Dict[str, Any]:
+    """Write `entries` (key -> {..., "body": bytes}) as the next version and
+    point CURRENT at it. Older versions beyond KEPT_VERSIONS are removed."""
+    os.makedirs(directory, exist_ok=True)
+    version = (_versions(directory) or [0])[-1] + 1
+
+    pack = bytearray()
+    manifest_entries: Dict[str, Dict[str, Any]] = {}
+    raw_bytes = 0
+    for key in sorted(entries):
+        entry = dict(entries[key])
+        body = entry.pop("body")
+        blob = gzip.compress(body, compresslevel=9, mtime=0)
+        manifest_entries[key] = {**entry, "offset": len(pack), "length": len(blob)}
+        pack += blob
+        raw_bytes += len(body)
+
+    generated_at = time.time()
+    manifest = {
+        "format": FORMAT_VERSION,
+        "version": version,
+        "started_at": started_at,
+        "generated_at": generated_at,
+        "entries": manifest_entries,
+    }
+    _replace(_path(directory, version, ".pack"), bytes(pack))
+    _replace(_path(directory, version, ".json"), orjson.dumps(manifest))
+    _replace(os.path.join(directory, "CURRENT"), f"{version:010d}".encode())
+
+    for old in _versions(directory)[:-KEPT_VERSIONS]:
+        for suffix in (".json", ".pack"):
+            try:
+                os.remove(_path(directory, old, suffix))
+            except OSError:
+                pass
+
+    return {
+        "version": version,
+        "entries": len(manifest_entries),
+        "bytes": len(pack),
+        "raw_bytes": raw_bytes,
+        "generated_at": generated_at,
+        "seconds": round(generated_at - started_at, 3),
+    }
+
+
+# ── Serving ─────────────────────────────────────────────────────
+class Snapshot:
+    """One loaded version: the manifest plus the memory-mapped pack."""
+
+    def __init__(self, manifest: Dict[str, Any], pack):
+        self.version: int = manifest["version"]
+        self.started_at: float = manifest["started_at"]
+        self.generated_at: float = manifest["generated_at"]
+        self.entries: Dict[str, Dict[str, Any]] = manifest["entries"]
+        self._pack = pack
+
+    def body(self, entry: Dict[str, Any]) -> bytes:
+        """The gzip-compressed body of `entry`."""
+        return self._pack[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def close(self) -> None:
+        """Unmap the pack. `body()` copies out of it and the store calls
+        this on the event loop, so no request is still reading it."""
+        if isinstance(self._pack, mmap.mmap):
+            self._pack.close()
+
+    @classmethod
+    def load(cls, directory: str, version: int) -> Optional["Snapshot"]:
+        """None when the files are missing or written by another format version."""
+        try:
+            with open(_path(directory, version, ".json"), "rb") as f:
+                manifest = orjson.loads(f.read())
+            if manifest.get("format") != FORMAT_VERSION:
+                return None
+            with open(_path(directory, version, ".pack"), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                pack = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        except (OSError, ValueError):
+            return None
+        return cls(manifest, pack)
+
+
+class SnapshotStore:
+    """The current snapshot of `directory` and the staleness of its groups.
+    Everything runs on the event loop; the directory is re-checked at most
+    every `check_seconds`."""
+
+    def __init__(self, directory: str, *, max_age_seconds: float, check_seconds: float):
+        self.directory = directory
+        self.max_age_seconds = max_age_seconds
+        self.check_seconds = check_seconds
+        self._snapshot: Optional[Snapshot] = None
+        self._checked_at = float("-inf")
+        self._stale: Dict[str, float] = {}  # group -> wall time of the last write
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def lookup(self, path: str, query: str) -> Optional[Tuple[Snapshot, Dict[str, Any]]]:
+        """The snapshot entry for this GET, or None when there is none or it is stale."""
+        if not self.enabled:
+            return None
+        snapshot = self._current()
+        if snapshot is None:
+            return None
+        entry = snapshot.entries.get(canonical_key(path, query))
+        if entry is None or self._is_stale(snapshot, entry["groups"]):
+            return None
+        return snapshot, entry
+
+    def mark_stale(self, group: str) -> None:
+        """Record a write to `group`; entries in it fall back to live reads
+        until the next export."""
+        if not self.enabled:
+            return
+        now = time.time()
+        self._stale[group] = now
+        try:
+            _replace(os.path.join(self.directory, f"stale-{group}"), repr(now).encode())
+        except OSError:
+            pass  # read-only directory: this process still knows
+
+    def reload(self) -> None:
+        """Re-read the directory on the next lookup."""
+        self._checked_at = float("-inf")
+
+    def status(self) -> Dict[str, Any]:
+        snapshot = self._current() if self.enabled else None
+        if snapshot is None:
+            return {"enabled": self.enabled, "version": None}
+        return {
+            "enabled": True,
+            "version": snapshot.version,
+            "generated_at": snapshot.generated_at,
+            "age_seconds": round(time.time() - snapshot.generated_at, 1),
+            "max_age_seconds": self.max_age_seconds,
+            "entries": len(snapshot.entries),
+            "expired": time.time() - snapshot.generated_at > self.max_age_seconds,
+            "stale_groups": [g for g in GROUPS if self._stale.get(g, 0.0) >= snapshot.started_at],
+        }
+
+    def _is_stale(self, snapshot: Snapshot, groups: Iterable[str]) -> bool:
+        if time.time() - snapshot.generated_at > self.max_age_seconds:
+            return True
+        return any(self._stale.get(group, 0.0) >= snapshot.started_at for group in groups)
+
+    def _current(self) -> Optional[Snapshot]:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_seconds:
+            self._checked_at = now
+            self._refresh()
+        return self._snapshot
+
+    def _refresh(self) -> None:
+        try:
+            with open(os.path.join(self.directory, "CURRENT"), "rb") as f:
+                version = int(f.read())
+        except (OSError, ValueError):
+            self._swap(None)
+            return
+        if self._snapshot is None or self._snapshot.version != version:
+            self._swap(Snapshot.load(self.directory, version))
+        for group in GROUPS:
+            try:
+                written = os.stat(os.path.join(self.directory, f"stale-{group}")).st_mtime
+            except OSError:
+                continue
+            self._stale[group] = max(self._stale.get(group, 0.0), written)
+
+    def _swap(self, snapshot: Optional[Snapshot]) -> None:
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is not None:
+            previous.close()
+
+
+snapshot_store = SnapshotStore(
+    settings.snapshot_dir,
+    max_age_seconds=settings.snapshot_max_age_seconds,
+    check_seconds=settings.snapshot_check_seconds,
+)
@@ -0,0 +1,59 @@
+"""
+Throughput of the public read endpoints under concurrent load, before and after
+moving DynamoDB calls off the event loop.
+
+  before -> handlers call the service synchronously inside `async def`
+            (the original controllers), so every round trip blocks the loop
+  after  -> the real app, where handlers `await service.aio.<method>(...)`
+
+Requires a running DynamoDB (docker compose up dynamodb-local, then
+python scripts/seed_db.py).
+Run: python -m benchmarks.bench_async_dynamodb [--concurrency 32] [--requests 2000]
+"""
+
+import argparse
+import asyncio
+
+from fastapi import FastAPI
+
+from benchmarks.common import load, print_row
+
+
+def build_blocking_app() -> FastAPI:
+    from app.services.blog_service import blog_service
+    from app.services.experience_service import experience_service
+
+    app = FastAPI()
+
+    @app.get("/api/blog")
+    async def list_posts():
+        posts, next_cursor = blog_service.get_published_posts(limit=25)
+        return {"posts": posts, "count": len(posts), "next_cursor": next_cursor}
+
+    @app.get("/api/experiences")
+    async def list_experiences():
+        items = experience_service.get_ordered()
+        return {"experiences": items, "count": len(items)}
+
+    return app
+
+
+async def main(concurrency: int, total: int) -> None:
+    from main import app as async_app
+
+    blocking_app = build_blocking_app()
+    for path in ("/api/blog", "/api/experiences"):
+        print(f"GET {path}  (concurrency={concurrency})")
+        before = await load(blocking_app, "GET", path, concurrency=concurrency, total=total)
+        print_row("before (blocking boto3)", before)
+        after = await load(async_app, "GET", path, concurrency=concurrency, total=total)
+        print_row("after  (db thread pool)", after)
+        print(f"  speedup: {after['rps'] / before['rps']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.requests))
@@ -0,0 +1,218 @@
+"""
+DynamoDB client tuning under concurrency: botocore defaults against the
+CLIENT_PROFILES in app/config/database.py.
+
+A stand-in DynamoDB endpoint runs in a child process and answers GetItem
+after `--latency-ms`. It serves at most `--capacity` calls per second
+(token bucket) and throttles the rest with ProvisionedThroughputExceeded.
+A `--stall-rate` fraction of calls hangs for `--stall-seconds`, like a lost
+connection. `--concurrency` threads then call get_item through real boto3
+clients. Three scenarios:
+
+  pool      -> no throttling or stalls: connections beyond the pool size
+               are opened per call and thrown away
+  throttle  -> demand above capacity: retry amplification and tail latency
+  stall     -> rare hung calls: what the read timeout does to the tail
+
+Per row: client-side latency, calls that failed after retries, endpoint
+calls per request (retry amplification) and connections opened during the
+run (each one a TLS handshake against real DynamoDB). No DynamoDB is needed.
+Run: python -m benchmarks.bench_dynamodb_client [--concurrency 32] [--requests 2000]
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.common import percentile
+
+ITEM = {"Item": {"id": {"S": "post-1"}, "title": {"S": "Hello"}, "comment_count": {"N": "3"}}}
+THROTTLED = {
+    "__type": "com.amazonaws.dynamodb.v20120810#ProvisionedThroughputExceededException",
+    "message": "The level of configured provisioned throughput for the table was exceeded.",
+}
+
+
+# ── Stand-in endpoint (child process) ───────────────────────────
+def serve(port_pipe, counters, latency_s: float, capacity: float, stall_rate: float, stall_s: float) -> None:
+    lock = threading.Lock()  # guards the bucket
+    bucket = {"tokens": capacity / 10, "at": time.monotonic()}
+
+    def admit() -> bool:
+        if capacity <= 0:
+            return True
+        with lock:
+            now = time.monotonic()
+            bucket["tokens"] = min(capacity / 10, bucket["tokens"] + (now - bucket["at"]) * capacity)
+            bucket["at"] = now
+            if bucket["tokens"] >= 1:
+                bucket["tokens"] -= 1
+                return True
+            return False
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with counters.get_lock():
+                counters[1] += 1
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            with counters.get_lock():
+                counters[0] += 1
+            if stall_rate and random.random() < stall_rate:
+                time.sleep(stall_s)
+            time.sleep(latency_s)
+            if admit():
+                self._reply(200, ITEM)
+            else:
+                self._reply(400, THROTTLED)
+
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode()
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/x-amz-json-1.0")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except OSError:
+                pass  # client gave up on a stalled call
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 256
+        daemon_threads = True
+
+        def handle_error(self, request, client_address):
+            pass
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port_pipe.send(server.server_address[1])
+    server.serve_forever()
+
+
+class Endpoint:
+    def __init__(self, **options):
+        self.options = options
+        self.counters = multiprocessing.Array("l", 2)  # calls, connections opened
+        receive, send = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(target=serve, args=(send, self.counters), kwargs=options, daemon=True)
+        self.process.start()
+        self.url = f"http://127.0.0.1:{receive.recv()}"
+
+    def reset(self) -> None:
+        with self.counters.get_lock():
+            self.counters[0] = self.counters[1] = 0
+
+    def stop(self) -> None:
+        self.process.terminate()
+        self.process.join()
+
+
+# ── Client side ─────────────────────────────────────────────────
+def make_client(url: str, config):
+    import boto3
+
+    return boto3.session.Session().client(
+        "dynamodb",
+        endpoint_url=url,
+        region_name="us-east-1",
+        aws_access_key_id="bench",
+        aws_secret_access_key="bench",
+        config=config,
+    )
+
+
+def configs(concurrency: int):
+    from botocore.config import Config
+
+    from app.config.database import CLIENT_PROFILES, client_config
+
+    yield "botocore defaults (pool 10, legacy)", Config()
+    for profile, options in CLIENT_PROFILES.items():
+        yield f"{profile} profile", client_config(dict(options, max_pool_connections=concurrency))
+
+
+def run(client, concurrency: int, total: int):
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    latencies, errors = [], 0
+    issued = 0
+    lock = threading.Lock()
+
+    def worker():
+        nonlocal issued, errors
+        while True:
+            with lock:
+                if issued >= total:
+                    return
+                issued += 1
+            t0 = time.perf_counter()
+            try:
+                client.get_item(TableName="BlogPosts", Key={"id": {"S": "post-1"}})
+            except (BotoCoreError, ClientError):
+                with lock:
+                    errors += 1
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return latencies, errors, time.perf_counter() - start
+
+
+def scenario(name: str, endpoint: Endpoint, concurrency: int, total: int) -> None:
+    print(f"\n{name}: {endpoint.options}")
+    for label, config in configs(concurrency):
+        client = make_client(endpoint.url, config)
+        run(client, concurrency, min(total, 200))  # open connections, load endpoint models
+        time.sleep(0.5)  # let the throttle bucket refill
+        endpoint.reset()
+        latencies, errors, elapsed = run(client, concurrency, total)
+        calls, connections = endpoint.counters
+        print(
+            f"  {label:<36} {len(latencies) / elapsed:>8.1f} req/s  p50 {percentile(latencies, 50):>8.2f} ms  "
+            f"p99 {percentile(latencies, 99):>9.2f} ms  max {max(latencies):>9.2f} ms  "
+            f"failed {errors:>4}  calls/req {calls / total:>5.2f}  new conns {connections:>5}"
+        )
+
+
+def main(concurrency: int, total: int, latency_ms: float, capacity: float, stall_rate: float, stall_seconds: float, only: str) -> None:
+    scenarios = {
+        "pool": dict(latency_s=latency_ms / 1000, capacity=0, stall_rate=0, stall_s=0),
+        "throttle": dict(latency_s=latency_ms / 1000, capacity=capacity, stall_rate=0, stall_s=0),
+        "stall": dict(latency_s=latency_ms / 1000, capacity=0, stall_rate=stall_rate, stall_s=stall_seconds),
+    }
+    print(f"get_item x {total}, {concurrency} threads")
+    for name, options in scenarios.items():
+        if only and only != name:
+            continue
+        endpoint = Endpoint(**options)
+        try:
+            scenario(name, endpoint, concurrency, total)
+        finally:
+            endpoint.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--capacity", type=float, default=200.0, help="endpoint calls/s before throttling")
+    parser.add_argument("--stall-rate", type=float, default=0.002)
+    parser.add_argument("--stall-seconds", type=float, default=8.0)
+    parser.add_argument("--only", default="", help="run one scenario: pool, throttle or stall")
+    args = parser.parse_args()
+    main(args.concurrency, args.requests, args.latency_ms, args.capacity, args.stall_rate, args.stall_seconds, args.only)
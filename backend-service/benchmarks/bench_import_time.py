@@ -0,0 +1,82 @@
+"""
+Cold-start import budget for the Lambda entry point.
+
+Runs `python -X importtime -c "import handler"` in fresh interpreters and
+sums the self time of every module that importing only the framework
+(fastapi + mangum) does not load, so the reported overhead is the app's own
+import cost: app modules plus anything only they pull in. Subtracting two
+~600 ms totals instead swings by hundreds of ms between runs on a busy
+machine; the per-module sum does not carry the framework's noise. Exits
+non-zero when
+
+  - the app overhead (best of --runs) exceeds --budget-ms, or
+  - a dependency that must stay lazy (boto3, botocore, jose, passlib)
+    is imported at startup.
+
+Suitable as a CI gate. No DynamoDB needed.
+Run: python -m benchmarks.bench_import_time [--runs 10] [--budget-ms 150]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Only needed by DynamoDB-backed or auth routes; importing them at startup is a regression.
+LAZY_MODULES = ("boto3", "botocore", "jose", "passlib")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_profile(statement: str):
+    """Return {imported module: self µs}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    profile = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, _, _, name = match.groups()
+            profile[name] = int(self_us)
+    return profile
+
+
+def main(runs: int, budget_ms: float) -> int:
+    framework = import_profile("import fastapi, mangum")
+    overhead_ms, modules, slowest = None, set(), []
+    for _ in range(runs):
+        profile = import_profile("import handler")
+        own = {name: us for name, us in profile.items() if name not in framework}
+        total = sum(own.values()) / 1000
+        if overhead_ms is None or total < overhead_ms:
+            overhead_ms, slowest = total, sorted(own.items(), key=lambda item: -item[1])[:5]
+        modules = profile.keys()
+
+    print(f"app overhead          {overhead_ms:8.1f} ms (best of {runs}, budget {budget_ms:.0f} ms)")
+    for name, us in slowest:
+        print(f"  {name:<36} {us / 1000:6.1f} ms")
+
+    failed = False
+    eager = sorted(m for m in LAZY_MODULES if m in modules)
+    if eager:
+        print(f"FAIL: imported at startup but must stay lazy: {', '.join(eager)}")
+        failed = True
+    if overhead_ms > budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.budget_ms))
@@ -0,0 +1,48 @@
+"""
+Tokens verified per second on the auth middleware path.
+
+  jose decode      -> python-jose `jwt.decode` (the original implementation)
+  direct HMAC      -> `auth_service.verify_token` (cold: every call verifies)
+  middleware warm  -> `verify_token_cached` with the token already cached
+
+Pure CPU: no DynamoDB needed.
+Run: python -m benchmarks.bench_jwt_verify [--iterations 50000]
+"""
+
+import argparse
+import time
+
+from jose import jwt
+
+from app.config.settings import settings
+from app.middleware.auth import verified_tokens, verify_token_cached
+from app.services.auth_service import auth_service
+
+
+def rate(label: str, func, token: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(token)
+    per_sec = iterations / (time.perf_counter() - start)
+    print(f"  {label:<18} {per_sec:>12,.0f} tokens/s  ({1e6 / per_sec:6.2f} µs/token)")
+    return per_sec
+
+
+def main(iterations: int) -> None:
+    token = auth_service._create_token(
+        {"sub": "bench-user", "email": "bench@example.com", "role": "admin", "display_name": "Bench"}
+    )
+    print(f"{settings.jwt_algorithm} verification, {iterations:,} iterations:")
+    base = rate("jose decode", lambda t: jwt.decode(t, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]), token, iterations)
+    cold = rate("direct HMAC (cold)", auth_service.verify_token, token, iterations)
+    verified_tokens.clear()
+    verify_token_cached(token)
+    warm = rate("middleware (warm)", verify_token_cached, token, iterations)
+    print(f"  speedup vs jose: cold {cold / base:.1f}x, warm {warm / base:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.iterations)
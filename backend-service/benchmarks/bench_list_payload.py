@@ -0,0 +1,65 @@
+"""
+Bytes per blog list response and estimated read capacity, full items vs
+the BlogPostSummary projection.
+
+Builds synthetic posts with realistic markdown bodies and serializes a page
+the way the list endpoint does. RCUs are estimated from DynamoDB item-size
+rules (attribute names + values, 4 KB per RCU, eventually consistent = 0.5).
+Pure CPU: no DynamoDB needed.
+Run: python -m benchmarks.bench_list_payload [--content-kb 8] [--page 25]
+"""
+
+import argparse
+import json
+import math
+
+from app.models.blog import BLOG_SUMMARY_FIELDS, BlogPostListResponse, BlogPostResponse
+
+
+def make_post(i: int, content_kb: int) -> dict:
+    paragraph = "DynamoDB pagination, GSIs and projections keep list pages cheap. " * 16
+    return {
+        "post_id": f"00000000-0000-0000-0000-{i:012d}",
+        "title": f"Benchmark post number {i}",
+        "summary": "A short teaser that is all the list page shows. " * 3,
+        "content": ("## Section\n\n" + paragraph + "\n\n") * max(1, content_kb * 1024 // (len(paragraph) + 14)),
+        "tags": ["AWS", "Performance", "Python"],
+        "cover_image_url": None,
+        "author_email": "author@example.com",
+        "author_name": "Author",
+        "is_published": True,
+        "post_status": "published",
+        "created_at": f"2026-01-01T00:00:{i % 60:02d}",
+        "updated_at": f"2026-01-01T00:00:{i % 60:02d}",
+    }
+
+
+def item_size(item: dict) -> int:
+    return sum(len(k) + len(json.dumps(v)) for k, v in item.items())
+
+
+def estimated_rcu(items) -> float:
+    return math.ceil(sum(item_size(i) for i in items) / 4096) * 0.5
+
+
+def main(content_kb: int, page: int) -> None:
+    posts = [make_post(i, content_kb) for i in range(page)]
+    projected = [{k: p[k] for k in BLOG_SUMMARY_FIELDS if k in p} for p in posts]
+
+    full_body = json.dumps({
+        "posts": [BlogPostResponse(**p).model_dump() for p in posts], "count": page, "next_cursor": None,
+    }).encode()
+    summary_body = BlogPostListResponse(posts=projected, count=page).model_dump_json().encode()
+
+    print(f"{page} posts/page, ~{content_kb} KB markdown each:")
+    print(f"  full items       {len(full_body):>10,} bytes   ~{estimated_rcu(posts):>6.1f} RCU/page")
+    print(f"  BlogPostSummary  {len(summary_body):>10,} bytes   ~{estimated_rcu(projected):>6.1f} RCU/page")
+    print(f"  reduction        {len(full_body) / len(summary_body):>10.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--content-kb", type=int, default=8)
+    parser.add_argument("--page", type=int, default=25)
+    args = parser.parse_args()
+    main(args.content_kb, args.page)
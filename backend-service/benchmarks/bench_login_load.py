@@ -0,0 +1,80 @@
+"""
+Latency of cheap read endpoints while bcrypt-heavy logins are running.
+
+Measures p50/p99 of GET /api/health and GET /api/blog twice: idle, and with
+`--logins` concurrent login loops hammering POST /api/auth/login. With
+hashing on its own bounded pool the two rows should stay close; logins that
+overflow the queue get 503 and are counted separately.
+
+Requires a running DynamoDB (docker compose up dynamodb-local, then
+python scripts/seed_db.py).
+Run: python -m benchmarks.bench_login_load [--logins 16] [--requests 500]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+from benchmarks.common import asgi_request, load, print_row
+
+BENCH_PASSWORD = "bench-password-123"
+
+
+async def ensure_user(app) -> str:
+    email = f"bench-{uuid.uuid4().hex[:8]}@example.com"
+    resp = await asgi_request(
+        app, "POST", "/api/auth/register",
+        json_body={"email": email, "password": BENCH_PASSWORD, "display_name": "Bench"},
+    )
+    if resp.status != 200:
+        raise RuntimeError(f"register failed: {resp.status} {resp.body[:200]!r}")
+    return email
+
+
+async def login_loop(app, email: str, stop: asyncio.Event, counts: dict) -> None:
+    while not stop.is_set():
+        resp = await asgi_request(
+            app, "POST", "/api/auth/login",
+            json_body={"email": email, "password": BENCH_PASSWORD},
+        )
+        counts[resp.status] = counts.get(resp.status, 0) + 1
+
+
+async def main(logins: int, total: int) -> None:
+    # The login loops all come from one client IP; this measures bcrypt load, not the limiter.
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    from main import app
+
+    email = await ensure_user(app)
+    paths = ("/api/health", "/api/blog")
+
+    print("Idle:")
+    for path in paths:
+        print_row(f"GET {path}", await load(app, "GET", path, concurrency=8, total=total))
+
+    stop = asyncio.Event()
+    counts: dict = {}
+    loops = [asyncio.create_task(login_loop(app, email, stop, counts)) for _ in range(logins)]
+    await asyncio.sleep(0.5)  # let the hashing pool saturate
+
+    print(f"With {logins} concurrent login loops:")
+    start = time.perf_counter()
+    for path in paths:
+        print_row(f"GET {path}", await load(app, "GET", path, concurrency=8, total=total))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await asyncio.gather(*loops)
+    ok = counts.get(200, 0)
+    print(f"  logins: {ok} ok ({ok / elapsed:.1f}/s), {counts.get(503, 0)} rejected with 503, other: "
+          f"{ {k: v for k, v in counts.items() if k not in (200, 503)} }")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.requests))
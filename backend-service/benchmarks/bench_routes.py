@@ -0,0 +1,241 @@
+"""
+End-to-end latency and throughput of every API route, with no Docker or AWS.
+
+The app runs with DEPLOY_ENV=memory (app/config/memory_dynamodb.py), so every
+DynamoDB call pays a simulated network round trip. Tables and data come from
+scripts/seed_db.py itself: the regular seed rows plus generated fixture posts
+and comments. Each route is then driven through the ASGI app. Write routes get
+a distinct target per request (pre-created rows for deletes, unique emails for
+register).
+
+Results can be saved and compared with a later run. `--compare` exits non-zero
+when any route's p95 grows past `--threshold` times the baseline.
+
+Run: python -m benchmarks.bench_routes [--posts 2000] [--comments-per-post 10]
+        [--concurrency 16] [--requests 400] [--latency-ms 4] [--only blog]
+        [--save results.json] [--compare baseline.json --threshold 1.25]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import runpy
+import sys
+import time
+
+from benchmarks.common import asgi_request, load, print_row
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+SEED_PASSWORD = "bench-admin-password"
+USER_EMAIL = "bench-user@example.com"
+USER_PASSWORD = "bench-user-password"
+
+
+def configure_env(latency_ms: float) -> None:
+    """Must run before anything under app/ is imported (settings are read once)."""
+    os.environ["DEPLOY_ENV"] = "memory"
+    os.environ["MEMORY_DB_LATENCY_MS"] = str(latency_ms)
+    os.environ.setdefault("SEED_ADMIN_PASSWORD", SEED_PASSWORD)
+    # Every scenario comes from one client IP; measure the routes, not the limiter.
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+
+def seed(posts: int, comments_per_post: int):
+    """Create tables and load data through seed_db.py, with latency off."""
+    from app.config.database import db_client
+
+    latency = db_client.resource.latency_ms
+    db_client.resource.latency_ms = 0
+    started = time.perf_counter()
+    script = runpy.run_path(os.path.join(ROOT, "scripts", "seed_db.py"))
+    script["create_tables"]()
+    script["seed_data"]()
+    script["seed_fixtures"](posts, comments_per_post)
+    script["rebuild_post_indexes"]()
+    print(f"Seeded {posts} posts x {comments_per_post} comments in {time.perf_counter() - started:.1f}s\n")
+    db_client.resource.latency_ms = latency
+    return script
+
+
+def prepare_rows(n: int, user: dict, post_id: str) -> dict:
+    """Rows for the delete scenarios, created through the services."""
+    from app.config.database import db_client
+    from app.models.blog import BlogPostCreate
+    from app.models.comment import CommentCreate
+    from app.models.experience import ExperienceCreate
+    from app.models.project import ProjectCreate
+    from app.services.blog_service import blog_service
+    from app.services.comment_service import comment_service
+    from app.services.experience_service import experience_service
+    from app.services.project_service import project_service
+
+    latency = db_client.resource.latency_ms
+    db_client.resource.latency_ms = 0
+    post = BlogPostCreate(title="Disposable", summary="To be deleted.", content="Body")
+    experience = ExperienceCreate(
+        company="Disposable", role="Engineer", location="Remote",
+        start_date="Jan. 2024", end_date="Present", bullets=["x"], order=99,
+    )
+    project = ProjectCreate(title="Disposable", tech_stack="Python", date_range="2024", bullets=["x"], order=99)
+    rows = {
+        "posts": [blog_service.create_post(post, "admin@example.com", "Admin")["post_id"] for _ in range(n)],
+        "comments": [
+            comment_service.create_comment(
+                post_id, CommentCreate(content="Disposable"), user["user_id"], user["email"], user["display_name"],
+            )["comment_id"]
+            for _ in range(n)
+        ],
+        "experiences": [experience_service.create_experience(experience)["experience_id"] for _ in range(n)],
+        "projects": [project_service.create_project(project)["project_id"] for _ in range(n)],
+    }
+    db_client.resource.latency_ms = latency
+    return rows
+
+
+async def login(app, email: str, password: str) -> str:
+    resp = await asgi_request(app, "POST", "/api/auth/login", json_body={"email": email, "password": password})
+    if resp.status != 200:
+        raise RuntimeError(f"login {email} -> {resp.status}: {resp.body[:200]!r}")
+    return resp.json()["access_token"]
+
+
+def scenarios(ctx: dict) -> list:
+    """(label, method, path, load kwargs). `path`/`json_body` may be callables."""
+    admin = {"authorization": f"Bearer {ctx['admin_token']}"}
+    user = {"authorization": f"Bearer {ctx['user_token']}"}
+    post_id, exp_id, proj_id = ctx["post_id"], ctx["experience_id"], ctx["project_id"]
+    rows = ctx["rows"]
+    post_body = {"title": "Bench post", "summary": "Created by the benchmark.", "content": "## Body\n\nText.", "tags": ["Bench"]}
+    exp_body = {
+        "company": "Bench", "role": "Engineer", "location": "Remote",
+        "start_date": "Jan. 2024", "end_date": "Present", "bullets": ["x"], "order": 50,
+    }
+    proj_body = {"title": "Bench", "tech_stack": "Python", "date_range": "2024", "bullets": ["x"], "order": 50}
+    ok, created, gone = {200}, {201}, {204}
+    return [
+        ("GET  /api/health", "GET", "/api/health", {"expect": ok}),
+        ("GET  /api/health/cache", "GET", "/api/health/cache", {"expect": ok, "headers": admin}),
+        ("GET  /api/home", "GET", "/api/home", {"expect": ok}),
+        ("GET  /api/home (signed in)", "GET", "/api/home", {"expect": ok, "headers": user}),
+        ("GET  /api/experiences", "GET", "/api/experiences", {"expect": ok}),
+        ("GET  /api/experiences/{id}", "GET", f"/api/experiences/{exp_id}", {"expect": ok}),
+        ("GET  /api/projects", "GET", "/api/projects", {"expect": ok}),
+        ("GET  /api/projects/{id}", "GET", f"/api/projects/{proj_id}", {"expect": ok}),
+        ("GET  /api/blog", "GET", "/api/blog", {"expect": ok}),
+        ("GET  /api/blog (gzip)", "GET", "/api/blog", {"expect": ok, "headers": {"accept-encoding": "gzip"}}),
+        ("GET  /api/blog?cursor (page 2)", "GET", "/api/blog", {"expect": ok, "query": f"cursor={ctx['cursor']}"}),
+        ("GET  /api/blog (304)", "GET", "/api/blog", {"expect": {304}, "headers": {"if-none-match": ctx["feed_etag"]}}),
+        ("GET  /api/blog/all", "GET", "/api/blog/all", {"expect": ok, "headers": admin}),
+        ("GET  /api/blog/bulk (25 ids)", "GET", "/api/blog/bulk",
+         {"expect": ok, "headers": admin, "query": "&".join(f"ids={i}" for i in ctx["feed_ids"])}),
+        ("GET  /api/blog?tag", "GET", "/api/blog", {"expect": ok, "query": "tag=RAG"}),
+        ("GET  /api/blog/tags", "GET", "/api/blog/tags", {"expect": ok}),
+        ("GET  /api/blog/search", "GET", "/api/blog/search", {"expect": ok, "query": "q=data+pipelines"}),
+        ("GET  /api/blog/{id}", "GET", f"/api/blog/{post_id}", {"expect": ok}),
+        ("GET  /api/blog/{id} (gzip)", "GET", f"/api/blog/{post_id}", {"expect": ok, "headers": {"accept-encoding": "gzip"}}),
+        ("GET  /api/blog/{id}/comments", "GET", f"/api/blog/{post_id}/comments", {"expect": ok}),
+        ("GET  /api/auth/me", "GET", "/api/auth/me", {"expect": ok, "headers": user}),
+        ("GET  /api/auth/me?fresh=true", "GET", "/api/auth/me", {"expect": ok, "headers": user, "query": "fresh=true"}),
+        ("POST /api/auth/logout", "POST", "/api/auth/logout", {"expect": ok}),
+        ("POST /api/auth/login", "POST", "/api/auth/login",
+         {"expect": ok, "hashing": True, "json_body": {"email": USER_EMAIL, "password": USER_PASSWORD}}),
+        ("POST /api/auth/register", "POST", "/api/auth/register",
+         {"expect": ok, "hashing": True, "json_body": lambda n: {
+             "email": f"bench-{ctx['run']}-{n}@example.com", "password": USER_PASSWORD, "display_name": "Bench"}}),
+        ("POST /api/blog", "POST", "/api/blog", {"expect": created, "headers": admin, "json_body": post_body}),
+        ("PUT  /api/blog/{id}", "PUT", f"/api/blog/{post_id}", {"expect": ok, "headers": admin, "json_body": {"tags": ["Bench"]}}),
+        ("DEL  /api/blog/{id}", "DELETE", lambda n: f"/api/blog/{rows['posts'][n]}", {"expect": gone, "headers": admin}),
+        ("POST /api/blog/{id}/comments", "POST", f"/api/blog/{post_id}/comments",
+         {"expect": created, "headers": user, "json_body": {"content": "Nice post!"}}),
+        ("DEL  /api/blog/{id}/comments/{id}", "DELETE",
+         lambda n: f"/api/blog/{post_id}/comments/{rows['comments'][n]}", {"expect": gone, "headers": user}),
+        ("POST /api/experiences", "POST", "/api/experiences", {"expect": created, "headers": admin, "json_body": exp_body}),
+        ("PUT  /api/experiences/{id}", "PUT", f"/api/experiences/{exp_id}", {"expect": ok, "headers": admin, "json_body": {"order": 0}}),
+        ("DEL  /api/experiences/{id}", "DELETE", lambda n: f"/api/experiences/{rows['experiences'][n]}", {"expect": gone, "headers": admin}),
+        ("POST /api/projects", "POST", "/api/projects", {"expect": created, "headers": admin, "json_body": proj_body}),
+        ("PUT  /api/projects/{id}", "PUT", f"/api/projects/{proj_id}", {"expect": ok, "headers": admin, "json_body": {"order": 0}}),
+        ("DEL  /api/projects/{id}", "DELETE", lambda n: f"/api/projects/{rows['projects'][n]}", {"expect": gone, "headers": admin}),
+    ]
+
+
+async def main(args) -> int:
+    configure_env(args.latency_ms)
+    script = seed(args.posts, args.comments_per_post)
+
+    from main import app
+    from app.config.settings import settings
+
+    await asgi_request(app, "POST", "/api/auth/register", json_body={
+        "email": USER_EMAIL, "password": USER_PASSWORD, "display_name": "Bench User"})
+    admin_token = await login(app, script["SEED_ADMIN_EMAIL"], os.environ["SEED_ADMIN_PASSWORD"])
+    user_token = await login(app, USER_EMAIL, USER_PASSWORD)
+    me = (await asgi_request(app, "GET", "/api/auth/me", headers={"authorization": f"Bearer {user_token}"})).json()
+
+    # A generated post: it has comments and a realistic body.
+    post_id = script["generate_fixtures"](1, 0)[0][0]["post_id"]
+    rows = prepare_rows(args.requests, me, post_id)
+    feed = await asgi_request(app, "GET", "/api/blog")
+    ctx = {
+        "run": int(time.time()),
+        "admin_token": admin_token,
+        "user_token": user_token,
+        "post_id": post_id,
+        "cursor": feed.json()["next_cursor"],
+        "feed_ids": [post["post_id"] for post in feed.json()["posts"]],
+        "feed_etag": feed.headers["etag"],
+        "experience_id": (await asgi_request(app, "GET", "/api/experiences")).json()["experiences"][0]["experience_id"],
+        "project_id": (await asgi_request(app, "GET", "/api/projects")).json()["projects"][0]["project_id"],
+        "rows": rows,
+    }
+
+    print(f"DynamoDB latency {args.latency_ms} ms (simulated), concurrency {args.concurrency}, "
+          f"{args.requests} requests per route\n")
+    results = {}
+    for label, method, path, kwargs in scenarios(ctx):
+        if args.only and args.only not in label:
+            continue
+        concurrency, total = args.concurrency, args.requests
+        if kwargs.pop("hashing", False):
+            # bcrypt routes shed load past workers + queue; stay under it.
+            concurrency = min(concurrency, settings.password_hash_workers)
+            total = min(total, args.hash_requests)
+        results[label] = await load(app, method, path, concurrency=concurrency, total=total, **kwargs)
+        print_row(label, results[label])
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        return compare(results, args.compare, args.threshold)
+    return 0
+
+
+def compare(results: dict, baseline_path: str, threshold: float) -> int:
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\np95 vs {baseline_path} (regression if > {threshold:.2f}x)")
+    regressions = 0
+    for label, stats in results.items():
+        if label not in baseline:
+            continue
+        ratio = stats["p95_ms"] / max(baseline[label]["p95_ms"], 1e-6)
+        flag = "REGRESSION" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(f"  {label:<36} {baseline[label]['p95_ms']:>8.2f} -> {stats['p95_ms']:>8.2f} ms  {ratio:>5.2f}x  {flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--comments-per-post", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--hash-requests", type=int, default=20, help="Requests for bcrypt-bound routes.")
+    parser.add_argument("--latency-ms", type=float, default=4.0)
+    parser.add_argument("--only", help="Only run routes whose label contains this string.")
+    parser.add_argument("--save", help="Write results as JSON.")
+    parser.add_argument("--compare", help="Baseline JSON from an earlier --save.")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    sys.exit(asyncio.run(main(parser.parse_args())))
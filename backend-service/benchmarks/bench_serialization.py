@@ -0,0 +1,85 @@
+"""
+Serialization time per list page: FastAPI's response_model path vs the
+FastJSONResponse path, for 25- and 100-item pages.
+
+  pydantic -> validate into the response model, dump in JSON mode, json.dumps
+              (what FastAPI does when a route returns a plain value)
+  fast     -> conform() + orjson with Decimal handling (what the list routes do)
+
+Items are shaped like boto3 output (numbers as Decimal). Pure CPU.
+Run: python -m benchmarks.bench_serialization [--repeat 300]
+"""
+
+import argparse
+import json
+import time
+from decimal import Decimal
+
+from app.models.blog import BlogPostListResponse, BlogPostSummary
+from app.models.comment import CommentListResponse, CommentResponse
+from app.models.experience import ExperienceListResponse, ExperienceResponse
+from app.utils.serialization import FastJSONResponse, conform
+
+
+def blog_item(i: int) -> dict:
+    return {
+        "post_id": f"post-{i}", "title": f"Post {i}", "summary": "Summary text " * 10,
+        "tags": ["AWS", "Python"], "cover_image_url": None, "author_name": "Author",
+        "is_published": True, "post_status": "published",
+        "created_at": "2026-01-01T00:00:00", "updated_at": "2026-01-01T00:00:00",
+    }
+
+
+def comment_item(i: int) -> dict:
+    return {
+        "comment_id": f"comment-{i}", "post_id": "post-1", "user_id": "user-1",
+        "user_email": "user@example.com", "display_name": "User",
+        "content": "Nice post! " * 8, "created_at": "2026-01-01T00:00:00",
+    }
+
+
+def experience_item(i: int) -> dict:
+    return {
+        "experience_id": f"exp-{i}", "company": "Company", "role": "Engineer",
+        "location": "Seattle, WA", "start_date": "Jun. 2025", "end_date": "Present",
+        "bullets": ["Did a thing with measurable impact. " * 3] * 4, "order": Decimal(i),
+    }
+
+
+ENDPOINTS = [
+    ("GET /api/blog", BlogPostListResponse, BlogPostSummary, "posts", blog_item, True),
+    ("GET /api/blog/{id}/comments", CommentListResponse, CommentResponse, "comments", comment_item, True),
+    ("GET /api/experiences", ExperienceListResponse, ExperienceResponse, "experiences", experience_item, False),
+]
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(repeat: int) -> None:
+    for label, list_model, item_model, key, make, paginated in ENDPOINTS:
+        print(label)
+        for size in (25, 100):
+            items = [make(i) for i in range(size)]
+            extra = {"next_cursor": None} if paginated else {}
+
+            def pydantic_path():
+                model = list_model.model_validate({key: items, "count": size, **extra})
+                return json.dumps(model.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")).encode()
+
+            def fast_path():
+                return FastJSONResponse({key: conform(item_model, items), "count": size, **extra}).body
+
+            slow_us, fast_us = timed(pydantic_path, repeat), timed(fast_path, repeat)
+            print(f"  {size:>3} items   pydantic {slow_us:9.1f} µs   fast {fast_us:9.1f} µs   {slow_us / fast_us:5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,68 @@
+"""
+Public read routes served live vs from the exported snapshot.
+
+Seeds the in-memory DynamoDB like bench_routes.py, drives each route live,
+then exports a snapshot (app/utils/snapshot.py) into a temporary directory
+and drives the same routes again. Snapshot hits make no DynamoDB calls, so
+the gap grows with `--latency-ms`.
+Run: python -m benchmarks.bench_snapshot [--posts 2000] [--latency-ms 4]
+        [--concurrency 16] [--requests 400]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.bench_routes import configure_env, seed
+from benchmarks.common import asgi_request, load, print_row
+
+
+async def main(args) -> None:
+    configure_env(args.latency_ms)
+    os.environ["SNAPSHOT_DIR"] = tempfile.mkdtemp(prefix="bench-snapshot-")
+    script = seed(args.posts, args.comments_per_post)
+
+    from main import app
+    from app.utils.snapshot import export, snapshot_store
+
+    # A published generated post (every tenth one is a draft): it has comments.
+    post_id = script["generate_fixtures"](2, 0)[0][1]["post_id"]
+    feed = (await asgi_request(app, "GET", "/api/blog")).json()
+    routes = [
+        ("GET  /api/home", "/api/home", ""),
+        ("GET  /api/experiences", "/api/experiences", ""),
+        ("GET  /api/blog", "/api/blog", ""),
+        ("GET  /api/blog?cursor (page 2)", "/api/blog", f"cursor={feed['next_cursor']}"),
+        ("GET  /api/blog?tag", "/api/blog", "tag=RAG"),
+        ("GET  /api/blog/{id}", f"/api/blog/{post_id}", ""),
+        ("GET  /api/blog/{id}/comments", f"/api/blog/{post_id}/comments", ""),
+    ]
+
+    print(f"DynamoDB latency {args.latency_ms} ms (simulated), concurrency {args.concurrency}, "
+          f"{args.requests} requests per route\n")
+    print("live")
+    for label, path, query in routes:
+        print_row(label, await load(app, "GET", path, query=query, concurrency=args.concurrency,
+                                    total=args.requests, expect={200}))
+
+    started = time.perf_counter()
+    summary = await export(app, os.environ["SNAPSHOT_DIR"])
+    snapshot_store.reload()
+    print(f"\nexported {summary['entries']} responses ({summary['bytes'] / 1024:.0f} KiB gzip) "
+          f"in {time.perf_counter() - started:.1f}s\n")
+    print("snapshot")
+    for label, path, query in routes:
+        print_row(label, await load(app, "GET", path, query=query, concurrency=args.concurrency,
+                                    total=args.requests, expect={200}))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=2000)
+    parser.add_argument("--comments-per-post", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=4.0)
+    asyncio.run(main(parser.parse_args()))
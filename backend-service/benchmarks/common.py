@@ -0,0 +1,146 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Requests are driven straight through the ASGI app in-process, so the numbers
+measure the service (routing, handlers, DynamoDB calls, serialization) without
+an HTTP server or client library in the way.
+Run scripts from backend-service/:  python -m benchmarks.<script>
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Tuple, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+class ASGIResponse:
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        self.status = status
+        self.headers = {k.decode().lower(): v.decode() for k, v in headers}
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    *,
+    query: str = "",
+    headers: Optional[Dict[str, str]] = None,
+    json_body: Any = None,
+) -> ASGIResponse:
+    """Issue one HTTP request against an ASGI app and collect the response."""
+    body = json.dumps(json_body).encode() if json_body is not None else b""
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    if json_body is not None:
+        raw_headers.append((b"content-type", b"application/json"))
+    raw_headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.Event().wait()
+
+    status = 0
+    resp_headers: List[Tuple[bytes, bytes]] = []
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status, resp_headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            resp_headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return ASGIResponse(status, resp_headers, b"".join(chunks))
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summarize(latencies_ms: Sequence[float], elapsed_s: float) -> Dict[str, float]:
+    return {
+        "requests": len(latencies_ms),
+        "rps": len(latencies_ms) / elapsed_s if elapsed_s else 0.0,
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+    }
+
+
+async def load(
+    app,
+    method: str,
+    path: Union[str, Callable[[int], str]],
+    *,
+    concurrency: int,
+    total: int,
+    expect: Optional[Collection[int]] = None,
+    json_body: Any = None,
+    **kwargs,
+) -> Dict[str, float]:
+    """Fire `total` requests with at most `concurrency` in flight.
+
+    `path` and `json_body` may be callables of the request number, for routes
+    that need a distinct target per request (deletes, unique emails). With
+    `expect`, any other status aborts the run instead of timing an error path.
+    """
+    latencies: List[float] = []
+    issued = 0
+
+    async def worker():
+        nonlocal issued
+        while issued < total:
+            n = issued
+            issued += 1
+            target = path(n) if callable(path) else path
+            body = json_body(n) if callable(json_body) else json_body
+            t0 = time.perf_counter()
+            resp = await asgi_request(app, method, target, json_body=body, **kwargs)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if resp.status >= 500 or (expect is not None and resp.status not in expect):
+                raise RuntimeError(f"{method} {target} -> {resp.status}: {resp.body[:200]!r}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def print_row(label: str, stats: Dict[str, float]) -> None:
+    print(
+        f"  {label:<36} {stats['requests']:>6} req  {stats['rps']:>9.1f} req/s  "
+        f"p50 {stats['p50_ms']:>7.2f} ms  p95 {stats['p95_ms']:>7.2f} ms  p99 {stats['p99_ms']:>7.2f} ms"
+    )
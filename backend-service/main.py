@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config.lifecycle import lifespan
 from app.config.settings import settings
 from app.controllers.auth_controller import router as auth_router
 from app.controllers.blog_controller import router as blog_router
@@ -8,6 +9,12 @@ from app.controllers.experience_controller import router as experience_router
 from app.controllers.project_controller import router as project_router
 from app.controllers.comment_controller import router as comment_router
 from app.controllers.health_controller import router as health_router
+from app.controllers.snapshot_controller import router as snapshot_router
+from app.controllers.home_controller import router as home_router
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.snapshot import SnapshotMiddleware
 
 app = FastAPI(
     title=settings.app_name,
@@ -15,19 +22,32 @@ app = FastAPI(
     description="Backend API for personal portfolio & blog website",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
+# Added first so it runs inside CORS: snapshot responses still get CORS headers.
+app.add_middleware(SnapshotMiddleware)
+# Inside CORS as well, so browsers can read the 429.
+if settings.rate_limit_enabled:
+    app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origin_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
 
 app.include_router(health_router)
 app.include_router(auth_router)
+app.include_router(home_router)
 app.include_router(blog_router)
 app.include_router(comment_router)
 app.include_router(experience_router)
 app.include_router(project_router)
+app.include_router(snapshot_router)
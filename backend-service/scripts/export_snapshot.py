@@ -0,0 +1,44 @@
+"""
+Render every public GET response (experiences, projects, the anonymous
+homepage, blog and tag pages, posts and their comment pages) into a new
+snapshot version the API serves without DynamoDB calls. See
+app/utils/snapshot.py for the format and staleness rules.
+
+Requests go through the app in-process, so the files hold exactly what the
+live routes return. Running API processes pick up the new version within
+SNAPSHOT_CHECK_SECONDS.
+Run: python scripts/export_snapshot.py [--dir /var/cache/site-snapshot] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def main() -> None:
+    from app.config.settings import settings
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=settings.snapshot_dir, help="Snapshot directory (default: SNAPSHOT_DIR)")
+    parser.add_argument("--concurrency", type=int, default=settings.snapshot_export_concurrency,
+                        help="Requests rendered at once")
+    args = parser.parse_args()
+    if not args.dir:
+        parser.error("no snapshot directory: pass --dir or set SNAPSHOT_DIR")
+
+    from main import app
+    from app.utils.snapshot import export
+
+    summary = asyncio.run(export(app, args.dir, concurrency=args.concurrency))
+    print(
+        f"Snapshot v{summary['version']}: {summary['entries']} responses, "
+        f"{summary['raw_bytes'] / 1024:.0f} KiB -> {summary['bytes'] / 1024:.0f} KiB gzip "
+        f"in {summary['seconds']:.1f}s ({args.dir})"
+    )
+
+
+if __name__ == "__main__":
+    main()
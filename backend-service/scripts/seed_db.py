@@ -1,17 +1,33 @@
 """
 Database seed script — creates DynamoDB tables and inserts initial data.
 Fully idempotent: safe to run multiple times without duplicating data.
-  - Tables: uses DescribeTable to skip existing tables.
-  - Rows:   uses deterministic UUIDs + ConditionExpression to skip existing items.
+  - Tables: uses DescribeTable to skip existing tables; missing tables are
+            created together and waited on as a group.
+  - Rows:   uses deterministic UUIDs; existing keys are read with
+            BatchGetItem and only the missing rows are written with
+            BatchWriteItem (unprocessed items are retried with backoff).
+  - Indexes: rows are written around BlogService, so the blog search index
+            and the PostTags tag index are rebuilt whenever posts were
+            added (or with --reindex).
 Works with both local (Docker) and cloud DynamoDB via DEPLOY_ENV env var.
+  - GSIs:   missing indexes are added and waited on; a live index is never
+            dropped here, because containers still running the previous
+            release may be querying it. Indexes in RETIRED_INDEXES are
+            dropped only with --migrate-indexes, once no release reads them.
 Run: python scripts/seed_db.py
+     python scripts/seed_db.py --fixture-posts 5000 --comments-per-post 10
+     python scripts/seed_db.py --reindex
+     python scripts/seed_db.py --migrate-indexes
 """
 
+import argparse
+import random
 import sys
 import os
 import time
 import uuid
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -47,8 +63,17 @@ else:
 
 from passlib.context import CryptContext
 from app.config.database import db_client
+from app.config.settings import settings
+from app.models.blog import BLOG_SUMMARY_FIELDS
+from app.services.base_service import BATCH_WRITE_LIMIT, batch_get, batch_write
+from app.services.blog_service import STATUS_INDEX
+from app.services.comment_service import comment_preview
+from app.utils.content_version import content_versions
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Table/index keys are always projected; DynamoDB rejects them in NonKeyAttributes.
+_BLOG_INDEX_KEYS = {"post_id", "post_status", "entity_type", "created_at"}
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
 
 # ── Deterministic UUID namespace for seed data ──────────────────
 SEED_NS = uuid.UUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890")
@@ -79,7 +104,38 @@ TABLE_DEFINITIONS = [
     {
         "TableName": "BlogPosts",
         "KeySchema": [{"AttributeName": "post_id", "KeyType": "HASH"}],
-        "AttributeDefinitions": [{"AttributeName": "post_id", "AttributeType": "S"}],
+        "AttributeDefinitions": [
+            {"AttributeName": "post_id", "AttributeType": "S"},
+            {"AttributeName": "post_status", "AttributeType": "S"},
+            {"AttributeName": "entity_type", "AttributeType": "S"},
+            {"AttributeName": "created_at", "AttributeType": "S"},
+        ],
+        "GlobalSecondaryIndexes": [
+            {
+                "IndexName": STATUS_INDEX,
+                "KeySchema": [
+                    {"AttributeName": "post_status", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+                # List pages never read `content`; keep it out of the index.
+                "Projection": {
+                    "ProjectionType": "INCLUDE",
+                    "NonKeyAttributes": [f for f in BLOG_SUMMARY_FIELDS if f not in _BLOG_INDEX_KEYS],
+                },
+            },
+            {
+                # Every post (drafts too) under one partition: the admin list.
+                "IndexName": "gsi_all_created",
+                "KeySchema": [
+                    {"AttributeName": "entity_type", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+                "Projection": {
+                    "ProjectionType": "INCLUDE",
+                    "NonKeyAttributes": [f for f in BLOG_SUMMARY_FIELDS if f not in _BLOG_INDEX_KEYS],
+                },
+            },
+        ],
         "BillingMode": "PAY_PER_REQUEST",
     },
     {
@@ -114,8 +170,51 @@ TABLE_DEFINITIONS = [
         ],
         "BillingMode": "PAY_PER_REQUEST",
     },
+    {
+        # Serialized blog search index: one manifest row + compressed chunks
+        "TableName": "SearchIndex",
+        "KeySchema": [
+            {"AttributeName": "index_name", "KeyType": "HASH"},
+            {"AttributeName": "part", "KeyType": "RANGE"},
+        ],
+        "AttributeDefinitions": [
+            {"AttributeName": "index_name", "AttributeType": "S"},
+            {"AttributeName": "part", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
+    {
+        # Tag -> published post adjacency list (+ one "#counts" aggregate item)
+        "TableName": "PostTags",
+        "KeySchema": [
+            {"AttributeName": "tag", "KeyType": "HASH"},
+            {"AttributeName": "created_post", "KeyType": "RANGE"},
+        ],
+        "AttributeDefinitions": [
+            {"AttributeName": "tag", "AttributeType": "S"},
+            {"AttributeName": "created_post", "AttributeType": "S"},
+        ],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
+    {
+        # One item of per-table write counters: the public ETags (app/utils/content_version.py)
+        "TableName": "ContentVersions",
+        "KeySchema": [{"AttributeName": "scope", "KeyType": "HASH"}],
+        "AttributeDefinitions": [{"AttributeName": "scope", "AttributeType": "S"}],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
+    {
+        # Token buckets for RATE_LIMIT_BACKEND=dynamodb (expired via TTL)
+        "TableName": "RateLimits",
+        "KeySchema": [{"AttributeName": "bucket", "KeyType": "HASH"}],
+        "AttributeDefinitions": [{"AttributeName": "bucket", "AttributeType": "S"}],
+        "BillingMode": "PAY_PER_REQUEST",
+    },
 ]
 
+# Table -> TTL attribute, enabled when the table is created
+TIME_TO_LIVE = {"RateLimits": "expires_at"}
+
 # ── Seed data (deterministic IDs) ───────────────────────────────
 SEED_EXPERIENCES = [
     {
@@ -202,7 +301,6 @@ SEED_ADMIN = {
     "user_id": seed_id("admin:zhouzejun"),
     "email": SEED_ADMIN_EMAIL,
     "display_name": SEED_ADMIN_NAME,
-    "hashed_password": pwd_context.hash(SEED_ADMIN_PASSWORD),
     "role": "admin",
     "created_at": datetime.utcnow().isoformat(),
 }
@@ -217,6 +315,8 @@ SEED_BLOG_POSTS = [
         "author_email": "zhouzejun1147@gmail.com",
         "author_name": "ZZ",
         "is_published": True,
+        "post_status": "published",
+        "entity_type": "post",
         "created_at": datetime.utcnow().isoformat(),
         "updated_at": datetime.utcnow().isoformat(),
     },
@@ -229,12 +329,22 @@ SEED_BLOG_POSTS = [
         "author_email": "zhouzejun1147@gmail.com",
         "author_name": "ZZ",
         "is_published": True,
+        "post_status": "published",
+        "entity_type": "post",
         "created_at": datetime.utcnow().isoformat(),
         "updated_at": datetime.utcnow().isoformat(),
     },
 ]
 
 
+# Superseded GSIs (table -> index names). The previous release may still
+# query them during a rolling deploy, so only --migrate-indexes drops them.
+RETIRED_INDEXES = {
+    # Replaced by STATUS_INDEX, which also projects the comment stats.
+    "BlogPosts": ["gsi_published_created"],
+}
+
+
 # ── Helpers ──────────────────────────────────────────────────────
 def _table_exists(table_name: str) -> bool:
     try:
@@ -260,40 +370,326 @@ def _put_if_absent(table, item, key_field: str) -> bool:
         raise
 
 
+def _missing_projection(existing_gsi, gsi) -> set:
+    """Attributes `gsi` projects that an existing INCLUDE index lacks."""
+    current = existing_gsi.get("Projection", {})
+    if current.get("ProjectionType") != "INCLUDE" or gsi["Projection"]["ProjectionType"] != "INCLUDE":
+        return set()
+    return set(gsi["Projection"]["NonKeyAttributes"]) - set(current.get("NonKeyAttributes", []))
+
+
+def _ensure_indexes(table_def) -> None:
+    """Add GSIs defined in TABLE_DEFINITIONS that an existing table is missing,
+    waiting for each backfill so the code started after the seed can query it.
+    DynamoDB accepts one GSI creation per UpdateTable call and cannot change
+    a projection in place. An existing index with a narrower projection is
+    left alone: dropping it would break the running release. Give the new
+    projection a new index name and retire the old one instead."""
+    table = db_client.resource.Table(table_def["TableName"])
+    existing = {gsi["IndexName"]: gsi for gsi in (table.global_secondary_indexes or [])}
+    for gsi in table_def.get("GlobalSecondaryIndexes", []):
+        if gsi["IndexName"] in existing:
+            missing = _missing_projection(existing[gsi["IndexName"]], gsi)
+            if missing:
+                print(f"  WARNING: index '{gsi['IndexName']}' does not project {sorted(missing)}; "
+                      "rename it in TABLE_DEFINITIONS to replace it")
+            continue
+        key_attrs = {k["AttributeName"] for k in gsi["KeySchema"]}
+        table.update(
+            AttributeDefinitions=[
+                a for a in table_def["AttributeDefinitions"] if a["AttributeName"] in key_attrs
+            ],
+            GlobalSecondaryIndexUpdates=[{"Create": gsi}],
+        )
+        _wait_for_indexes(table)
+        print(f"  Added index '{gsi['IndexName']}' to '{table_def['TableName']}'")
+
+
+def drop_retired_indexes() -> None:
+    """Delete the RETIRED_INDEXES that still exist. Run only once every
+    running release reads the indexes that replaced them."""
+    for table_name, index_names in RETIRED_INDEXES.items():
+        if not _table_exists(table_name):
+            continue
+        table = db_client.resource.Table(table_name)
+        existing = {gsi["IndexName"] for gsi in (table.global_secondary_indexes or [])}
+        for name in index_names:
+            if name not in existing:
+                continue
+            table.update(GlobalSecondaryIndexUpdates=[{"Delete": {"IndexName": name}}])
+            _wait_for_indexes(table)
+            print(f"  Dropped retired index '{name}' from '{table_name}'")
+
+
+def _wait_for_indexes(table, delay=5) -> None:
+    """Block until every GSI on the table is ACTIVE (backfill finished)."""
+    while True:
+        table.reload()
+        statuses = [gsi.get("IndexStatus") for gsi in (table.global_secondary_indexes or [])]
+        if all(status == "ACTIVE" for status in statuses):
+            return
+        time.sleep(delay)
+
+
 def create_tables():
+    """Issue CreateTable for every missing table before waiting on any of
+    them, so DynamoDB provisions them in parallel."""
+    created = []
     for table_def in TABLE_DEFINITIONS:
         name = table_def["TableName"]
         if _table_exists(name):
             print(f"  Table '{name}' already exists, skipping.")
+            _ensure_indexes(table_def)
             continue
         db_client.resource.create_table(**table_def)
+        created.append(name)
+    for name in created:
         db_client.resource.Table(name).wait_until_exists()
         print(f"  Created table '{name}'")
+        if name in TIME_TO_LIVE:
+            db_client.resource.meta.client.update_time_to_live(
+                TableName=name,
+                TimeToLiveSpecification={"Enabled": True, "AttributeName": TIME_TO_LIVE[name]},
+            )
+
+
+# ── Batch helpers ────────────────────────────────────────────────
+# Chunking and unprocessed-item retries live in base_service (batch_get /
+# batch_write); seeding only fans the write chunks out over threads.
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _put_missing(table_name: str, items, key_field: str, workers: int) -> int:
+    """Write the items whose keys are not in the table yet; returns how many.
+    Chunks of 25 are written concurrently across `workers` threads."""
+    keys = [{key_field: item[key_field]} for item in items]
+    existing = {found[key_field] for found in batch_get(table_name, keys, projection=[key_field])}
+    missing = [{"PutRequest": {"Item": item}} for item in items if item[key_field] not in existing]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        # list() re-raises the first failed chunk's exception.
+        list(pool.map(lambda chunk: batch_write(table_name, chunk), _chunks(missing, BATCH_WRITE_LIMIT)))
+    return len(missing)
+
+
+# ── Generated load-test fixtures ─────────────────────────────────
+FIXTURE_EPOCH = datetime(2024, 1, 1)
+FIXTURE_TAGS = ["AWS", "Python", "DynamoDB", "FastAPI", "LLM", "RAG", "NLP", "Distributed Systems"]
+FIXTURE_USERS = 50
+
+
+def generate_fixtures(n_posts: int, comments_per_post: int):
+    """Deterministic posts and comments for load testing. Every key and
+    timestamp derives from the index, so re-running is a no-op."""
+    rng = random.Random(0)
+    paragraph = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 8
+    posts, comments = [], []
+    for i in range(n_posts):
+        post_id = seed_id(f"fixture:post:{i}")
+        created = FIXTURE_EPOCH + timedelta(minutes=37 * i)
+        is_published = i % 10 != 0
+        posts.append({
+            "post_id": post_id,
+            "title": f"Fixture post #{i}",
+            "summary": f"Generated post {i} for load testing.",
+            "content": "\n\n".join(f"## Section {n}\n\n{paragraph}" for n in range(4)),
+            "tags": rng.sample(FIXTURE_TAGS, 3),
+            "author_email": SEED_ADMIN_EMAIL,
+            "author_name": SEED_ADMIN_NAME,
+            "is_published": is_published,
+            "post_status": "published" if is_published else "draft",
+            "entity_type": "post",
+            "created_at": created.isoformat(),
+            "updated_at": created.isoformat(),
+            "comment_count": comments_per_post,
+        })
+        for j in range(comments_per_post):
+            user = (i + j) % FIXTURE_USERS
+            comments.append({
+                "comment_id": seed_id(f"fixture:comment:{i}:{j}"),
+                "post_id": post_id,
+                "user_id": seed_id(f"fixture:user:{user}"),
+                "user_email": f"loadtest{user}@example.com",
+                "display_name": f"Load Tester {user}",
+                "content": f"Fixture comment {j} on post {i}.",
+                "created_at": (created + timedelta(minutes=j + 1)).isoformat(),
+            })
+        if comments_per_post:
+            posts[-1]["last_comment_at"] = comments[-1]["created_at"]
+            posts[-1]["last_comment"] = comment_preview(comments[-1])
+    return posts, comments
+
+
+def backfill_post_status():
+    """Posts written before the status / all-posts GSIs existed
+    lack `post_status` / `entity_type` and are therefore invisible to those
+    indexes. Derive `post_status` from `is_published`."""
+    blog_table = db_client.get_table("BlogPosts")
+    params = {
+        "FilterExpression": "attribute_not_exists(post_status) OR attribute_not_exists(entity_type)",
+        "ProjectionExpression": "post_id, is_published",
+    }
+    n = 0
+    while True:
+        response = blog_table.scan(**params)
+        for item in response.get("Items", []):
+            blog_table.update_item(
+                Key={"post_id": item["post_id"]},
+                UpdateExpression="SET post_status = if_not_exists(post_status, :s), entity_type = :e",
+                ExpressionAttributeValues={
+                    ":s": "published" if item.get("is_published") else "draft",
+                    ":e": "post",
+                },
+            )
+            n += 1
+        if "LastEvaluatedKey" not in response:
+            break
+        params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    if n:
+        content_versions.bump("BlogPosts")
+        print(f"  Backfilled post_status / entity_type on {n} blog posts")
+    return n
+
+
+def _post_indexes_missing() -> bool:
+    from app.services.search_service import search_service
+    from app.services.tag_service import COUNTS_KEY, tag_service
+
+    return search_service.get_manifest() is None or "Item" not in tag_service.table.get_item(Key=COUNTS_KEY)
+
+
+def backfill_comment_stats():
+    """Posts written before CommentService maintained `comment_count`,
+    `last_comment_at` and `last_comment` get them from gsi_post_id."""
+    from boto3.dynamodb.conditions import Key
 
-
-def seed_data():
+    blog_table = db_client.get_table("BlogPosts")
+    comments_table = db_client.get_table("Comments")
+    params = {
+        "FilterExpression": "attribute_not_exists(comment_count)",
+        "ProjectionExpression": "post_id",
+    }
+    n = 0
+    while True:
+        response = blog_table.scan(**params)
+        for item in response.get("Items", []):
+            query = {"IndexName": "gsi_post_id", "KeyConditionExpression": Key("post_id").eq(item["post_id"])}
+            count, page = 0, {"Select": "COUNT", **query}
+            while True:
+                counted = comments_table.query(**page)
+                count += counted["Count"]
+                if "LastEvaluatedKey" not in counted:
+                    break
+                page["ExclusiveStartKey"] = counted["LastEvaluatedKey"]
+            latest = comments_table.query(ScanIndexForward=False, Limit=1, **query).get("Items", [])
+            update = {
+                "Key": {"post_id": item["post_id"]},
+                # A comment written meanwhile has already set comment_count via ADD.
+                "ConditionExpression": "attribute_not_exists(comment_count)",
+                "UpdateExpression": "SET comment_count = :n",
+                "ExpressionAttributeValues": {":n": count},
+            }
+            if latest:
+                update["UpdateExpression"] += ", last_comment_at = :at, last_comment = :preview"
+                update["ExpressionAttributeValues"].update(
+                    {":at": latest[0]["created_at"], ":preview": comment_preview(latest[0])}
+                )
+            try:
+                blog_table.update_item(**update)
+                n += 1
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+        if "LastEvaluatedKey" not in response:
+            break
+        params["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    if n:
+        content_versions.bump("BlogPosts")
+        print(f"  Backfilled comment counts on {n} blog posts")
+
+
+def rebuild_post_indexes():
+    from app.services.blog_service import blog_service
+
+    n = blog_service.rebuild_search_index()
+    print(f"  Search index: {n} published blog posts")
+    n = blog_service.rebuild_tag_index()
+    print(f"  Tag index: {n} tag entries")
+
+
+def seed_admin():
+    """Conditional put; the bcrypt hash is only computed when the admin row
+    is actually missing, so warm restarts skip it."""
     users_table = db_client.get_table("Users")
-    if _put_if_absent(users_table, SEED_ADMIN, "user_id"):
+    if "Item" in users_table.get_item(Key={"user_id": SEED_ADMIN["user_id"]}, ProjectionExpression="user_id"):
+        print("  Admin user already exists, skipping.")
+        return
+    admin = {**SEED_ADMIN, "hashed_password": pwd_context.hash(SEED_ADMIN_PASSWORD)}
+    if _put_if_absent(users_table, admin, "user_id"):
         print(f"  Seeded admin user: {SEED_ADMIN['email']}")
     else:
         print("  Admin user already exists, skipping.")
 
-    exp_table = db_client.get_table("Experiences")
-    n = sum(1 for exp in SEED_EXPERIENCES if _put_if_absent(exp_table, exp, "experience_id"))
-    print(f"  Experiences: {n} new, {len(SEED_EXPERIENCES) - n} existing")
-
-    proj_table = db_client.get_table("Projects")
-    n = sum(1 for proj in SEED_PROJECTS if _put_if_absent(proj_table, proj, "project_id"))
-    print(f"  Projects: {n} new, {len(SEED_PROJECTS) - n} existing")
 
-    blog_table = db_client.get_table("BlogPosts")
-    n = sum(1 for post in SEED_BLOG_POSTS if _put_if_absent(blog_table, post, "post_id"))
-    print(f"  Blog posts: {n} new, {len(SEED_BLOG_POSTS) - n} existing")
+def seed_data(workers: int = 8) -> int:
+    """Returns the number of new blog posts."""
+    seed_admin()
+    new_posts = 0
+    for label, table_name, key_field, items in (
+        ("Experiences", "Experiences", "experience_id", SEED_EXPERIENCES),
+        ("Projects", "Projects", "project_id", SEED_PROJECTS),
+        ("Blog posts", "BlogPosts", "post_id", SEED_BLOG_POSTS),
+    ):
+        n = _put_missing(table_name, items, key_field, workers)
+        print(f"  {label}: {n} new, {len(items) - n} existing")
+        if table_name == "BlogPosts":
+            new_posts = n
+    return new_posts
+
+
+def seed_fixtures(n_posts: int, comments_per_post: int, workers: int = 8) -> int:
+    """Returns the number of new blog posts."""
+    posts, comments = generate_fixtures(n_posts, comments_per_post)
+    new_posts = _put_missing("BlogPosts", posts, "post_id", workers)
+    print(f"  Fixture posts: {new_posts} new, {len(posts) - new_posts} existing")
+    n = _put_missing("Comments", comments, "comment_id", workers)
+    print(f"  Fixture comments: {n} new, {len(comments) - n} existing")
+    return new_posts
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Create DynamoDB tables and seed data.")
+    parser.add_argument("--fixture-posts", type=int, default=0,
+                        help="Also load N generated blog posts for load testing.")
+    parser.add_argument("--comments-per-post", type=int, default=0,
+                        help="Generated comments per fixture post.")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Concurrent BatchWriteItem calls.")
+    parser.add_argument("--reindex", action="store_true",
+                        help="Rebuild the search and tag indexes even if no posts were added.")
+    parser.add_argument("--migrate-indexes", action="store_true",
+                        help="Drop superseded GSIs (RETIRED_INDEXES). Run after every "
+                             "container reads the indexes that replace them.")
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
+    args = parse_args()
+    started = time.perf_counter()
     print("Creating DynamoDB tables...")
     create_tables()
+    if args.migrate_indexes:
+        print("Dropping retired indexes...")
+        drop_retired_indexes()
     print("Seeding initial data...")
-    seed_data()
-    print("Done!")
+    new_posts = seed_data(args.workers)
+    if args.fixture_posts:
+        print("Loading generated fixtures...")
+        new_posts += seed_fixtures(args.fixture_posts, args.comments_per_post, args.workers)
+    new_posts += backfill_post_status()
+    backfill_comment_stats()
+    if new_posts or args.reindex or _post_indexes_missing():
+        print("Rebuilding blog search and tag indexes...")
+        rebuild_post_indexes()
+    print(f"Done! ({time.perf_counter() - started:.1f}s)")
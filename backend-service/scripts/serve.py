@@ -0,0 +1,62 @@
+"""
+Production launcher: uvicorn with one worker process per available CPU.
+
+Each worker is a separate process with its own event loop, DynamoDB pool
+and bcrypt pool, so logins in one worker do not stall reads in the others.
+Workers pre-warm on startup (app/config/lifecycle.py). With more than one
+worker, INVALIDATION_SOCKET_DIR is set to a fresh directory unless it is
+already set. Workers use it to clear each other's caches after writes.
+
+Worker count: --workers, else SERVER_WORKERS, else the CPUs this container
+may use (its cgroup CPU quota or CPU affinity, whichever is smaller).
+Run: python scripts/serve.py [--workers N] [--host 0.0.0.0] [--port 8080]
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open(CGROUP_CPU_MAX) as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def main() -> None:
+    from app.config.settings import settings
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=settings.server_workers or available_cpus())
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    if args.workers > 1 and not settings.invalidation_socket_dir:
+        # Inherited by the worker processes, which read settings on import.
+        os.environ["INVALIDATION_SOCKET_DIR"] = tempfile.mkdtemp(prefix="personalsite-workers-")
+    print(f"Starting {args.workers} worker(s) on {args.host}:{args.port}")
+
+    import uvicorn
+
+    uvicorn.run("main:app", app_dir=ROOT, host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
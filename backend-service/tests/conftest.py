@@ -0,0 +1,29 @@
+"""
+Tests run against the in-process DynamoDB stand-in (DEPLOY_ENV=memory) with
+no simulated latency, so no DynamoDB or network is needed. The environment
+is set before any `app` module is imported, because settings are read once
+at import time.
+Run (from backend-service/): python -m pytest -q
+"""
+
+import os
+import sys
+
+os.environ.setdefault("DEPLOY_ENV", "memory")
+os.environ.setdefault("MEMORY_DB_LATENCY_MS", "0")
+os.environ.setdefault("SEED_ADMIN_PASSWORD", "test-password")  # required to import seed_db
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, "scripts"))
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tables():
+    """Every table and GSI from the seed script, created once per session.
+    Tests use fresh ids, so they do not depend on each other's rows."""
+    import seed_db
+
+    seed_db.create_tables()
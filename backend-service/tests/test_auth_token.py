@@ -0,0 +1,169 @@
+import base64
+import json
+import time
+
+import pytest
+from jose import JWTError, jwt
+
+from app.config.settings import settings
+from app.middleware import auth
+from app.services.auth_service import auth_service
+from app.utils.cache import TTLCache
+
+SECRET = settings.jwt_secret_key
+ALG = settings.jwt_algorithm
+
+
+def b64(data) -> str:
+    raw = data if isinstance(data, bytes) else json.dumps(data).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def signed(claims, *, key=SECRET, algorithm=ALG, headers=None) -> str:
+    return jwt.encode(claims, key, algorithm=algorithm, headers=headers)
+
+
+def claims(**extra):
+    now = int(time.time())
+    return {"sub": "user-1", "role": "user", "iat": now, "exp": now + 600, **extra}
+
+
+def tampered_payload() -> str:
+    header, _, signature = signed(claims()).split(".")
+    return ".".join([header, b64(claims(role="admin")), signature])
+
+
+def tampered_signature() -> str:
+    token = signed(claims())
+    return token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+
+def unsigned() -> str:
+    return ".".join([b64({"alg": "none", "typ": "JWT"}), b64(claims()), ""])
+
+
+def non_object_payload() -> str:
+    return jwt.encode({}, SECRET, algorithm=ALG).split(".")[0] + "." + b64(b"[1, 2]") + "." + "x"
+
+
+TOKENS = {
+    "valid": lambda: signed(claims()),
+    "valid without exp": lambda: signed({"sub": "user-1"}),
+    "numeric string exp": lambda: signed(claims(exp=str(int(time.time()) + 600))),
+    "expired": lambda: signed(claims(exp=int(time.time()) - 5)),
+    "not yet valid": lambda: signed(claims(nbf=int(time.time()) + 600)),
+    "wrong key": lambda: signed(claims(), key="another-secret"),
+    "wrong alg": lambda: signed(claims(), algorithm="HS512"),
+    "alg none": unsigned,
+    "tampered payload": tampered_payload,
+    "tampered signature": tampered_signature,
+    "aud": lambda: signed(claims(aud="portal")),
+    "aud list": lambda: signed(claims(aud=["portal"])),
+    "at_hash": lambda: signed(claims(at_hash="abc")),
+    "sub not a string": lambda: signed(claims(sub=123)),
+    "jti not a string": lambda: signed(claims(jti=7)),
+    "exp not a number": lambda: signed(claims(exp="soon")),
+    "nbf not a number": lambda: signed(claims(nbf="later")),
+    "iat not a number": lambda: signed(claims(iat="earlier")),
+    "payload not an object": non_object_payload,
+    "two segments": lambda: ".".join(signed(claims()).split(".")[:2]),
+    "garbage": lambda: "not-a-token",
+}
+
+
+def jose_accepts(token: str) -> bool:
+    try:
+        jwt.decode(token, SECRET, algorithms=[ALG])
+    except JWTError:
+        return False
+    return True
+
+
+def fast_path_accepts(token: str) -> bool:
+    try:
+        auth_service.verify_token(token)
+    except ValueError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("case", sorted(TOKENS))
+def test_fast_path_agrees_with_jose(case):
+    token = TOKENS[case]()
+    assert fast_path_accepts(token) == jose_accepts(token)
+
+
+@pytest.mark.parametrize("case", ["valid", "valid without exp", "numeric string exp"])
+def test_accepted_tokens_return_the_same_claims(case):
+    token = TOKENS[case]()
+    assert auth_service.verify_token(token) == jwt.decode(token, SECRET, algorithms=[ALG])
+
+
+def test_bad_claim_types_are_rejected():
+    for case in ("sub not a string", "jti not a string", "aud", "at_hash"):
+        assert not fast_path_accepts(TOKENS[case]()), case
+
+
+def test_issued_tokens_verify():
+    token = auth_service._create_token({"sub": "user-1", "role": "admin"})
+    assert auth_service.verify_token(token)["role"] == "admin"
+
+
+# ── verify_token_cached ──────────────────────────────────────
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    """A fresh verified-token cache on a fake clock, and a count of the
+    tokens that reached `auth_service.verify_token`."""
+    clock = FakeClock()
+    monkeypatch.setattr(auth, "verified_tokens", TTLCache(max_entries=16, ttl_seconds=0, clock=clock))
+    verified = []
+    real = auth_service.verify_token
+    monkeypatch.setattr(auth_service, "verify_token", lambda token: verified.append(token) or real(token))
+    return clock, verified
+
+
+def test_cached_token_is_verified_once(token_cache):
+    _, verified = token_cache
+    token = signed(claims())
+    assert auth.verify_token_cached(token) == auth.verify_token_cached(token) == jwt.decode(token, SECRET, algorithms=[ALG])
+    assert verified == [token]
+
+
+def test_cached_token_expires_with_exp(token_cache):
+    clock, verified = token_cache
+    token = signed(claims(exp=int(time.time()) + 30))
+    auth.verify_token_cached(token)
+    clock.now += 29
+    auth.verify_token_cached(token)
+    assert len(verified) == 1
+
+    clock.now += 2  # past exp: the entry is gone, so the verifier sees the token again
+    auth.verify_token_cached(token)
+    assert len(verified) == 2
+
+
+def test_invalid_and_expired_tokens_are_not_cached(token_cache):
+    _, verified = token_cache
+    for case in ("expired", "tampered payload"):
+        token = TOKENS[case]()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                auth.verify_token_cached(token)
+    assert len(verified) == 4
+    assert auth.verified_tokens.stats()["size"] == 0
+
+
+def test_token_without_exp_is_not_cached(token_cache):
+    _, verified = token_cache
+    token = TOKENS["valid without exp"]()
+    auth.verify_token_cached(token)
+    auth.verify_token_cached(token)
+    assert len(verified) == 2
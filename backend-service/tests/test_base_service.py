@@ -0,0 +1,136 @@
+import uuid
+
+import pytest
+
+from app.config.database import db_client
+from app.services import base_service
+from app.services.base_service import ItemForbiddenError, ItemNotFoundError
+from app.services.project_service import project_service
+
+
+@pytest.fixture
+def project():
+    return project_service.create({"project_id": str(uuid.uuid4()), "title": "Pipeline", "owner_id": "alice"})
+
+
+def test_update_returns_new_item(project):
+    updated = project_service.update(project["project_id"], {"title": "Renamed"}, expected={"owner_id": "alice"})
+    assert updated["title"] == "Renamed"
+    assert project_service.get_by_id(project["project_id"])["title"] == "Renamed"
+
+
+def test_update_return_values_all_old(project):
+    old = project_service.update(project["project_id"], {"title": "Renamed"}, return_values="ALL_OLD")
+    assert old["title"] == "Pipeline"
+
+
+def test_update_missing_item_raises_not_found():
+    with pytest.raises(ItemNotFoundError):
+        project_service.update(str(uuid.uuid4()), {"title": "x"})
+
+
+def test_update_does_not_create_missing_item():
+    item_id = str(uuid.uuid4())
+    with pytest.raises(ItemNotFoundError):
+        project_service.update(item_id, {"title": "x"})
+    assert project_service.get_by_id(item_id) is None
+
+
+def test_update_wrong_owner_raises_forbidden_and_keeps_item(project):
+    with pytest.raises(ItemForbiddenError):
+        project_service.update(project["project_id"], {"title": "Hijacked"}, expected={"owner_id": "mallory"})
+    assert project_service.get_by_id(project["project_id"])["title"] == "Pipeline"
+
+
+def test_empty_update_checks_existence_and_owner(project):
+    assert project_service.update(project["project_id"], {}, expected={"owner_id": "alice"}) == project
+    with pytest.raises(ItemForbiddenError):
+        project_service.update(project["project_id"], {}, expected={"owner_id": "mallory"})
+    with pytest.raises(ItemNotFoundError):
+        project_service.update(str(uuid.uuid4()), {})
+
+
+def test_pop_returns_deleted_item(project):
+    assert project_service.pop(project["project_id"], expected={"owner_id": "alice"}) == project
+    assert project_service.get_by_id(project["project_id"]) is None
+
+
+def test_pop_twice_raises_not_found(project):
+    project_service.pop(project["project_id"])
+    with pytest.raises(ItemNotFoundError):
+        project_service.pop(project["project_id"])
+
+
+def test_delete_wrong_owner_raises_forbidden_and_keeps_item(project):
+    with pytest.raises(ItemForbiddenError):
+        project_service.delete(project["project_id"], expected={"owner_id": "mallory"})
+    assert project_service.get_by_id(project["project_id"]) == project
+
+
+def new_projects(n):
+    return project_service.create_many([{"project_id": str(uuid.uuid4()), "title": f"P{i}"} for i in range(n)])
+
+
+def test_get_many_keeps_input_order_and_marks_missing():
+    a, b, c = new_projects(3)
+    missing = str(uuid.uuid4())
+    ids = [c["project_id"], missing, a["project_id"], b["project_id"], a["project_id"]]
+    assert project_service.get_many(ids) == [c, None, a, b, a]
+
+
+def test_get_many_projection_keeps_key_field():
+    (item,) = new_projects(1)
+    assert project_service.get_many([item["project_id"]], projection=["title"]) == [
+        {"project_id": item["project_id"], "title": item["title"]}
+    ]
+
+
+def test_get_many_reads_only_uncached_ids(monkeypatch):
+    cached, uncached = new_projects(2)
+    project_service.get_by_id(cached["project_id"])
+    requested = []
+    real = base_service.batch_get
+    monkeypatch.setattr(base_service, "batch_get", lambda table, keys, **kw: requested.extend(keys) or real(table, keys, **kw))
+    assert project_service.get_many([cached["project_id"], uncached["project_id"]]) == [cached, uncached]
+    assert requested == [{"project_id": uncached["project_id"]}]
+
+
+class Throttled:
+    """batch_get_item that reads only the first `processed` keys of a
+    request, leaving the rest unprocessed, on the first `throttled_calls` calls."""
+
+    def __init__(self, throttled_calls, processed=1):
+        self.real = db_client.resource.batch_get_item
+        self.throttled_calls = throttled_calls
+        self.processed = processed
+        self.requests = []
+
+    def __call__(self, RequestItems):
+        self.requests.append(RequestItems)
+        if len(self.requests) > self.throttled_calls:
+            return self.real(RequestItems=RequestItems)
+        (table, spec), = RequestItems.items()
+        done, rest = spec["Keys"][:self.processed], spec["Keys"][self.processed:]
+        response = self.real(RequestItems={table: {**spec, "Keys": done}}) if done else {"Responses": {table: []}}
+        response["UnprocessedKeys"] = {table: {**spec, "Keys": rest}} if rest else {}
+        return response
+
+
+def test_batch_get_retries_unprocessed_keys(monkeypatch):
+    items = new_projects(3)
+    throttled = Throttled(throttled_calls=2)
+    delays = []
+    monkeypatch.setattr(db_client.resource, "batch_get_item", throttled)
+    monkeypatch.setattr(base_service, "backoff", delays.append)
+    ids = [item["project_id"] for item in items]
+    assert project_service.get_many(ids) == items
+    assert [len(r["Projects"]["Keys"]) for r in throttled.requests] == [3, 2, 1]
+    assert delays == [0, 1]
+
+
+def test_batch_get_gives_up_after_max_attempts(monkeypatch):
+    items = new_projects(2)
+    monkeypatch.setattr(db_client.resource, "batch_get_item", Throttled(throttled_calls=base_service.MAX_BATCH_ATTEMPTS, processed=0))
+    monkeypatch.setattr(base_service, "backoff", lambda attempt: None)
+    with pytest.raises(RuntimeError):
+        project_service.get_many([item["project_id"] for item in items])
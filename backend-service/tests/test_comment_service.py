@@ -0,0 +1,75 @@
+import uuid
+
+import pytest
+
+from app.config.database import db_client
+from app.models.comment import CommentCreate
+from app.services.base_service import ItemForbiddenError, ItemNotFoundError
+from app.services.comment_service import comment_service
+
+
+@pytest.fixture
+def post_id():
+    post_id = str(uuid.uuid4())
+    db_client.get_table("BlogPosts").put_item(Item={"post_id": post_id, "title": "Hello", "status": "published"})
+    return post_id
+
+
+def stored_post(post_id):
+    return db_client.get_table("BlogPosts").get_item(Key={"post_id": post_id})["Item"]
+
+
+def comment(post_id, text, user_id="u1"):
+    return comment_service.create_comment(post_id, CommentCreate(content=text), user_id, f"{user_id}@example.com", user_id)
+
+
+def test_create_updates_count_and_last_comment(post_id):
+    comment(post_id, "first")
+    second = comment(post_id, "second")
+    post = stored_post(post_id)
+    assert post["comment_count"] == 2
+    assert post["last_comment"]["comment_id"] == second["comment_id"]
+    assert post["last_comment_at"] == second["created_at"]
+
+
+def test_create_on_missing_post_writes_nothing():
+    post_id = str(uuid.uuid4())
+    with pytest.raises(ItemNotFoundError):
+        comment(post_id, "orphan")
+    assert comment_service.get_by_post(post_id)[0] == []
+
+
+def test_delete_decrements_and_replaces_preview(post_id):
+    first = comment(post_id, "first")
+    second = comment(post_id, "second")
+    comment_service.delete_comment(second["comment_id"], "u1", False, post_id)
+    post = stored_post(post_id)
+    assert post["comment_count"] == 1
+    assert post["last_comment"]["comment_id"] == first["comment_id"]
+
+    comment_service.delete_comment(first["comment_id"], "u1", False, post_id)
+    post = stored_post(post_id)
+    assert post["comment_count"] == 0
+    assert "last_comment" not in post
+
+
+def test_delete_by_other_user_is_forbidden(post_id):
+    own = comment(post_id, "mine", user_id="u1")
+    with pytest.raises(ItemForbiddenError):
+        comment_service.delete_comment(own["comment_id"], "u2", False, post_id)
+    assert stored_post(post_id)["comment_count"] == 1
+    assert comment_service.delete_comment(own["comment_id"], "admin", True, post_id)
+
+
+def test_delete_under_wrong_post_is_not_found(post_id):
+    own = comment(post_id, "mine")
+    with pytest.raises(ItemNotFoundError):
+        comment_service.delete_comment(own["comment_id"], "u1", False, str(uuid.uuid4()))
+    assert stored_post(post_id)["comment_count"] == 1
+
+
+def test_delete_orphaned_comment_when_post_is_gone(post_id):
+    own = comment(post_id, "mine")
+    db_client.get_table("BlogPosts").delete_item(Key={"post_id": post_id})
+    assert comment_service.delete_comment(own["comment_id"], "u1", False, post_id)
+    assert comment_service.get_by_id(own["comment_id"]) is None
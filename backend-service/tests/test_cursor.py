@@ -0,0 +1,44 @@
+import base64
+
+import pytest
+
+from app.utils.cursor import InvalidCursorError, SignedCursor
+
+KEY = {"status": "published", "created_at": "2024-03-01T10:00:00", "post_id": "post-1"}
+
+
+def published():
+    return SignedCursor("published", ["created_at", "post_id"], fixed={"status": "published"})
+
+
+def test_round_trip_restores_fixed_fields():
+    cursor = published()
+    assert cursor.decode(cursor.encode(KEY)) == KEY
+
+
+def test_tampered_payload_is_rejected():
+    cursor = published()
+    _, signature = cursor.encode(KEY).split(".")
+    forged = base64.urlsafe_b64encode("2099-01-01T00:00:00\x1fpost-1".encode()).rstrip(b"=").decode()
+    with pytest.raises(InvalidCursorError):
+        cursor.decode(f"{forged}.{signature}")
+
+
+def test_tampered_signature_is_rejected():
+    cursor = published()
+    payload, signature = cursor.encode(KEY).split(".")
+    flipped = ("B" if signature[0] == "A" else "A") + signature[1:]
+    with pytest.raises(InvalidCursorError):
+        cursor.decode(f"{payload}.{flipped}")
+
+
+def test_cursor_from_another_listing_is_rejected():
+    drafts = SignedCursor("drafts", ["created_at", "post_id"], fixed={"status": "draft"})
+    with pytest.raises(InvalidCursorError):
+        published().decode(drafts.encode(KEY))
+
+
+@pytest.mark.parametrize("garbage", ["", "no-dot", "a.b.c", "!!!.???"])
+def test_malformed_cursor_is_rejected(garbage):
+    with pytest.raises(InvalidCursorError):
+        published().decode(garbage)
@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+import uuid
+
+import pytest
+
+from app.middleware.compression import CompressionMiddleware
+from app.services.auth_service import auth_service
+from app.services.project_service import project_service
+from app.utils.cache import TTLCache
+from benchmarks.common import asgi_request
+from main import app
+
+
+def get(path, **headers):
+    return asyncio.run(asgi_request(app, "GET", path, headers=headers))
+
+
+def new_project(title="Pipeline"):
+    return project_service.create({"project_id": str(uuid.uuid4()), "title": title, "tech_stack": "", "date_range": "", "bullets": ["Built it"], "order": 99})
+
+
+# ── ETag / If-None-Match, through the app ───────────────────────
+def test_matching_etag_gets_304_without_reads(monkeypatch):
+    new_project()
+    first = get("/api/projects")
+    assert first.status == 200 and first.headers["etag"].startswith('"')
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("a 304 must not read the table")
+
+    monkeypatch.setattr(project_service, "get_ordered", no_reads)
+    for tag in (first.headers["etag"], "W/" + first.headers["etag"], f'"other", {first.headers["etag"]}', "*"):
+        resp = get("/api/projects", **{"If-None-Match": tag})
+        assert resp.status == 304 and resp.body == b"", tag
+        assert resp.headers["etag"] == first.headers["etag"]
+        assert resp.headers["cache-control"] == first.headers["cache-control"]
+
+
+def test_write_changes_etag():
+    first = get("/api/projects")
+    project = new_project("Fresh")
+    resp = get("/api/projects", **{"If-None-Match": first.headers["etag"]})
+    assert resp.status == 200
+    assert resp.headers["etag"] != first.headers["etag"]
+    assert project["project_id"] in {p["project_id"] for p in resp.json()["projects"]}
+
+
+def test_etag_depends_on_url():
+    # Same tables, different bodies.
+    etags = {get(path).headers["etag"] for path in ("/api/blog", "/api/blog/tags")}
+    etags.add(asyncio.run(asgi_request(app, "GET", "/api/blog", query="limit=1")).headers["etag"])
+    assert len(etags) == 3
+
+
+def test_unrelated_write_keeps_etag():
+    etag = get("/api/experiences").headers["etag"]
+    new_project()
+    assert get("/api/experiences", **{"If-None-Match": etag}).status == 304
+
+
+def test_home_etag_varies_by_user():
+    anonymous = get("/api/home")
+    token = auth_service._create_token({"sub": str(uuid.uuid4()), "role": "user", "created_at": "2024-01-01T00:00:00"})
+    signed_in = get("/api/home", Authorization=f"Bearer {token}")
+    assert anonymous.headers["etag"] != signed_in.headers["etag"]
+    assert anonymous.headers["cache-control"].startswith("public")
+    assert signed_in.headers["cache-control"].startswith("private")
+    assert "Authorization" in signed_in.headers["vary"]
+    assert get("/api/home", Authorization=f"Bearer {token}", **{"If-None-Match": anonymous.headers["etag"]}).status == 200
+
+
+# ── Compression cache keyed by (ETag, encoding) ─────────────────
+BODY = b'{"items": [' + b", ".join(b'"entry %d"' % i for i in range(400)) + b"]}"
+
+
+def responder(etag=None, content_type="application/json"):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type.encode())]
+        if etag:
+            headers.append((b"etag", etag.encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": BODY})
+
+    return app
+
+
+@pytest.fixture
+def compressions(monkeypatch):
+    calls = []
+    real = CompressionMiddleware._compress
+    monkeypatch.setattr(CompressionMiddleware, "_compress", staticmethod(lambda body, encoding: calls.append(encoding) or real(body, encoding)))
+    return calls
+
+
+def fetch(middleware, method="GET", encoding="gzip"):
+    return asyncio.run(asgi_request(middleware, method, "/x", headers={"Accept-Encoding": encoding}))
+
+
+def test_compressed_once_per_etag_and_encoding(compressions):
+    cache = TTLCache(max_entries=8, ttl_seconds=60)
+    first, second = fetch(CompressionMiddleware(responder('"v1"'), cache=cache)), fetch(CompressionMiddleware(responder('"v1"'), cache=cache))
+    assert first.body == second.body and gzip.decompress(first.body) == BODY
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"] == 'W/"v1"'
+    assert "Accept-Encoding" in first.headers["vary"]
+    assert compressions == ["gzip"]
+    assert cache.stats()["hits"] == 1
+
+    fetch(CompressionMiddleware(responder('"v2"'), cache=cache))
+    assert compressions == ["gzip", "gzip"]  # a new ETag is a new body
+
+
+def test_encodings_are_cached_separately():
+    calls = []
+    middleware = CompressionMiddleware(responder('"v1"'), cache=TTLCache(max_entries=8, ttl_seconds=60))
+    middleware.encodings = ("br", "gzip")  # brotli stood in for, whether or not it is installed
+    middleware._compress = lambda body, encoding: calls.append(encoding) or (b"br" if encoding == "br" else gzip.compress(body))
+    assert fetch(middleware, encoding="br").body == b"br"
+    assert gzip.decompress(fetch(middleware, encoding="gzip").body) == BODY
+    assert fetch(middleware, encoding="br").body == b"br"
+    assert calls == ["br", "gzip"]
+
+
+def test_uncacheable_responses_are_compressed_each_time(compressions):
+    cache = TTLCache(max_entries=8, ttl_seconds=60)
+    for app, method in ((responder(), "GET"), (responder('W/"v1"'), "GET"), (responder('"v1"'), "POST")):
+        for _ in range(2):
+            fetch(CompressionMiddleware(app, cache=cache), method=method)
+    assert len(compressions) == 6
+    assert cache.stats()["size"] == 0
+
+
+def test_identity_and_small_bodies_pass_through(compressions):
+    resp = fetch(CompressionMiddleware(responder('"v1"')), encoding="identity")
+    assert resp.body == BODY and "content-encoding" not in resp.headers
+    assert resp.headers["etag"] == '"v1"'
+    assert fetch(CompressionMiddleware(responder('"v1"', content_type="image/png"))).body == BODY
+    assert compressions == []
@@ -0,0 +1,194 @@
+import asyncio
+import uuid
+
+import pytest
+
+from app.utils.rate_limit import DynamoDBRateLimitBackend, MemoryRateLimitBackend, Rule, build_backend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_burst_then_retry_after_then_refill(clock):
+    rule = Rule("login", per_minute=6, burst=3)  # one token every 10 s
+    backend = MemoryRateLimitBackend(clock=clock)
+    assert [backend.take(rule, "ip") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert backend.take(rule, "ip") == pytest.approx(10.0)
+
+    clock.now += 4
+    assert backend.take(rule, "ip") == pytest.approx(6.0)
+    clock.now += 6
+    assert backend.take(rule, "ip") == 0.0
+    assert backend.take(rule, "ip") == pytest.approx(10.0)
+
+
+def test_rejections_do_not_consume_tokens(clock):
+    rule = Rule("login", per_minute=60, burst=1)
+    backend = MemoryRateLimitBackend(clock=clock)
+    backend.take(rule, "ip")
+    for _ in range(5):
+        assert backend.take(rule, "ip") == pytest.approx(1.0)
+    clock.now += 1
+    assert backend.take(rule, "ip") == 0.0
+
+
+def test_idle_bucket_refills_only_to_burst(clock):
+    rule = Rule("login", per_minute=60, burst=2)
+    backend = MemoryRateLimitBackend(clock=clock)
+    backend.take(rule, "ip")
+    clock.now += 3600
+    assert [backend.take(rule, "ip") for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+
+def test_keys_and_rules_have_separate_buckets(clock):
+    login, search = Rule("login", per_minute=60, burst=1), Rule("search", per_minute=60, burst=1)
+    backend = MemoryRateLimitBackend(clock=clock)
+
+    async def acquire_all():
+        return [
+            await backend.acquire(login, "a"),
+            await backend.acquire(login, "b"),
+            await backend.acquire(search, "a"),
+            await backend.acquire(login, "a"),
+        ]
+
+    assert asyncio.run(acquire_all()) == [0.0, 0.0, 0.0, pytest.approx(1.0)]
+
+
+def test_sweep_forgets_full_buckets(clock):
+    rule = Rule("login", per_minute=60, burst=5)
+    backend = MemoryRateLimitBackend(sweep_seconds=60, clock=clock)
+    backend.take(rule, "a")
+    backend.take(rule, "b")
+    assert len(backend) == 2
+    clock.now += 61
+    backend.take(rule, "c")
+    assert len(backend) == 1
+
+
+def test_max_keys_drops_oldest(clock):
+    rule = Rule("login", per_minute=60, burst=1)
+    backend = MemoryRateLimitBackend(max_keys=2, clock=clock)
+    for key in "abc":
+        backend.take(rule, key)
+    assert len(backend) == 2
+    assert backend.take(rule, "a") == 0.0  # forgotten, so it starts full again
+
+
+def test_max_keys_keeps_recently_used_keys(clock):
+    rule = Rule("login", per_minute=60, burst=3)
+    backend = MemoryRateLimitBackend(max_keys=2, clock=clock)
+    backend.take(rule, "busy")
+    backend.take(rule, "idle")
+    backend.take(rule, "busy")
+    backend.take(rule, "new")  # evicts "idle", the least recently used
+    assert backend.take(rule, "busy") == 0.0
+    assert backend.take(rule, "busy") == pytest.approx(1.0)  # burst spent, not reset
+
+
+def test_rejected_takes_count_as_use(clock):
+    rule = Rule("login", per_minute=60, burst=1)
+    backend = MemoryRateLimitBackend(max_keys=2, clock=clock)
+    backend.take(rule, "attacker")
+    backend.take(rule, "other")
+    assert backend.take(rule, "attacker") > 0  # rejected, but still recent
+    backend.take(rule, "new")
+    assert backend.take(rule, "attacker") > 0
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        build_backend("redis")
+
+
+# ── DynamoDB backend, against the memory stand-in ──────────────
+def bucket():
+    return f"login:{uuid.uuid4()}"
+
+
+def stored_tat(name):
+    item = DynamoDBRateLimitBackend().table.get_item(Key={"bucket": name}).get("Item")
+    return float(item["tat"]) if item else None
+
+
+def test_dynamodb_burst_then_retry_after_then_refill(clock):
+    rule = Rule("login", per_minute=6, burst=2)  # one token every 10 s
+    backend, name = DynamoDBRateLimitBackend(clock=clock), bucket()
+    assert [backend.take(rule, name) for _ in range(2)] == [0.0, 0.0]
+    assert backend.take(rule, name) == pytest.approx(10.0)
+    assert stored_tat(name) == pytest.approx(clock.now + 20)  # the rejection wrote nothing
+
+    clock.now += 10
+    assert backend.take(rule, name) == 0.0
+    assert backend.take(rule, name) == pytest.approx(10.0)
+
+
+def test_dynamodb_workers_share_buckets(clock):
+    rule = Rule("login", per_minute=60, burst=2)
+    first, second, name = DynamoDBRateLimitBackend(clock=clock), DynamoDBRateLimitBackend(clock=clock), bucket()
+    assert first.take(rule, name) == 0.0
+    # `second` assumes a full bucket; its write fails the condition, and it
+    # retries from the TAT the failed write returned.
+    assert second.take(rule, name) == 0.0
+    assert stored_tat(name) == pytest.approx(clock.now + 2)
+    assert first.take(rule, name) == pytest.approx(1.0)
+
+
+def test_dynamodb_idle_bucket_is_overwritten(clock):
+    rule = Rule("login", per_minute=60, burst=1)
+    backend, name = DynamoDBRateLimitBackend(clock=clock), bucket()
+    backend.take(rule, name)
+    clock.now += 3600
+    assert backend.take(rule, name) == 0.0
+    assert stored_tat(name) == pytest.approx(clock.now + 1)
+
+
+class ContendedTable:
+    """Every conditional write loses to another worker that just moved the TAT."""
+
+    def __init__(self, clock, code="ConditionalCheckFailedException"):
+        self.clock, self.code, self.calls = clock, code, 0
+
+    def update_item(self, **kwargs):
+        from botocore.exceptions import ClientError
+
+        self.calls += 1
+        item = {"tat": {"N": repr(self.clock())}}
+        raise ClientError({"Error": {"Code": self.code, "Message": ""}, "Item": item}, "UpdateItem")
+
+
+def test_dynamodb_lost_races_report_busy(clock, monkeypatch):
+    rule = Rule("login", per_minute=60, burst=5)
+    table = ContendedTable(clock)
+    monkeypatch.setattr(DynamoDBRateLimitBackend, "table", table)
+    assert DynamoDBRateLimitBackend(clock=clock).take(rule, bucket()) == rule.interval
+    assert table.calls == DynamoDBRateLimitBackend.MAX_ATTEMPTS
+
+
+def test_dynamodb_other_errors_propagate(clock, monkeypatch):
+    from botocore.exceptions import ClientError
+
+    monkeypatch.setattr(DynamoDBRateLimitBackend, "table", ContendedTable(clock, code="ProvisionedThroughputExceededException"))
+    with pytest.raises(ClientError):
+        DynamoDBRateLimitBackend(clock=clock).take(Rule("login", per_minute=60, burst=5), bucket())
+
+
+def test_dynamodb_rejections_are_remembered_locally(clock, monkeypatch):
+    rule = Rule("login", per_minute=60, burst=1)
+    backend, key = DynamoDBRateLimitBackend(clock=clock), str(uuid.uuid4())
+    assert asyncio.run(backend.acquire(rule, key)) == 0.0
+    assert asyncio.run(backend.acquire(rule, key)) == pytest.approx(1.0)
+
+    monkeypatch.setattr(DynamoDBRateLimitBackend, "table", ContendedTable(clock))
+    clock.now += 0.5
+    assert asyncio.run(backend.acquire(rule, key)) == pytest.approx(0.5)  # no DynamoDB call
@@ -0,0 +1,58 @@
+from app.utils.search_index import SearchIndex, tokenize
+
+
+def doc(post_id, title="", summary="", content="", tags=()):
+    fields = {"title": title, "summary": summary, "content": content, "tags": list(tags)}
+    return post_id, fields, {"post_id": post_id, "title": title}
+
+
+def ranked(index, query):
+    return [post["post_id"] for _, post in index.search(query)]
+
+
+def test_more_occurrences_rank_higher():
+    index = SearchIndex.build([
+        doc("once", content="kafka is used here along with other tools and notes"),
+        doc("often", content="kafka kafka kafka streaming with kafka"),
+        doc("never", content="postgres replication notes"),
+    ])
+    assert ranked(index, "kafka") == ["often", "once"]
+
+
+def test_title_outweighs_body():
+    index = SearchIndex.build([
+        doc("body", title="Weekly notes", content="a short word on terraform"),
+        doc("title", title="Terraform", content="a short word on weekly notes"),
+    ])
+    assert ranked(index, "terraform") == ["title", "body"]
+
+
+def test_rare_terms_weigh_more_than_common_ones():
+    index = SearchIndex.build(
+        [doc(f"common-{i}", content="python tips") for i in range(5)]
+        + [doc("rare", content="python rust")]
+    )
+    assert ranked(index, "python rust")[0] == "rare"
+
+
+def test_plurals_and_stop_words_are_folded():
+    assert tokenize("The Pipelines of Queries") == ["pipeline", "query"]
+    index = SearchIndex.build([doc("p", title="Building a data pipeline")])
+    assert ranked(index, "pipelines") == ["p"]
+    assert ranked(index, "the") == []
+
+
+def test_reindex_and_remove():
+    index = SearchIndex.build([doc("p", title="Kafka"), doc("q", title="Redis")])
+    index.add(*doc("p", title="Postgres"))
+    assert ranked(index, "kafka") == []
+    assert ranked(index, "postgres") == ["p"]
+    assert index.remove("q") and not index.remove("q")
+    assert "q" not in index and len(index) == 1
+
+
+def test_limit_and_round_trip():
+    index = SearchIndex.build([doc(f"p{i}", content="cache " * (i + 1)) for i in range(20)])
+    assert len(index.search("cache", limit=5)) == 5
+    loaded = SearchIndex.loads(index.dumps())
+    assert ranked(loaded, "cache") == ranked(index, "cache")
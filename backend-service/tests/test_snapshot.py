@@ -0,0 +1,109 @@
+import asyncio
+import gzip
+import os
+import time
+
+import pytest
+
+from app.middleware.snapshot import SnapshotMiddleware
+from app.utils.snapshot import SnapshotStore, write_snapshot
+from benchmarks.common import asgi_request
+
+HEADERS = {"content-type": "application/json", "etag": '"v1"'}
+ENTRIES = {
+    "/api/projects": {"route": "/api/projects", "groups": ["projects"], "anonymous": False, "headers": HEADERS, "body": b'{"projects":[]}'},
+    "/api/blog": {"route": "/api/blog", "groups": ["blog"], "anonymous": False, "headers": HEADERS, "body": b'{"posts":[]}'},
+}
+
+
+def export(directory):
+    return write_snapshot(str(directory), ENTRIES, started_at=time.time())
+
+
+def store(directory, **kwargs):
+    return SnapshotStore(str(directory), **{"max_age_seconds": 3600, "check_seconds": 0, **kwargs})
+
+
+def served(store, path):
+    return store.lookup(path, "") is not None
+
+
+@pytest.fixture
+def directory(tmp_path):
+    export(tmp_path)
+    return tmp_path
+
+
+def test_fresh_snapshot_is_served(directory):
+    assert served(store(directory), "/api/projects")
+    assert not served(store(directory), "/api/experiences")  # not exported
+
+
+def test_mark_stale_affects_only_its_group(directory):
+    worker = store(directory)
+    worker.mark_stale("projects")
+    assert not served(worker, "/api/projects")
+    assert served(worker, "/api/blog")
+    assert worker.status()["stale_groups"] == ["projects"]
+
+
+def test_stale_marker_reaches_other_workers(directory):
+    writer, reader = store(directory), store(directory)
+    assert served(reader, "/api/projects")
+    writer.mark_stale("projects")
+    assert os.path.exists(directory / "stale-projects")
+    assert not served(reader, "/api/projects")
+    assert served(reader, "/api/blog")
+
+
+def test_marker_is_read_once_per_check_interval(directory):
+    writer, reader = store(directory), store(directory, check_seconds=3600)
+    assert served(reader, "/api/projects")
+    writer.mark_stale("projects")
+    assert served(reader, "/api/projects")  # not re-checked yet
+    reader.reload()
+    assert not served(reader, "/api/projects")
+
+
+def test_next_export_is_fresh_again(directory):
+    worker = store(directory)
+    worker.mark_stale("projects")
+    time.sleep(0.01)
+    export(directory)
+    worker.reload()
+    assert served(worker, "/api/projects")
+
+
+def test_old_snapshot_is_not_served(directory):
+    assert not served(store(directory, max_age_seconds=-1), "/api/projects")
+
+
+def test_successful_write_marks_group_stale(directory):
+    """A write through SnapshotMiddleware invalidates its group for every worker."""
+    statuses = iter([500, 201])
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": next(statuses), "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    writer, reader = store(directory), store(directory)
+    middleware = SnapshotMiddleware(app, store=writer)
+
+    hit = asyncio.run(asgi_request(middleware, "GET", "/api/projects"))
+    assert hit.body == ENTRIES["/api/projects"]["body"]
+
+    asyncio.run(asgi_request(middleware, "POST", "/api/projects", json_body={}))  # failed write
+    assert served(reader, "/api/projects")
+    asyncio.run(asgi_request(middleware, "POST", "/api/projects", json_body={}))
+    assert not served(reader, "/api/projects")
+    assert served(reader, "/api/blog")
+
+
+def test_gzip_body_is_passed_through(directory):
+    async def app(scope, receive, send):
+        raise AssertionError("served live")
+
+    middleware = SnapshotMiddleware(app, store=store(directory))
+    resp = asyncio.run(asgi_request(middleware, "GET", "/api/blog", headers={"Accept-Encoding": "gzip"}))
+    assert resp.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(resp.body) == ENTRIES["/api/blog"]["body"]
@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+
+from app.models.blog import BlogPostCreate, BlogPostUpdate
+from app.services.blog_service import blog_service
+from app.services.tag_service import COUNT_PREFIX, COUNTS_KEY, tag_service
+from app.utils.content_version import content_versions
+
+
+@pytest.fixture
+def tags():
+    """Tag names no other test uses, so counts start at zero."""
+    suffix = uuid.uuid4().hex[:8]
+    return [f"{name}-{suffix}" for name in ("a", "b", "c")]
+
+
+def create(title, tags):
+    return blog_service.create_post(BlogPostCreate(title=title, summary="s", content="c", tags=tags), "a@example.com", "A")
+
+
+def entries(tag):
+    return [(post["post_id"], post["title"]) for post in tag_service.get_posts(tag)[0]]
+
+
+def counts(tags):
+    item = tag_service.table.get_item(Key=COUNTS_KEY)["Item"]
+    return [int(item.get(COUNT_PREFIX + tag, 0)) for tag in tags]
+
+
+def test_create_adds_entries_and_counts(tags):
+    a, b, _ = tags
+    post = create("First", [a, b])
+    assert entries(a) == entries(b) == [(post["post_id"], "First")]
+    assert counts(tags) == [1, 1, 0]
+
+
+def test_entries_are_newest_first(tags):
+    a = tags[0]
+    older, newer = create("Older", [a]), create("Newer", [a])
+    assert entries(a) == [(newer["post_id"], "Newer"), (older["post_id"], "Older")]
+    assert counts([a]) == [2]
+
+
+def test_update_moves_entries_and_counts(tags):
+    a, b, c = tags
+    post = create("First", [a, b])
+    blog_service.update_post(post["post_id"], BlogPostUpdate(title="Renamed", tags=[b, c]))
+    assert entries(a) == []
+    assert entries(b) == entries(c) == [(post["post_id"], "Renamed")]  # copied fields refreshed
+    assert counts(tags) == [0, 1, 1]
+
+
+def test_unpublish_and_republish(tags):
+    a, b, _ = tags
+    post = create("First", [a, b])
+    blog_service.update_post(post["post_id"], BlogPostUpdate(is_published=False))
+    assert entries(a) == entries(b) == []
+    assert counts(tags) == [0, 0, 0]
+    assert not {a, b} & {t["tag"] for t in tag_service.get_counts()}  # zero counts are not listed
+
+    blog_service.update_post(post["post_id"], BlogPostUpdate(is_published=True))
+    assert entries(a) == [(post["post_id"], "First")]
+    assert counts(tags) == [1, 1, 0]
+
+
+def test_delete_removes_entries_and_counts(tags):
+    a = tags[0]
+    keep, gone = create("Keep", [a]), create("Gone", [a])
+    blog_service.delete(gone["post_id"])
+    assert entries(a) == [(keep["post_id"], "Keep")]
+    assert {"tag": a, "count": 1} in tag_service.get_counts()
+
+
+def test_sync_bumps_content_version(tags):
+    before = content_versions.current().get(tag_service.TABLE_NAME, 0)
+    create("First", tags[:1])
+    assert content_versions.current()[tag_service.TABLE_NAME] == before + 1
+
+
+def test_untagged_post_writes_nothing(tags):
+    before = content_versions.current().get(tag_service.TABLE_NAME, 0)
+    create("Untagged", [])
+    assert content_versions.current().get(tag_service.TABLE_NAME, 0) == before
@@ -1,4 +1,4 @@
-import React from "react";
+import React, { useEffect, useState } from "react";
 import {
   Box,
   Container,
@@ -9,6 +9,7 @@ import {
   CardContent,
   Chip,
   Stack,
+  Skeleton,
 } from "@mui/material";
 import ArrowForwardIcon from "@mui/icons-material/ArrowForward";
 import CloudIcon from "@mui/icons-material/Cloud";
@@ -19,10 +20,21 @@ import EmailIcon from "@mui/icons-material/Email";
 import CodeIcon from "@mui/icons-material/Code";
 import BuildIcon from "@mui/icons-material/Build";
 import LayersIcon from "@mui/icons-material/Layers";
-import { Link } from "react-router-dom";
+import { Link, useNavigate } from "react-router-dom";
 import { useTranslation } from "react-i18next";
+import apiClient from "../../services/api";
 import personImg from "../../images/person.png";
 
+interface BlogPost {
+  post_id: string;
+  title: string;
+  summary: string;
+  tags: string[];
+  created_at: string;
+}
+
+const LATEST_POSTS = 3;
+
 const SKILL_CATEGORIES = [
   {
     i18nKey: "languages",
@@ -45,7 +57,21 @@ const SKILL_CATEGORIES = [
 ];
 
 const HomePage: React.FC = () => {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
+  const navigate = useNavigate();
+  const [posts, setPosts] = useState<BlogPost[]>([]);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    // One request for the whole page; the section is simply left out if it fails.
+    apiClient
+      .getHome(LATEST_POSTS)
+      .then((res) => setPosts(res.data.posts))
+      .catch(() => setPosts([]))
+      .finally(() => setLoading(false));
+  }, []);
+
+  const dateLocale = i18n.language === "zh" ? "zh-CN" : "en-US";
 
   const highlights = [
     {
@@ -200,6 +226,53 @@ const HomePage: React.FC = () => {
         </Grid>
       </Container>
 
+      {/* Latest posts */}
+      {(loading || posts.length > 0) && (
+        <Box sx={{ borderTop: "1px solid rgba(255,255,255,0.06)", py: 8 }}>
+          <Container maxWidth="lg">
+            <Box sx={{ display: "flex", justifyContent: "space-between", alignItems: "center", mb: 1 }}>
+              <Typography variant="h3">{t("home.latestPosts")}</Typography>
+              <Button component={Link} to="/blog" size="small" endIcon={<ArrowForwardIcon />}>
+                {t("home.allPosts")}
+              </Button>
+            </Box>
+            <Typography variant="body1" color="text.secondary" sx={{ mb: 5, maxWidth: 560 }}>
+              {t("home.latestPostsSub")}
+            </Typography>
+
+            <Grid container spacing={3}>
+              {loading
+                ? Array.from({ length: LATEST_POSTS }).map((_, i) => (
+                    <Grid size={{ xs: 12, md: 4 }} key={i}>
+                      <Skeleton variant="rounded" height={180} sx={{ bgcolor: "rgba(255,255,255,0.04)" }} />
+                    </Grid>
+                  ))
+                : posts.map((post) => (
+                    <Grid size={{ xs: 12, md: 4 }} key={post.post_id}>
+                      <Card
+                        sx={{ height: "100%", cursor: "pointer", transition: "border-color 0.2s", "&:hover": { borderColor: "primary.dark" } }}
+                        onClick={() => navigate(`/blog/${post.post_id}`)}
+                      >
+                        <CardContent>
+                          <Typography variant="caption" color="text.secondary">
+                            {new Date(post.created_at).toLocaleDateString(dateLocale, { year: "numeric", month: "short", day: "numeric" })}
+                          </Typography>
+                          <Typography variant="h4" sx={{ mt: 0.5, mb: 1 }}>{post.title}</Typography>
+                          <Typography variant="body2" color="text.secondary" sx={{ mb: 2 }}>{post.summary}</Typography>
+                          <Stack direction="row" spacing={1} flexWrap="wrap" useFlexGap>
+                            {post.tags.map((tag) => (
+                              <Chip key={tag} label={tag} size="small" variant="outlined" sx={{ borderColor: "primary.dark", color: "primary.light" }} />
+                            ))}
+                          </Stack>
+                        </CardContent>
+                      </Card>
+                    </Grid>
+                  ))}
+            </Grid>
+          </Container>
+        </Box>
+      )}
+
       {/* Skills */}
       <Box sx={{ borderTop: "1px solid rgba(255,255,255,0.06)", py: 8 }}>
         <Container maxWidth="lg">
@@ -45,6 +45,11 @@ class ApiClient {
     return this.client.get("/api/auth/me");
   }
 
+  /* Homepage bundle: experiences, projects, latest posts, current user */
+  getHome(posts = 3) {
+    return this.client.get("/api/home", { params: { posts } });
+  }
+
   /* Experiences (public) */
   getExperiences() {
     return this.client.get("/api/experiences");